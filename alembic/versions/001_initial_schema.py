@@ -16,15 +16,62 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# performance_metrics is hash-partitioned on session_id so per-session reads
+# touch a single partition and each partition's indexes stay small
+PERFORMANCE_METRICS_PARTITIONS = 8
+
+# Native enum types for the fixed-vocabulary columns (4 bytes per value)
+game_status = postgresql.ENUM(
+    "active", "completed", "paused", "cancelled", name="game_status", create_type=False
+)
+calculation_method = postgresql.ENUM(
+    "heuristic",
+    "monte_carlo",
+    "exhaustive",
+    "hybrid",
+    name="calculation_method",
+    create_type=False,
+)
+difficulty_level = postgresql.ENUM(
+    "beginner",
+    "intermediate",
+    "advanced",
+    "expert",
+    name="difficulty_level",
+    create_type=False,
+)
+session_status = postgresql.ENUM(
+    "active",
+    "completed",
+    "paused",
+    "abandoned",
+    name="session_status",
+    create_type=False,
+)
+metric_type = postgresql.ENUM(
+    "counter", "gauge", "histogram", "summary", name="metric_type", create_type=False
+)
+ENUM_TYPES = (
+    game_status,
+    calculation_method,
+    difficulty_level,
+    session_status,
+    metric_type,
+)
+
 
 def upgrade() -> None:
+    bind = op.get_bind()
+    for enum_type in ENUM_TYPES:
+        enum_type.create(bind)
+
     # Create games table
     op.create_table(
         "games",
         sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("player_count", sa.Integer(), nullable=False),
         sa.Column("rules_variant", sa.String(length=50), nullable=False),
-        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("status", game_status, nullable=False),
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
@@ -32,16 +79,21 @@ def upgrade() -> None:
             nullable=True,
         ),
         sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("final_scores", sa.JSON(), nullable=True),
-        sa.CheckConstraint("player_count BETWEEN 2 AND 4", name="valid_player_count"),
-        sa.CheckConstraint(
-            "status IN ('active', 'completed', 'paused', 'cancelled')",
-            name="valid_status",
+        sa.Column(
+            "final_scores", postgresql.JSONB(astext_type=sa.Text()), nullable=True
         ),
+        sa.CheckConstraint("player_count BETWEEN 2 AND 4", name="valid_player_count"),
         sa.PrimaryKeyConstraint("id", name="pk_games"),
     )
     op.create_index("idx_games_completed_at", "games", ["completed_at"], unique=False)
-    op.create_index("idx_games_created_at", "games", ["created_at"], unique=False)
+    op.create_index(
+        "idx_games_created_at",
+        "games",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
     op.create_index("idx_games_status", "games", ["status"], unique=False)
 
     # Create positions table
@@ -51,9 +103,13 @@ def upgrade() -> None:
         sa.Column("game_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("round_number", sa.Integer(), nullable=False),
         sa.Column("current_player", sa.Integer(), nullable=False),
-        sa.Column("players_hands", sa.JSON(), nullable=False),
-        sa.Column("remaining_cards", sa.JSON(), nullable=False),
-        sa.Column("position_hash", sa.String(length=32), nullable=False),
+        sa.Column(
+            "players_hands", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column(
+            "remaining_cards", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("position_hash", sa.LargeBinary(length=16), nullable=False),
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
@@ -62,6 +118,9 @@ def upgrade() -> None:
         ),
         sa.CheckConstraint("current_player >= 0", name="valid_current_player"),
         sa.CheckConstraint("round_number > 0", name="valid_round_number"),
+        sa.CheckConstraint(
+            "octet_length(position_hash) = 16", name="valid_position_hash"
+        ),
         sa.ForeignKeyConstraint(
             ["game_id"],
             ["games.id"],
@@ -71,37 +130,61 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id", name="pk_positions"),
     )
     op.create_index(
-        "idx_positions_created_at", "positions", ["created_at"], unique=False
+        "idx_positions_created_at",
+        "positions",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
     )
-    op.create_index("idx_positions_game_id", "positions", ["game_id"], unique=False)
     op.create_index(
         "idx_positions_game_round_player",
         "positions",
         ["game_id", "round_number", "current_player"],
         unique=True,
     )
-    op.create_index("idx_positions_hash", "positions", ["position_hash"], unique=False)
+    op.create_index(
+        "idx_positions_hash",
+        "positions",
+        ["position_hash"],
+        unique=False,
+        postgresql_using="hash",
+    )
+    op.create_index(
+        "idx_positions_hands_gin",
+        "positions",
+        ["players_hands"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"players_hands": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "idx_positions_remaining_gin",
+        "positions",
+        ["remaining_cards"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"remaining_cards": "jsonb_path_ops"},
+    )
 
     # Create analysis_results table
     op.create_table(
         "analysis_results",
         sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("position_id", postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column("optimal_strategy", sa.JSON(), nullable=False),
-        sa.Column("expected_value", sa.Numeric(precision=10, scale=6), nullable=False),
-        sa.Column("calculation_method", sa.String(length=20), nullable=False),
+        sa.Column(
+            "optimal_strategy", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("expected_value", sa.Float(precision=53), nullable=False),
+        sa.Column("calculation_method", calculation_method, nullable=False),
         sa.Column("calculation_time_ms", sa.Integer(), nullable=False),
-        sa.Column("confidence_level", sa.Numeric(precision=4, scale=3), nullable=True),
+        sa.Column("confidence_level", sa.REAL(), nullable=True),
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=True,
         ),
-        sa.CheckConstraint(
-            "calculation_method IN ('heuristic', 'monte_carlo', 'exhaustive', 'hybrid')",
-            name="valid_calculation_method",
-        ),
         sa.CheckConstraint("calculation_time_ms >= 0", name="valid_calculation_time"),
         sa.CheckConstraint(
             "confidence_level BETWEEN 0 AND 1", name="valid_confidence_level"
@@ -115,13 +198,91 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id", name="pk_analysis_results"),
     )
     op.create_index(
-        "idx_analysis_created_at", "analysis_results", ["created_at"], unique=False
+        "idx_analysis_created_at",
+        "analysis_results",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
     )
     op.create_index(
         "idx_analysis_method", "analysis_results", ["calculation_method"], unique=False
     )
+    # Covering index for the cache-hit lookup by position. optimal_strategy is
+    # left out: b-tree entries are capped at ~2.7 KB and strategies can exceed it
     op.create_index(
-        "idx_analysis_position_id", "analysis_results", ["position_id"], unique=False
+        "idx_analysis_position_covering",
+        "analysis_results",
+        ["position_id"],
+        unique=False,
+        postgresql_include=["expected_value", "calculation_method"],
+        postgresql_with={"fillfactor": 90},
+    )
+
+    # Create position_analysis table: denormalized read model for the solver's
+    # "position hash -> analysis" lookup, kept in sync from analysis_results
+    op.create_table(
+        "position_analysis",
+        sa.Column("position_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("game_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("position_hash", sa.LargeBinary(length=16), nullable=False),
+        sa.Column(
+            "optimal_strategy", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column("expected_value", sa.Float(precision=53), nullable=False),
+        sa.Column("calculation_method", calculation_method, nullable=False),
+        sa.Column("confidence_level", sa.REAL(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["position_id"],
+            ["positions.id"],
+            name="fk_position_analysis_position_id_positions",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("position_id", name="pk_position_analysis"),
+    )
+    op.create_index(
+        "idx_position_analysis_hash",
+        "position_analysis",
+        ["position_hash"],
+        unique=False,
+        postgresql_using="hash",
+    )
+    op.execute(
+        """
+        CREATE FUNCTION sync_position_analysis() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO position_analysis (
+                position_id, game_id, position_hash, optimal_strategy,
+                expected_value, calculation_method, confidence_level, updated_at
+            )
+            SELECT p.id, p.game_id, p.position_hash, NEW.optimal_strategy,
+                   NEW.expected_value, NEW.calculation_method,
+                   NEW.confidence_level, now()
+            FROM positions p
+            WHERE p.id = NEW.position_id
+            ON CONFLICT (position_id) DO UPDATE SET
+                optimal_strategy = EXCLUDED.optimal_strategy,
+                expected_value = EXCLUDED.expected_value,
+                calculation_method = EXCLUDED.calculation_method,
+                confidence_level = EXCLUDED.confidence_level,
+                updated_at = EXCLUDED.updated_at;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_analysis_results_sync_position_analysis
+        AFTER INSERT OR UPDATE ON analysis_results
+        FOR EACH ROW EXECUTE FUNCTION sync_position_analysis()
+        """
     )
 
     # Create training_sessions table
@@ -129,11 +290,11 @@ def upgrade() -> None:
         "training_sessions",
         sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column("difficulty_level", sa.String(length=20), nullable=False),
+        sa.Column("difficulty_level", difficulty_level, nullable=False),
         sa.Column("scenario_type", sa.String(length=30), nullable=False),
         sa.Column("total_scenarios", sa.Integer(), nullable=False),
         sa.Column("completed_scenarios", sa.Integer(), nullable=False),
-        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("status", session_status, nullable=False),
         sa.Column(
             "started_at",
             sa.DateTime(timezone=True),
@@ -147,14 +308,6 @@ def upgrade() -> None:
         sa.CheckConstraint(
             "completed_scenarios >= 0", name="valid_completed_scenarios"
         ),
-        sa.CheckConstraint(
-            "difficulty_level IN ('beginner', 'intermediate', 'advanced', 'expert')",
-            name="valid_difficulty",
-        ),
-        sa.CheckConstraint(
-            "status IN ('active', 'completed', 'paused', 'abandoned')",
-            name="valid_session_status",
-        ),
         sa.CheckConstraint("total_scenarios > 0", name="valid_total_scenarios"),
         sa.PrimaryKeyConstraint("id", name="pk_training_sessions"),
     )
@@ -177,7 +330,7 @@ def upgrade() -> None:
         sa.Column("user_answer", sa.String(length=200), nullable=True),
         sa.Column("optimal_answer", sa.String(length=200), nullable=False),
         sa.Column("is_correct", sa.Boolean(), nullable=False),
-        sa.Column("ev_difference", sa.Numeric(precision=8, scale=4), nullable=True),
+        sa.Column("ev_difference", sa.Float(precision=53), nullable=True),
         sa.Column("decision_time_seconds", sa.Integer(), nullable=False),
         sa.Column(
             "created_at",
@@ -192,13 +345,22 @@ def upgrade() -> None:
             name="fk_performance_metrics_session_id_training_sessions",
             ondelete="CASCADE",
         ),
-        sa.PrimaryKeyConstraint("id", name="pk_performance_metrics"),
+        sa.PrimaryKeyConstraint("id", "session_id", name="pk_performance_metrics"),
+        postgresql_partition_by="HASH (session_id)",
     )
+    for remainder in range(PERFORMANCE_METRICS_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE performance_metrics_p{remainder} "
+            f"PARTITION OF performance_metrics FOR VALUES WITH "
+            f"(MODULUS {PERFORMANCE_METRICS_PARTITIONS}, REMAINDER {remainder})"
+        )
     op.create_index(
         "idx_performance_created_at",
         "performance_metrics",
         ["created_at"],
         unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
     )
     op.create_index(
         "idx_performance_is_correct",
@@ -218,24 +380,17 @@ def upgrade() -> None:
         "system_metrics",
         sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("metric_name", sa.String(length=100), nullable=False),
-        sa.Column("metric_value", sa.Numeric(precision=15, scale=6), nullable=False),
-        sa.Column("metric_type", sa.String(length=20), nullable=False),
-        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("metric_value", sa.Float(precision=53), nullable=False),
+        sa.Column("metric_type", metric_type, nullable=False),
+        sa.Column("tags", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column(
             "recorded_at",
             sa.DateTime(timezone=True),
             server_default=sa.text("now()"),
             nullable=True,
         ),
-        sa.CheckConstraint(
-            "metric_type IN ('counter', 'gauge', 'histogram', 'summary')",
-            name="valid_metric_type",
-        ),
         sa.PrimaryKeyConstraint("id", name="pk_system_metrics"),
     )
-    op.create_index(
-        "idx_system_metrics_name", "system_metrics", ["metric_name"], unique=False
-    )
     op.create_index(
         "idx_system_metrics_name_time",
         "system_metrics",
@@ -247,13 +402,23 @@ def upgrade() -> None:
         "system_metrics",
         ["recorded_at"],
         unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "idx_system_metrics_tags_gin",
+        "system_metrics",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
     )
 
 
 def downgrade() -> None:
+    op.drop_index("idx_system_metrics_tags_gin", table_name="system_metrics")
     op.drop_index("idx_system_metrics_recorded_at", table_name="system_metrics")
     op.drop_index("idx_system_metrics_name_time", table_name="system_metrics")
-    op.drop_index("idx_system_metrics_name", table_name="system_metrics")
     op.drop_table("system_metrics")
 
     op.drop_index("idx_performance_session_id", table_name="performance_metrics")
@@ -266,14 +431,23 @@ def downgrade() -> None:
     op.drop_index("idx_training_started_at", table_name="training_sessions")
     op.drop_table("training_sessions")
 
-    op.drop_index("idx_analysis_position_id", table_name="analysis_results")
+    op.execute(
+        "DROP TRIGGER trg_analysis_results_sync_position_analysis "
+        "ON analysis_results"
+    )
+    op.execute("DROP FUNCTION sync_position_analysis()")
+    op.drop_index("idx_position_analysis_hash", table_name="position_analysis")
+    op.drop_table("position_analysis")
+
+    op.drop_index("idx_analysis_position_covering", table_name="analysis_results")
     op.drop_index("idx_analysis_method", table_name="analysis_results")
     op.drop_index("idx_analysis_created_at", table_name="analysis_results")
     op.drop_table("analysis_results")
 
+    op.drop_index("idx_positions_remaining_gin", table_name="positions")
+    op.drop_index("idx_positions_hands_gin", table_name="positions")
     op.drop_index("idx_positions_hash", table_name="positions")
     op.drop_index("idx_positions_game_round_player", table_name="positions")
-    op.drop_index("idx_positions_game_id", table_name="positions")
     op.drop_index("idx_positions_created_at", table_name="positions")
     op.drop_table("positions")
 
@@ -281,3 +455,7 @@ def downgrade() -> None:
     op.drop_index("idx_games_created_at", table_name="games")
     op.drop_index("idx_games_completed_at", table_name="games")
     op.drop_table("games")
+
+    bind = op.get_bind()
+    for enum_type in reversed(ENUM_TYPES):
+        enum_type.drop(bind)
@@ -5,13 +5,16 @@ Demo API Server - 繞過數據庫初始化的簡化版本
 """
 
 import logging
+import os
 import sys
 from typing import Optional
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request
+from brotli_asgi import BrotliMiddleware
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import API routers
 from src.infrastructure.web.api.game_controller import router as game_router
@@ -27,6 +30,52 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 靜態端點的回應內容固定不變，於模組載入時序列化一次
+_ROOT_JSON = orjson.dumps(
+    {
+        "name": "OFC Solver API - Demo",
+        "version": "0.1.0-demo",
+        "status": "active",
+        "environment": "demo",
+        "docs": "/api/docs",
+        "features": {
+            "games": "✅ Game Management (8 endpoints)",
+            "analysis": "✅ Strategy Analysis (6 endpoints)",
+            "training": "✅ Training System (8 endpoints)",
+            "total_endpoints": 22,
+        },
+        "note": "Demo version - bypasses database connections",
+    }
+)
+
+_HEALTH_JSON = orjson.dumps(
+    {
+        "service": "ofc-solver-api",
+        "status": "healthy",
+        "version": "0.1.0-demo",
+        "endpoints_available": 22,
+        "database": "bypassed (demo mode)",
+    }
+)
+
+_API_INFO_JSON = orjson.dumps(
+    {
+        "version": "v1",
+        "endpoints": {
+            "games": "/api/v1/games",
+            "analysis": "/api/v1/analysis",
+            "training": "/api/v1/training",
+        },
+        "authentication": "disabled (demo mode)",
+        "rate_limiting": "disabled (demo mode)",
+        "features": {
+            "game_management": "8 endpoints",
+            "strategy_analysis": "6 endpoints",
+            "training_system": "8 endpoints",
+        },
+    }
+)
+
 
 def create_demo_app() -> FastAPI:
     """
@@ -39,6 +88,7 @@ def create_demo_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -50,8 +100,8 @@ def create_demo_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Add GZip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Add Brotli compression (gzip fallback for clients without br support)
+    app.add_middleware(BrotliMiddleware, minimum_size=2048, gzip_fallback=True)
 
     # Include API routers
     app.include_router(game_router, prefix="/api/v1/games", tags=["games"])
@@ -62,52 +112,19 @@ def create_demo_app() -> FastAPI:
     @app.get("/")
     async def root():
         """根端點 - API 資訊"""
-        return {
-            "name": "OFC Solver API - Demo",
-            "version": "0.1.0-demo",
-            "status": "active",
-            "environment": "demo",
-            "docs": "/api/docs",
-            "features": {
-                "games": "✅ Game Management (8 endpoints)",
-                "analysis": "✅ Strategy Analysis (6 endpoints)",
-                "training": "✅ Training System (8 endpoints)",
-                "total_endpoints": 22
-            },
-            "note": "Demo version - bypasses database connections"
-        }
+        return Response(_ROOT_JSON, media_type="application/json")
 
     # Health check
     @app.get("/health")
     async def health_check():
         """健康檢查"""
-        return {
-            "service": "ofc-solver-api",
-            "status": "healthy",
-            "version": "0.1.0-demo",
-            "endpoints_available": 22,
-            "database": "bypassed (demo mode)"
-        }
+        return Response(_HEALTH_JSON, media_type="application/json")
 
     # API info endpoint
     @app.get("/api/v1")
     async def api_info():
         """API 版本資訊"""
-        return {
-            "version": "v1",
-            "endpoints": {
-                "games": "/api/v1/games",
-                "analysis": "/api/v1/analysis",
-                "training": "/api/v1/training"
-            },
-            "authentication": "disabled (demo mode)",
-            "rate_limiting": "disabled (demo mode)",
-            "features": {
-                "game_management": "8 endpoints",
-                "strategy_analysis": "6 endpoints", 
-                "training_system": "8 endpoints"
-            }
-        }
+        return Response(_API_INFO_JSON, media_type="application/json")
 
     return app
 
@@ -115,8 +132,6 @@ def create_demo_app() -> FastAPI:
 def run_demo_server():
     """運行演示服務器"""
     
-    app = create_demo_app()
-    
     logger.info("🚀 Starting OFC Solver Demo API Server...")
     logger.info("📚 API Documentation: http://localhost:8001/api/docs")
     logger.info("🔍 Alternative docs: http://localhost:8001/api/redoc")
@@ -124,12 +139,19 @@ def run_demo_server():
     logger.info("🎯 22 REST API endpoints available!")
     
     # Start server
+    # 多 worker 需要以 import string + factory 啟動
     uvicorn.run(
-        app,
+        "demo_api_server:create_demo_app",
+        factory=True,
         host="0.0.0.0",
         port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 1,
+        limit_concurrency=1024,
+        backlog=2048,
         log_level="info",
-        access_log=True,
+        access_log=False,  # Access log 佔每個請求相當比例的 CPU
         reload=False,  # Disable reload for demo
     )
 
@@ -1,5 +1,7 @@
 """Demo script showing command handler usage."""
 import asyncio
+import time
+from collections import OrderedDict
 from uuid import uuid4
 import logging
 
@@ -21,9 +23,10 @@ from src.application.validators.command_validators import (
     PlaceCardCommandValidator,
     RequestAnalysisCommandValidator
 )
-from src.domain.value_objects.game_rules import GameRules
+from src.domain.value_objects.game_rules import DEFAULT_RULES
 from src.domain.value_objects.card import Card, Rank, Suit
 from src.domain.value_objects.card_position import CardPosition
+from src.domain.value_objects.hand import Hand
 from src.domain.entities.game.position import Position
 
 # Mock implementations for demo
@@ -53,11 +56,17 @@ class MockPlayerRepository:
 class MockAnalysisRepository:
     async def save(self, session):
         print(f"✅ Analysis session saved: {session.id}")
+    
+    async def save_many(self, sessions):
+        print(f"✅ {len(sessions)} analysis sessions saved")
 
 
 class MockPositionRepository:
     async def save(self, position):
         print(f"✅ Position saved")
+    
+    async def save_many(self, positions):
+        print(f"✅ {len(positions)} positions saved")
 
 
 class MockStrategyCalculator:
@@ -73,14 +82,38 @@ class MockStrategyCalculator:
 
 
 class MockCacheManager:
-    def __init__(self):
-        self.cache = {}
+    """In-process LRU + TTL strategy cache keyed on the position's Zobrist hash."""
+
+    def __init__(self, maxsize=100_000, ttl=3600):
+        self.cache = OrderedDict()  # zobrist -> (stored_at, strategy)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
     
     async def get_strategy(self, position):
-        return None  # No cache for demo
+        key = position.get_zobrist_hash()
+        entry = self.cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            self.cache.pop(key, None)
+            self.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry[1]
     
     async def store_strategy(self, position, strategy):
+        key = position.get_zobrist_hash()
+        self.cache[key] = (time.monotonic(), strategy)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)  # Evict least recently used
         print(f"💾 Strategy cached")
+    
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 
 class MockGameValidator:
@@ -150,49 +183,30 @@ async def demo_command_handlers():
     
     print("✅ Command bus ready!\n")
     
-    # Demo 1: Create a game
-    print("📋 Demo 1: Creating a new game")
+    # Demos 1-3 are independent of each other, so dispatch them together
     create_game_cmd = CreateGameCommand(
         player_ids=["player1", "player2"],
-        rules=GameRules(),
+        rules=DEFAULT_RULES,
         game_variant="standard"
     )
     
-    result = await command_bus.execute(create_game_cmd)
-    
-    if result.success:
-        game_id = result.data["game_id"]
-        print(f"✅ Game created successfully! ID: {game_id}\n")
-    else:
-        print(f"❌ Failed to create game: {result.error}\n")
-        return
-    
-    # Demo 2: Place a card (would fail without proper game setup)
-    print("📋 Demo 2: Attempting to place a card")
+    # Place a card (would fail without proper game setup)
     place_card_cmd = PlaceCardCommand(
         game_id=uuid4(),  # Using random ID for demo
         player_id="player1",
-        card=Card(rank=Rank.ACE, suit=Suit.SPADES),
-        position=CardPosition(row="bottom", index=0)
+        card=Card.of(Suit.SPADES, Rank.ACE),
+        position=CardPosition.BOTTOM
     )
     
-    result = await command_bus.execute(place_card_cmd)
-    
-    if result.success:
-        print(f"✅ Card placed successfully!\n")
-    else:
-        print(f"❌ Failed to place card: {result.error}\n")
-    
-    # Demo 3: Request strategy analysis
-    print("📋 Demo 3: Requesting strategy analysis")
-    
     # Create a mock position
+    empty_hand = Hand(top_row=[], middle_row=[], bottom_row=[], hand_cards=[])
     position = Position(
-        game_id=uuid4(),
-        players_hands={"player1": [], "player2": []},
-        remaining_cards=list(range(52)),
-        current_player="player1",
-        round_number=1
+        game_id=str(uuid4()),
+        players_hands={"player1": empty_hand, "player2": empty_hand},
+        remaining_cards=Card.create_deck(),
+        current_player_id="player1",
+        round_number=1,
+        rules=DEFAULT_RULES
     )
     
     analysis_cmd = RequestAnalysisCommand(
@@ -203,26 +217,47 @@ async def demo_command_handlers():
         force_recalculate=True
     )
     
-    result = await command_bus.execute(analysis_cmd)
+    create_result, place_result, analysis_result = await asyncio.gather(
+        command_bus.execute(create_game_cmd),
+        command_bus.execute(place_card_cmd),
+        command_bus.execute(analysis_cmd),
+    )
     
-    if result.success:
+    # Demo 1: Create a game
+    print("📋 Demo 1: Creating a new game")
+    if create_result.success:
+        game_id = create_result.data["game_id"]
+        print(f"✅ Game created successfully! ID: {game_id}\n")
+    else:
+        print(f"❌ Failed to create game: {create_result.error}\n")
+    
+    # Demo 2: Place a card
+    print("📋 Demo 2: Attempting to place a card")
+    if place_result.success:
+        print(f"✅ Card placed successfully!\n")
+    else:
+        print(f"❌ Failed to place card: {place_result.error}\n")
+    
+    # Demo 3: Request strategy analysis
+    print("📋 Demo 3: Requesting strategy analysis")
+    if analysis_result.success:
         print(f"✅ Analysis requested!")
-        print(f"   Session ID: {result.data['session_id']}")
-        print(f"   Status: {result.data['status']}")
-        print(f"   Estimated time: {result.data['estimated_time_seconds']}s\n")
+        print(f"   Session ID: {analysis_result.data['session_id']}")
+        print(f"   Status: {analysis_result.data['status']}")
+        print(f"   Estimated time: {analysis_result.data['estimated_time_seconds']}s\n")
     else:
-        print(f"❌ Failed to request analysis: {result.error}\n")
+        print(f"❌ Failed to request analysis: {analysis_result.error}\n")
     
     # Demo 4: Invalid command (validation failure)
     print("📋 Demo 4: Testing validation - invalid player count")
-    invalid_cmd = CreateGameCommand(
-        player_ids=["player1"],  # Only 1 player (invalid)
-        rules=GameRules(),
-        game_variant="standard"
-    )
     
     # This will trigger validation error
     try:
+        invalid_cmd = CreateGameCommand(
+            player_ids=["player1"],  # Only 1 player (invalid)
+            rules=DEFAULT_RULES,
+            game_variant="standard"
+        )
         result = await command_bus.execute(invalid_cmd)
     except ValueError as e:
         print(f"❌ Validation failed as expected: {e}\n")
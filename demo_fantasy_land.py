@@ -22,33 +22,33 @@ def create_test_cards():
     """Create cards for testing Fantasy Land scenarios."""
     return {
         # QQ for Fantasy Land entry
-        "QH": Card(Suit.HEARTS, Rank.QUEEN),
-        "QD": Card(Suit.DIAMONDS, Rank.QUEEN),
-        "QC": Card(Suit.CLUBS, Rank.QUEEN),
-        "KC": Card(Suit.CLUBS, Rank.KING),
+        "QH": Card.of(Suit.HEARTS, Rank.QUEEN),
+        "QD": Card.of(Suit.DIAMONDS, Rank.QUEEN),
+        "QC": Card.of(Suit.CLUBS, Rank.QUEEN),
+        "KC": Card.of(Suit.CLUBS, Rank.KING),
         
         # JJ for weak pair
-        "JH": Card(Suit.HEARTS, Rank.JACK),
-        "JD": Card(Suit.DIAMONDS, Rank.JACK),
+        "JH": Card.of(Suit.HEARTS, Rank.JACK),
+        "JD": Card.of(Suit.DIAMONDS, Rank.JACK),
         
         # Trips for staying in FL
-        "AH": Card(Suit.HEARTS, Rank.ACE),
-        "AD": Card(Suit.DIAMONDS, Rank.ACE),
-        "AC": Card(Suit.CLUBS, Rank.ACE),
+        "AH": Card.of(Suit.HEARTS, Rank.ACE),
+        "AD": Card.of(Suit.DIAMONDS, Rank.ACE),
+        "AC": Card.of(Suit.CLUBS, Rank.ACE),
         
         # Full house for middle
-        "KH": Card(Suit.HEARTS, Rank.KING),
-        "KD": Card(Suit.DIAMONDS, Rank.KING),
-        "KS": Card(Suit.SPADES, Rank.KING),
-        "7H": Card(Suit.HEARTS, Rank.SEVEN),
-        "7D": Card(Suit.DIAMONDS, Rank.SEVEN),
+        "KH": Card.of(Suit.HEARTS, Rank.KING),
+        "KD": Card.of(Suit.DIAMONDS, Rank.KING),
+        "KS": Card.of(Suit.SPADES, Rank.KING),
+        "7H": Card.of(Suit.HEARTS, Rank.SEVEN),
+        "7D": Card.of(Suit.DIAMONDS, Rank.SEVEN),
         
         # Quads for bottom
-        "9H": Card(Suit.HEARTS, Rank.NINE),
-        "9D": Card(Suit.DIAMONDS, Rank.NINE),
-        "9C": Card(Suit.CLUBS, Rank.NINE),
-        "9S": Card(Suit.SPADES, Rank.NINE),
-        "8C": Card(Suit.CLUBS, Rank.EIGHT),
+        "9H": Card.of(Suit.HEARTS, Rank.NINE),
+        "9D": Card.of(Suit.DIAMONDS, Rank.NINE),
+        "9C": Card.of(Suit.CLUBS, Rank.NINE),
+        "9S": Card.of(Suit.SPADES, Rank.NINE),
+        "8C": Card.of(Suit.CLUBS, Rank.EIGHT),
     }
 
 
@@ -145,8 +145,8 @@ def test_fantasy_placement_validation():
     for rank in [Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN, 
                  Rank.NINE, Rank.EIGHT, Rank.SEVEN, Rank.SIX, Rank.FIVE,
                  Rank.FOUR, Rank.THREE, Rank.TWO]:
-        dealt.append(Card(Suit.HEARTS, rank))
-    dealt.append(Card(Suit.SPADES, Rank.ACE))  # 14th card
+        dealt.append(Card.of(Suit.HEARTS, rank))
+    dealt.append(Card.of(Suit.SPADES, Rank.ACE))  # 14th card
     
     # Valid placement (13 from 14)
     placed = dealt[:13]  # Place first 13, discard last
@@ -159,7 +159,7 @@ def test_fantasy_placement_validation():
     print(f"Too few cards: {valid}, error: {error}")
     
     # Invalid - card not from dealt
-    placed_wrong = dealt[:12] + [Card(Suit.CLUBS, Rank.KING)]
+    placed_wrong = dealt[:12] + [Card.of(Suit.CLUBS, Rank.KING)]
     valid, error = manager.validate_fantasy_placement(placed_wrong, dealt)
     print(f"Wrong card: {valid}, error: {error}")
 
@@ -11,9 +11,14 @@ Shows how the strategy analyzer helps with:
 
 from datetime import datetime
 
+import numpy as np
+
 from src.domain.value_objects import Card, Rank, Suit
 from src.domain.services.fantasy_land_strategy import FantasyLandStrategyAnalyzer
 
+# Shared by every test so its top-row cache carries across scenarios
+ANALYZER = FantasyLandStrategyAnalyzer()
+
 
 def create_scenario_cards():
     """Create cards for different scenarios."""
@@ -45,57 +50,41 @@ def test_top_row_decisions():
     """Test top row placement decisions for FL entry."""
     print("\n=== Top Row Placement Analysis ===")
     
-    analyzer = FantasyLandStrategyAnalyzer()
+    analyzer = ANALYZER
     cards = create_scenario_cards()
     
-    # Scenario 1: Empty top row, have a Queen
-    print("\nScenario 1: Empty top, considering Q placement")
-    current_top = []
-    candidate = cards["QH"]
-    remaining_streets = 4
+    # (description, current top, candidate, remaining streets)
+    scenarios = [
+        ("Scenario 1: Empty top, considering Q placement", [], cards["QH"], 4),
+        ("Scenario 2: Have Q, considering another Q", [cards["QH"]], cards["QD"], 3),
+        (
+            "Scenario 3: Late street, considering A placement",
+            [cards["JH"], cards["JS"]],
+            cards["AH"],
+            1,
+        ),
+    ]
     
-    analysis = analyzer.analyze_top_row_placement(
-        current_top, candidate, remaining_streets
+    # Analyze every scenario in one vectorized call
+    analysis = analyzer.analyze_top_row_placement_batch(
+        np.array([Card.to_mask(top) for _, top, _, _ in scenarios], dtype=np.uint64),
+        np.array([candidate.numeric_rank for _, _, candidate, _ in scenarios]),
+        np.array([streets for _, _, _, streets in scenarios]),
     )
-    print(f"FL Probability: {analysis['fl_probability']:.2%}")
-    print(f"Foul Risk: {analysis['risk_score']:.2%}")
-    print(f"EV Score: {analysis['ev_score']:.2f}")
-    print(f"Recommendation: {analysis['recommendation']:.2f} (-1=avoid, 1=strong yes)")
-    
-    # Scenario 2: Already have one Q
-    print("\nScenario 2: Have Q, considering another Q")
-    current_top = [cards["QH"]]
-    candidate = cards["QD"]
-    remaining_streets = 3
-    
-    analysis = analyzer.analyze_top_row_placement(
-        current_top, candidate, remaining_streets
-    )
-    print(f"FL Probability: {analysis['fl_probability']:.2%}")
-    print(f"Foul Risk: {analysis['risk_score']:.2%}")
-    print(f"EV Score: {analysis['ev_score']:.2f}")
-    print(f"Recommendation: {analysis['recommendation']:.2f}")
-    
-    # Scenario 3: Late street, risky placement
-    print("\nScenario 3: Late street, considering A placement")
-    current_top = [cards["JH"], cards["JS"]]
-    candidate = cards["AH"]
-    remaining_streets = 1
-    
-    analysis = analyzer.analyze_top_row_placement(
-        current_top, candidate, remaining_streets
-    )
-    print(f"FL Probability: {analysis['fl_probability']:.2%}")
-    print(f"Foul Risk: {analysis['risk_score']:.2%}")
-    print(f"EV Score: {analysis['ev_score']:.2f}")
-    print(f"Recommendation: {analysis['recommendation']:.2f}")
+    
+    for i, (description, _, _, _) in enumerate(scenarios):
+        print(f"\n{description}")
+        print(f"FL Probability: {analysis['fl_probability'][i]:.2%}")
+        print(f"Foul Risk: {analysis['risk_score'][i]:.2%}")
+        print(f"EV Score: {analysis['ev_score'][i]:.2f}")
+        print(f"Recommendation: {analysis['recommendation'][i]:.2f} (-1=avoid, 1=strong yes)")
 
 
 def test_street_priorities():
     """Test priority recommendations for different streets."""
     print("\n=== Street Priority Analysis ===")
     
-    analyzer = FantasyLandStrategyAnalyzer()
+    analyzer = ANALYZER
     
     # Test each street
     for street in range(5):
@@ -116,7 +105,7 @@ def test_fantasy_land_optimization():
     """Test Fantasy Land hand optimization."""
     print("\n=== Fantasy Land Optimization ===")
     
-    analyzer = FantasyLandStrategyAnalyzer()
+    analyzer = ANALYZER
     
     # Create 14 cards for FL
     fl_cards = [
@@ -144,9 +133,9 @@ def test_fantasy_land_optimization():
     recommendation = analyzer.recommend_fantasy_land_play(fl_cards)
     
     print("\nRecommended placement:")
-    print(f"Top: {[str(c) for c in recommendation['top']]}")
-    print(f"Middle: {[str(c) for c in recommendation['middle']]}")
-    print(f"Bottom: {[str(c) for c in recommendation['bottom']]}")
+    print(f"Top: {Card.cards_to_string(recommendation['top'])}")
+    print(f"Middle: {Card.cards_to_string(recommendation['middle'])}")
+    print(f"Bottom: {Card.cards_to_string(recommendation['bottom'])}")
     print(f"Discard: {recommendation['discarded']}")
     print(f"Can stay in FL: {recommendation['can_stay']}")
     print(f"Expected royalties: {recommendation['expected_royalties']} points")
@@ -156,7 +145,7 @@ def test_ev_calculations():
     """Test EV calculation examples."""
     print("\n=== EV Calculation Examples ===")
     
-    analyzer = FantasyLandStrategyAnalyzer()
+    analyzer = ANALYZER
     
     # Show the key parameters
     print(f"FL Entry Bonus: {analyzer.FL_ENTRY_BONUS} points")
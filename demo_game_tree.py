@@ -7,21 +7,34 @@ MVP implementation - simple but functional.
 """
 
 from datetime import datetime
-import random
+import sys
+
+import numpy as np
 
 from src.domain.value_objects import (
     Card, Rank, Suit, Hand, CardPosition
 )
+from src.domain.value_objects.card import FULL_DECK_MASK
 from src.domain.services.game_tree_builder import GameTreeBuilder
 
+# Built once; callers get a fresh list to shuffle
+FULL_DECK = tuple(Card.create_deck())
+
+# One seeded generator for every demo, so runs are reproducible
+DEMO_SEED = 2024
+RNG = np.random.default_rng(DEMO_SEED)
+
 
 def create_deck():
     """Create a standard 52-card deck."""
-    deck = []
-    for suit in Suit:
-        for rank in Rank:
-            deck.append(Card(suit, rank))
-    return deck
+    return list(FULL_DECK)
+
+
+def shuffled_remaining_deck(used_cards):
+    """Shuffle the cards not in use, filtering and ordering in one pass."""
+    used_mask = Card.to_mask(used_cards)
+    order = RNG.permutation(len(FULL_DECK))
+    return [FULL_DECK[i] for i in order if not FULL_DECK[i].bit & used_mask]
 
 
 def create_sample_hand():
@@ -42,19 +55,23 @@ def print_node_info(builder, node_id):
     if not node:
         return
         
-    print(f"\nNode {node_id}:")
-    print(f"  Depth: {node.depth}")
-    print(f"  Cards placed: {node.cards_placed}")
-    print(f"  Terminal: {node.is_terminal}")
-    print(f"  Fouled: {node.is_fouled}")
+    # Build the block and write it once instead of one print per line
+    lines = [
+        f"\nNode {node_id}:",
+        f"  Depth: {node.depth}",
+        f"  Cards placed: {node.cards_placed}",
+        f"  Terminal: {node.is_terminal}",
+        f"  Fouled: {node.is_fouled}",
+    ]
     
     if node.dealt_cards:
-        print(f"  Dealt: {[str(c) for c in node.dealt_cards]}")
+        lines.append(f"  Dealt: [{', '.join(map(str, node.dealt_cards))}]")
     
     if node.possible_actions:
-        print(f"  Possible actions: {len(node.possible_actions)}")
+        lines.append(f"  Possible actions: {len(node.possible_actions)}")
         
-    print(f"  Children: {len(node.children_ids)}")
+    lines.append(f"  Children: {len(node.children_ids)}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_basic_tree_building():
@@ -64,23 +81,19 @@ def demo_basic_tree_building():
     # Create builder and initial setup
     builder = GameTreeBuilder()
     hand = create_sample_hand()
-    deck = create_deck()
     
-    # Remove cards already in hand
+    # Remove cards already in hand, shuffled for realism
     used_cards = hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards]
-    
-    # Shuffle for realism
-    random.shuffle(remaining_deck)
+    remaining_deck = shuffled_remaining_deck(used_cards)
     
     print(f"Starting hand has {len(used_cards)} cards")
     print(f"Remaining deck has {len(remaining_deck)} cards")
     
     # Show current hand state
     print(f"\nCurrent hand:")
-    print(f"  Top: {len(hand.top_row)} cards - {[str(c) for c in hand.top_row]}")
-    print(f"  Middle: {len(hand.middle_row)} cards - {[str(c) for c in hand.middle_row]}")
-    print(f"  Bottom: {len(hand.bottom_row)} cards - {[str(c) for c in hand.bottom_row]}")
+    print(f"  Top: {len(hand.top_row)} cards - [{', '.join(map(str, hand.top_row))}]")
+    print(f"  Middle: {len(hand.middle_row)} cards - [{', '.join(map(str, hand.middle_row))}]")
+    print(f"  Bottom: {len(hand.bottom_row)} cards - [{', '.join(map(str, hand.bottom_row))}]")
     
     # Build tree with depth 1 (just one street ahead)
     print("\nBuilding tree with depth=1...")
@@ -120,10 +133,8 @@ def demo_deeper_tree():
     )
     
     builder = GameTreeBuilder()
-    deck = create_deck()
     used_cards = hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards]
-    random.shuffle(remaining_deck)
+    remaining_deck = shuffled_remaining_deck(used_cards)
     
     print(f"Starting with only {len(used_cards)} cards for deeper tree")
     
@@ -150,9 +161,8 @@ def demo_action_tracking():
     
     builder = GameTreeBuilder()
     hand = create_sample_hand()
-    deck = create_deck()
     used_cards = hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards]
+    remaining_deck = Card.from_mask(FULL_DECK_MASK & ~Card.to_mask(used_cards))
     
     # Build small tree
     root = builder.build_tree_from_position(hand, remaining_deck[:12], max_depth=1)
@@ -179,7 +189,7 @@ def demo_memory_efficiency():
     print("Depth 8 (full game): ~3^8 = 6,561 leaf nodes")
     
     print("\nMVP approach: Limit depth to 2-3 for practical use")
-    print("Future optimization: Add transposition table")
+    print("Transposition table: positions reached by different placement orders share one node")
     print("Future optimization: Add pruning based on hand strength")
 
 
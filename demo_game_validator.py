@@ -7,19 +7,38 @@ showcasing card placement validation, row strength validation, turn order,
 and multi-player game validation.
 """
 
-from src.domain.entities.game import Game
-from src.domain.entities.game.player import Player
-from src.domain.services.game_validator import GameValidator
-from src.domain.value_objects import Card, CardPosition
-from src.domain.value_objects.game_rules import GameRules
+from functools import lru_cache
+
+# Domain imports live in the demo functions, so importing this module to run
+# a single demo doesn't load the whole domain layer up front
+
+
+@lru_cache(maxsize=None)
+def shared_validator():
+    """Get the validator shared by every demo (it holds no per-game state)."""
+    from src.domain.services.game_validator import GameValidator
+
+    return GameValidator()
+
+
+@lru_cache(maxsize=None)
+def shared_rules():
+    """Get the standard rules shared by every demo."""
+    from src.domain.value_objects.game_rules import GameRules
+
+    return GameRules.standard_rules()
 
 
 def demonstrate_card_placement_validation():
     """Demonstrate card placement validation functionality."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+    from src.domain.value_objects import Card, CardPosition
+
     print("\n=== Card Placement Validation Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create players and game
     player1 = Player("player1", "Alice")
@@ -57,9 +76,12 @@ def demonstrate_card_placement_validation():
 
 def demonstrate_row_strength_validation():
     """Demonstrate row strength validation functionality."""
+    from src.domain.entities.game.player import Player
+    from src.domain.value_objects import Card
+
     print("\n\n=== Row Strength Validation Demo ===")
     
-    validator = GameValidator()
+    validator = shared_validator()
     
     # Create player with valid OFC progression
     player_valid = Player("player1", "Alice")
@@ -79,8 +101,8 @@ def demonstrate_row_strength_validation():
         Card.from_string("2d"), Card.from_string("2s")
     ]  # Full house (5s full of 2s)
     
-    # Mock complete layout
-    player_valid.is_layout_complete = lambda: True
+    # Rows were set directly, so record the completed layout too
+    player_valid._total_placed = 13
     
     result = validator.validate_row_strength_progression(player_valid)
     print(f"✅ Valid OFC progression:")
@@ -107,8 +129,8 @@ def demonstrate_row_strength_validation():
         Card.from_string("3d"), Card.from_string("3s")
     ]  # Full house (6s full of 3s)
     
-    # Mock complete layout
-    player_fouled.is_layout_complete = lambda: True
+    # Rows were set directly, so record the completed layout too
+    player_fouled._total_placed = 13
     
     result = validator.validate_row_strength_progression(player_fouled)
     print(f"\n❌ Fouled OFC progression:")
@@ -121,10 +143,13 @@ def demonstrate_row_strength_validation():
 
 def demonstrate_game_completion_validation():
     """Demonstrate game completion validation."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+
     print("\n\n=== Game Completion Validation Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create players and game
     player1 = Player("player1", "Alice")
@@ -152,10 +177,13 @@ def demonstrate_game_completion_validation():
 
 def demonstrate_turn_order_validation():
     """Demonstrate turn order validation."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+
     print("\n\n=== Turn Order Validation Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create players and game
     player1 = Player("player1", "Alice")
@@ -180,10 +208,14 @@ def demonstrate_turn_order_validation():
 
 def demonstrate_multi_player_validation():
     """Demonstrate multi-player game state validation."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+    from src.domain.value_objects import Card
+
     print("\n\n=== Multi-Player Game Validation Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create valid 3-player game
     player1 = Player("player1", "Alice")
@@ -218,10 +250,13 @@ def demonstrate_multi_player_validation():
 
 def demonstrate_validation_summary():
     """Demonstrate comprehensive validation summary."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+
     print("\n\n=== Validation Summary Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create players and game
     player1 = Player("player1", "Alice")
@@ -243,10 +278,14 @@ def demonstrate_validation_summary():
 
 def demonstrate_safe_placement():
     """Demonstrate safe card placement checking."""
+    from src.domain.entities.game import Game
+    from src.domain.entities.game.player import Player
+    from src.domain.value_objects import Card, CardPosition
+
     print("\n\n=== Safe Placement Demo ===")
     
-    validator = GameValidator()
-    rules = GameRules.standard_rules()
+    validator = shared_validator()
+    rules = shared_rules()
     
     # Create players and game
     player1 = Player("player1", "Alice")
@@ -32,8 +32,8 @@ def test_joker_evaluation():
     """Test hand evaluation with jokers."""
     print("\n=== Joker Hand Evaluation ===")
     
-    base_evaluator = PineappleHandEvaluator()
-    joker_evaluator = JokerHandEvaluator(base_evaluator)
+    base_evaluator = PineappleHandEvaluator.instance()
+    joker_evaluator = JokerHandEvaluator.instance()
     
     # Scenario 1: One joker with a King (makes KK)
     print("\nScenario 1: K + Joker")
@@ -45,7 +45,7 @@ def test_joker_evaluation():
     jokers = [JokerCard()]
     
     result = joker_evaluator.evaluate_with_jokers(cards, jokers)
-    print(f"Best hand: {[str(c) for c in result['best_hand']]}")
+    print(f"Best hand: {Card.cards_to_string(result['best_hand'])}")
     print(f"Substitutions: {result['substitutions']}")
     print(f"Hand type: {result['ranking'].hand_type}")
     print(f"Royalty bonus: {result['ranking'].royalty_bonus}")
@@ -58,7 +58,7 @@ def test_joker_evaluation():
     jokers = [JokerCard(), JokerCard()]
     
     result = joker_evaluator.evaluate_with_jokers(cards, jokers)
-    print(f"Best hand: {[str(c) for c in result['best_hand']]}")
+    print(f"Best hand: {Card.cards_to_string(result['best_hand'])}")
     print(f"Substitutions: {result['substitutions']}")
     print(f"Hand type: {result['ranking'].hand_type}")
     print(f"Royalty bonus: {result['ranking'].royalty_bonus}")
@@ -74,7 +74,7 @@ def test_joker_evaluation():
     jokers = [JokerCard()]
     
     result = joker_evaluator.evaluate_with_jokers(cards, jokers)
-    print(f"Best hand: {[str(c) for c in result['best_hand']]}")
+    print(f"Best hand: {Card.cards_to_string(result['best_hand'])}")
     print(f"Substitutions: {result['substitutions']}")
     print(f"Hand type: {result['ranking'].hand_type}")
     print(f"Royalty bonus: {result['ranking'].royalty_bonus}")
@@ -119,7 +119,7 @@ def test_mixed_hand_identification():
     regular_cards, joker_cards = identify_jokers_in_hand(mixed_hand)
     
     print(f"Total cards: {len(mixed_hand)}")
-    print(f"Regular cards: {[str(c) for c in regular_cards]}")
+    print(f"Regular cards: {Card.cards_to_string(regular_cards)}")
     print(f"Jokers: {len(joker_cards)}")
 
 
@@ -127,8 +127,8 @@ def test_joker_in_ofc_context():
     """Test joker in OFC game context."""
     print("\n=== Joker in OFC Context ===")
     
-    base_evaluator = PineappleHandEvaluator()
-    joker_evaluator = JokerHandEvaluator(base_evaluator)
+    base_evaluator = PineappleHandEvaluator.instance()
+    joker_evaluator = JokerHandEvaluator.instance()
     
     # Simulate OFC rows with jokers
     print("\nOFC Hand with Jokers:")
@@ -138,7 +138,7 @@ def test_joker_in_ofc_context():
     top_jokers = [JokerCard()]
     top_result = joker_evaluator.evaluate_with_jokers(top_cards, top_jokers)
     
-    print(f"Top: {[str(c) for c in top_cards]} + 🃏")
+    print(f"Top: {Card.cards_to_string(top_cards)} + 🃏")
     print(f"  → {top_result['ranking'].hand_type} (FL qualified!)")
     
     # Middle row: Regular hand
@@ -150,7 +150,7 @@ def test_joker_in_ofc_context():
         Card(Suit.HEARTS, Rank.TEN),
     ]
     middle_result = base_evaluator.evaluate_hand(middle_cards)
-    print(f"Middle: {[str(c) for c in middle_cards]}")
+    print(f"Middle: {Card.cards_to_string(middle_cards)}")
     print(f"  → {middle_result.hand_type}")
     
     # Bottom row: With joker for safety
@@ -163,7 +163,7 @@ def test_joker_in_ofc_context():
     bottom_jokers = [JokerCard()]
     bottom_result = joker_evaluator.evaluate_with_jokers(bottom_cards, bottom_jokers)
     
-    print(f"Bottom: {[str(c) for c in bottom_cards]} + 🃏")
+    print(f"Bottom: {Card.cards_to_string(bottom_cards)} + 🃏")
     print(f"  → {bottom_result['ranking'].hand_type}")
     
     print("\nResult: Valid OFC hand with Fantasy Land entry!")
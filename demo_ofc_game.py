@@ -32,12 +32,16 @@ def demonstrate_card_and_hand_creation():
     print(f"\nCreated hand with {len(hand.hand_cards)} cards in hand")
     print(f"Available positions: {[pos.name for pos in hand.get_available_positions()]}")
     
-    # Place some cards
-    hand = hand.place_card(cards[0], CardPosition.TOP)     # As to top
-    hand = hand.place_card(cards[1], CardPosition.TOP)     # Kh to top
-    hand = hand.place_card(cards[2], CardPosition.MIDDLE)  # Qc to middle
-    hand = hand.place_card(cards[3], CardPosition.BOTTOM)  # Jd to bottom
-    hand = hand.place_card(cards[4], CardPosition.BOTTOM)  # Ts to bottom
+    # Place some cards (one Hand built at the end instead of one per card)
+    hand = (
+        Hand.builder(cards)
+        .place(cards[0], CardPosition.TOP)     # As to top
+        .place(cards[1], CardPosition.TOP)     # Kh to top
+        .place(cards[2], CardPosition.MIDDLE)  # Qc to middle
+        .place(cards[3], CardPosition.BOTTOM)  # Jd to bottom
+        .place(cards[4], CardPosition.BOTTOM)  # Ts to bottom
+        .build()
+    )
     
     print("\nAfter placing cards:")
     print(hand.to_string())
@@ -49,7 +53,7 @@ def demonstrate_hand_evaluation():
     """Demonstrate hand evaluation functionality."""
     print("\n\n=== Hand Evaluation Demo ===")
     
-    evaluator = HandEvaluator()
+    evaluator = HandEvaluator.instance()
     
     # Test 1: Evaluate a straight
     straight_cards = [
@@ -108,7 +112,7 @@ def demonstrate_ofc_validation():
     """Demonstrate OFC hand validation."""
     print("\n\n=== OFC Validation Demo ===")
     
-    evaluator = HandEvaluator()
+    evaluator = HandEvaluator.instance()
     
     # Valid OFC hand (bottom > middle > top)
     top_valid = [
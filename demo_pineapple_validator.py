@@ -21,17 +21,19 @@ from src.domain.entities.game.player import Player
 from src.domain.services import PineappleGameValidator
 
 
+SAMPLE_SUITS = (Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES)
+SAMPLE_RANKS = (Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN,
+                Rank.NINE, Rank.EIGHT, Rank.SEVEN, Rank.SIX, Rank.FIVE)
+
+# 14 distinct cards dealt for Fantasy Land, cycling through ranks and suits
+_RANKS = tuple(Rank)
+_SUITS = tuple(Suit)
+FANTASY_LAND_DEAL = [Card.of(_SUITS[i % 4], _RANKS[i % 13]) for i in range(14)]
+
+
 def create_sample_cards():
     """Create sample cards for testing."""
-    cards = []
-    suits = [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]
-    ranks = [Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN,
-             Rank.NINE, Rank.EIGHT, Rank.SEVEN, Rank.SIX, Rank.FIVE]
-    
-    for i, rank in enumerate(ranks):
-        cards.append(Card(suits[i % 4], rank))
-    
-    return cards
+    return [Card.of(SAMPLE_SUITS[i % 4], rank) for i, rank in enumerate(SAMPLE_RANKS)]
 
 
 def create_test_game():
@@ -143,32 +145,32 @@ def test_fantasy_land_validation():
     
     # Test entry with QQ
     qq_cards = [
-        Card(Suit.HEARTS, Rank.QUEEN),
-        Card(Suit.DIAMONDS, Rank.QUEEN),
-        Card(Suit.CLUBS, Rank.KING),
+        Card.of(Suit.HEARTS, Rank.QUEEN),
+        Card.of(Suit.DIAMONDS, Rank.QUEEN),
+        Card.of(Suit.CLUBS, Rank.KING),
     ]
     qualifies = validator._fantasy_land_manager.check_entry_qualification(qq_cards)
     print(f"QQ qualifies for entry: {qualifies}")
     
     # Test stay with trips
     trips_cards = [
-        Card(Suit.HEARTS, Rank.ACE),
-        Card(Suit.DIAMONDS, Rank.ACE),
-        Card(Suit.CLUBS, Rank.ACE),
+        Card.of(Suit.HEARTS, Rank.ACE),
+        Card.of(Suit.DIAMONDS, Rank.ACE),
+        Card.of(Suit.CLUBS, Rank.ACE),
     ]
     middle_cards = [
-        Card(Suit.SPADES, Rank.ACE),
-        Card(Suit.SPADES, Rank.KING),
-        Card(Suit.SPADES, Rank.QUEEN),
-        Card(Suit.SPADES, Rank.JACK),
-        Card(Suit.SPADES, Rank.TEN),
+        Card.of(Suit.SPADES, Rank.ACE),
+        Card.of(Suit.SPADES, Rank.KING),
+        Card.of(Suit.SPADES, Rank.QUEEN),
+        Card.of(Suit.SPADES, Rank.JACK),
+        Card.of(Suit.SPADES, Rank.TEN),
     ]
     bottom_cards = [
-        Card(Suit.HEARTS, Rank.KING),
-        Card(Suit.DIAMONDS, Rank.KING),
-        Card(Suit.CLUBS, Rank.KING),
-        Card(Suit.HEARTS, Rank.NINE),
-        Card(Suit.DIAMONDS, Rank.NINE),
+        Card.of(Suit.HEARTS, Rank.KING),
+        Card.of(Suit.DIAMONDS, Rank.KING),
+        Card.of(Suit.CLUBS, Rank.KING),
+        Card.of(Suit.HEARTS, Rank.NINE),
+        Card.of(Suit.DIAMONDS, Rank.NINE),
     ]
     
     can_stay = validator._fantasy_land_manager.check_stay_qualification(
@@ -195,12 +197,8 @@ def test_fantasy_land_placement():
     validator = PineappleGameValidator()
     cards = create_sample_cards()
     
-    # Create 14 cards for Fantasy Land
-    dealt_cards = []
-    for i in range(14):
-        rank = list(Rank)[i % 13]
-        suit = list(Suit)[i % 4]
-        dealt_cards.append(Card(suit, rank))
+    # 14 cards for Fantasy Land
+    dealt_cards = list(FANTASY_LAND_DEAL)
     
     # Valid placement - 13 from 14
     placed_cards = dealt_cards[:13]
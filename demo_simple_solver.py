@@ -6,9 +6,33 @@ This demonstrates the intended functionality, even if some integration is missin
 """
 
 from src.domain.value_objects import Card, Rank, Suit, Hand, CardPosition
+from src.domain.value_objects.hand_ranking import HandType
 from src.domain.services.pineapple_evaluator import PineappleHandEvaluator
+from functools import lru_cache
 from itertools import combinations
 
+# Process-wide, so its evaluation cache carries over between placements and demos
+evaluator = PineappleHandEvaluator.instance()
+
+
+# Rows by index, and their capacities
+ROWS = (CardPosition.TOP, CardPosition.MIDDLE, CardPosition.BOTTOM)
+ROW_SIZES = (3, 5, 5)
+
+# Every (keep, keep, discard, row, row) choice for 3 dealt cards: the kept
+# pairs in combinations() order, each tried same row or different rows
+ACTIONS = [
+    (keep1, keep2, 3 - keep1 - keep2, row1, row2)
+    for keep1, keep2 in combinations(range(3), 2)
+    for row1, row2 in [(0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2)]
+]
+
+
+@lru_cache(maxsize=1 << 16)
+def evaluate_row(mask: int):
+    """Evaluate the row whose cards make up the given deck mask."""
+    return evaluator.evaluate_hand(Card.from_mask(mask))
+
 
 def evaluate_placement(hand: Hand, cards_to_place: list[Card], position1: CardPosition, position2: CardPosition):
     """
@@ -16,84 +40,67 @@ def evaluate_placement(hand: Hand, cards_to_place: list[Card], position1: CardPo
     
     Returns score (higher is better).
     """
-    evaluator = PineappleHandEvaluator()
-    
-    # Create new hand with placements
-    try:
-        # Clone current hand
-        new_hand = Hand.from_layout(
-            top=list(hand.top_row),
-            middle=list(hand.middle_row),
-            bottom=list(hand.bottom_row),
-            hand=cards_to_place
-        )
-        
-        # Place cards
-        new_hand = new_hand.place_card(cards_to_place[0], position1)
-        new_hand = new_hand.place_card(cards_to_place[1], position2)
-        
-        # Evaluate
-        score = 0.0
-        
-        # Check for foul
-        if is_fouled(new_hand):
+    # Place cards into copies of the row masks instead of cloning the Hand
+    rows = [hand.top_mask, hand.middle_mask, hand.bottom_mask]
+    used = hand.placed_mask
+    
+    for card, position in zip(cards_to_place, (position1, position2)):
+        row = ROWS.index(position)
+        if used & card.bit or rows[row].bit_count() >= ROW_SIZES[row]:
+            # Invalid placement
+            return -2000.0
+        used |= card.bit
+        rows[row] |= card.bit
+    
+    return score_rows(*rows)
+
+
+def score_rows(top: int, middle: int, bottom: int) -> float:
+    """
+    Score a layout given as one deck mask per row.
+    
+    Returns score (higher is better).
+    """
+    cards_in_rows = [top.bit_count(), middle.bit_count(), bottom.bit_count()]
+    
+    # Evaluate each complete row once, for both the foul check and royalties
+    top_eval = evaluate_row(top) if cards_in_rows[0] == 3 else None
+    middle_eval = evaluate_row(middle) if cards_in_rows[1] == 5 else None
+    bottom_eval = evaluate_row(bottom) if cards_in_rows[2] == 5 else None
+    
+    # Check for foul (bottom must beat middle, middle must beat top)
+    if top_eval and middle_eval and bottom_eval:
+        if not (bottom_eval.beats(middle_eval) and middle_eval.beats(top_eval)):
             return -1000.0  # Heavy penalty
-        
-        # Evaluate each row
-        if len(new_hand.top_row) == 3:
-            top_eval = evaluator.evaluate_hand(new_hand.top_row)
-            score += top_eval.royalty_bonus
-            # Bonus for QQ+ (Fantasy Land)
-            if top_eval.hand_type.name == "PAIR" and top_eval.strength_value >= 12:
-                score += 10.0
-        
-        if len(new_hand.middle_row) == 5:
-            middle_eval = evaluator.evaluate_hand(new_hand.middle_row)
-            score += middle_eval.royalty_bonus
-        
-        if len(new_hand.bottom_row) == 5:
-            bottom_eval = evaluator.evaluate_hand(new_hand.bottom_row)
-            score += bottom_eval.royalty_bonus
-        
-        # Prefer balanced development
-        cards_in_rows = [len(new_hand.top_row), len(new_hand.middle_row), len(new_hand.bottom_row)]
-        balance_score = 5.0 - max(cards_in_rows) + min(cards_in_rows)
-        score += balance_score
-        
-        return score
-        
-    except Exception as e:
-        # Invalid placement
-        return -2000.0
+    
+    score = 0.0
+    if top_eval:
+        score += top_eval.royalty_bonus
+        # Bonus for QQ+ (Fantasy Land)
+        if top_eval.hand_type == HandType.PAIR and top_eval.strength_value >= 12:
+            score += 10.0
+    
+    if middle_eval:
+        score += middle_eval.royalty_bonus
+    
+    if bottom_eval:
+        score += bottom_eval.royalty_bonus
+    
+    # Prefer balanced development
+    balance_score = 5.0 - max(cards_in_rows) + min(cards_in_rows)
+    score += balance_score
+    
+    return score
 
 
 def is_fouled(hand: Hand) -> bool:
     """Check if hand is fouled."""
-    evaluator = PineappleHandEvaluator()
-    
     # Need complete rows to check
     if len(hand.top_row) < 3 or len(hand.middle_row) < 5 or len(hand.bottom_row) < 5:
         return False
     
-    top_eval = evaluator.evaluate_hand(hand.top_row)
-    middle_eval = evaluator.evaluate_hand(hand.middle_row)
-    bottom_eval = evaluator.evaluate_hand(hand.bottom_row)
-    
-    # Check progression
-    if bottom_eval.hand_type.value < middle_eval.hand_type.value:
-        return True
-    if middle_eval.hand_type.value < top_eval.hand_type.value:
-        return True
-        
-    # For same hand type, check strength
-    if bottom_eval.hand_type == middle_eval.hand_type:
-        if bottom_eval.strength_value < middle_eval.strength_value:
-            return True
-    if middle_eval.hand_type == top_eval.hand_type:
-        if middle_eval.strength_value < top_eval.strength_value:
-            return True
-    
-    return False
+    # Cactus-Kev rank lookups instead of three full evaluations
+    return evaluator.is_fouled_hand(hand.top_row, hand.middle_row, hand.bottom_row)
 
 
 def get_simple_recommendation(current_hand: Hand, dealt_cards: list[Card]):
@@ -104,56 +111,28 @@ def get_simple_recommendation(current_hand: Hand, dealt_cards: list[Card]):
     """
     print(f"\n🎴 Dealt cards: {[str(c) for c in dealt_cards]}")
     
-    # Get available positions
-    available_positions = []
-    if len(current_hand.top_row) < 3:
-        available_positions.extend([CardPosition.TOP] * (3 - len(current_hand.top_row)))
-    if len(current_hand.middle_row) < 5:
-        available_positions.extend([CardPosition.MIDDLE] * (5 - len(current_hand.middle_row)))
-    if len(current_hand.bottom_row) < 5:
-        available_positions.extend([CardPosition.BOTTOM] * (5 - len(current_hand.bottom_row)))
+    # Free slots per row
+    rows = (current_hand.top_row, current_hand.middle_row, current_hand.bottom_row)
+    room = [size - len(row) for size, row in zip(ROW_SIZES, rows)]
     
-    # Try all combinations of 2 cards from 3
+    # Try every kept pair in every row choice that has room for it
     best_score = -9999
     best_placement = None
     best_discard = None
     
-    for cards_to_place in combinations(dealt_cards, 2):
-        discard = [c for c in dealt_cards if c not in cards_to_place][0]
+    for keep1, keep2, discard, row1, row2 in ACTIONS:
+        needed = 2 if row1 == row2 else 1
+        if room[row1] < needed or room[row2] < needed:
+            continue
+        
+        cards_to_place = (dealt_cards[keep1], dealt_cards[keep2])
+        pos1, pos2 = ROWS[row1], ROWS[row2]
+        score = evaluate_placement(current_hand, list(cards_to_place), pos1, pos2)
         
-        # Try different position combinations
-        if len(available_positions) >= 2:
-            # Simple strategy: try placing in same row or different rows
-            test_positions = [
-                (CardPosition.TOP, CardPosition.TOP),
-                (CardPosition.MIDDLE, CardPosition.MIDDLE),
-                (CardPosition.BOTTOM, CardPosition.BOTTOM),
-                (CardPosition.TOP, CardPosition.MIDDLE),
-                (CardPosition.TOP, CardPosition.BOTTOM),
-                (CardPosition.MIDDLE, CardPosition.BOTTOM),
-            ]
-            
-            for pos1, pos2 in test_positions:
-                # Check if positions are available
-                if pos1 == CardPosition.TOP and len(current_hand.top_row) + (2 if pos1 == pos2 else 1) > 3:
-                    continue
-                if pos2 == CardPosition.TOP and len(current_hand.top_row) + (2 if pos1 == pos2 else 1) > 3:
-                    continue
-                if pos1 == CardPosition.MIDDLE and len(current_hand.middle_row) + (2 if pos1 == pos2 else 1) > 5:
-                    continue
-                if pos2 == CardPosition.MIDDLE and len(current_hand.middle_row) + (2 if pos1 == pos2 else 1) > 5:
-                    continue
-                if pos1 == CardPosition.BOTTOM and len(current_hand.bottom_row) + (2 if pos1 == pos2 else 1) > 5:
-                    continue
-                if pos2 == CardPosition.BOTTOM and len(current_hand.bottom_row) + (2 if pos1 == pos2 else 1) > 5:
-                    continue
-                    
-                score = evaluate_placement(current_hand, list(cards_to_place), pos1, pos2)
-                
-                if score > best_score:
-                    best_score = score
-                    best_placement = (cards_to_place, pos1, pos2)
-                    best_discard = discard
+        if score > best_score:
+            best_score = score
+            best_placement = (cards_to_place, pos1, pos2)
+            best_discard = dealt_cards[discard]
     
     if best_placement:
         cards, pos1, pos2 = best_placement
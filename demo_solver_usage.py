@@ -14,13 +14,16 @@ from src.domain.services.game_tree_builder import GameTreeBuilder
 from src.domain.services.pineapple_evaluator import PineappleHandEvaluator
 
 
+# Every card in the deck as a 52-bit mask, shared by all scenarios
+DECK_MASK = Card.to_mask(Card.create_deck())
+
+# Process-wide; its evaluation cache only depends on the cards
+evaluator = PineappleHandEvaluator.instance()
+
+
 def create_deck():
     """Create a standard 52-card deck."""
-    deck = []
-    for suit in Suit:
-        for rank in Rank:
-            deck.append(Card(suit, rank))
-    return deck
+    return Card.create_deck()
 
 
 def print_hand_state(hand: Hand):
@@ -46,8 +49,8 @@ def get_recommendation(current_hand: Hand, dealt_cards: list[Card], remaining_de
     """
     print(f"\nDealt 3 cards: {[str(c) for c in dealt_cards]}")
     
-    # Initialize services
-    evaluator = PineappleHandEvaluator()
+    # Tree builder and calculator keep per-search state (nodes, caches),
+    # so each recommendation gets fresh ones
     tree_builder = GameTreeBuilder(evaluator)
     strategy_calc = StrategyCalculator(tree_builder, evaluator)
     
@@ -73,12 +76,9 @@ def get_recommendation(current_hand: Hand, dealt_cards: list[Card], remaining_de
         action = strategy.recommended_actions[0]
         
         # Find which card to discard from dealt cards
-        cards_to_place = set(action.cards_to_place)
-        discard = None
-        for card in dealt_cards:
-            if card not in cards_to_place:
-                discard = card
-                break
+        discard = next(
+            (card for card in dealt_cards if card not in action.cards_to_place), None
+        )
                 
         result = {
             "success": True,
@@ -125,15 +125,12 @@ def demo_solver_usage():
     
     print_hand_state(initial_hand)
     
-    # Create deck and remove used cards
-    deck = create_deck()
-    used_cards = initial_hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards]
-    random.shuffle(remaining_deck)
-    
-    # Deal 3 cards
-    dealt_cards = remaining_deck[:3]
-    remaining_deck = remaining_deck[3:]
+    # Deal 3 random cards from those not in use, then remove them too
+    used_mask = initial_hand.all_mask
+    dealt_cards = random.sample(Card.from_mask(DECK_MASK & ~used_mask), 3)
+    remaining_deck = Card.from_mask(
+        DECK_MASK & ~(used_mask | Card.to_mask(dealt_cards))
+    )
     
     # Get recommendation
     rec = get_recommendation(initial_hand, dealt_cards, remaining_deck)
@@ -169,8 +166,9 @@ def demo_solver_usage():
     ]
     
     # Get recommendation
-    used_cards = fl_hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards and c not in dealt_cards]
+    remaining_deck = Card.from_mask(
+        DECK_MASK & ~(fl_hand.all_mask | Card.to_mask(dealt_cards))
+    )
     
     rec = get_recommendation(fl_hand, dealt_cards, remaining_deck)
     
@@ -203,8 +201,9 @@ def demo_solver_usage():
     ]
     
     # Get recommendation
-    used_cards = late_hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards and c not in dealt_cards]
+    remaining_deck = Card.from_mask(
+        DECK_MASK & ~(late_hand.all_mask | Card.to_mask(dealt_cards))
+    )
     
     rec = get_recommendation(late_hand, dealt_cards, remaining_deck)
     
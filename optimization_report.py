@@ -4,12 +4,13 @@ Provides detailed analysis, benchmarks, and recommendations for the optimized AP
 """
 
 import asyncio
-import json
 import time
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 from dataclasses import asdict
 
+import orjson
+
 from src.infrastructure.security.auth_algorithms import get_auth_service
 from src.infrastructure.algorithms.rate_limiting import get_rate_limit_manager
 from src.infrastructure.reliability.error_recovery import get_fault_tolerance
@@ -726,8 +727,12 @@ async def main():
     
     # Save detailed report to file
     try:
-        with open("api_optimization_report.json", "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        with open("api_optimization_report.json", "wb") as f:
+            f.write(orjson.dumps(
+                report,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
         print("📄 Detailed report saved to: api_optimization_report.json")
         
         # Also save markdown version
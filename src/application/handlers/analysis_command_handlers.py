@@ -1,7 +1,7 @@
 """Command handlers for analysis-related operations."""
 import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from uuid import UUID, uuid4
 from datetime import datetime
 
@@ -66,12 +66,7 @@ class RequestAnalysisCommandHandler(CommandHandler[CommandResult]):
                     )
             
             # Create analysis session
-            session = AnalysisSession.create(
-                position=command.position,
-                analysis_type=command.analysis_type,
-                calculation_depth=command.calculation_depth,
-                priority=command.priority
-            )
+            session = self._create_session(command)
             
             # Save the session
             await self.analysis_repository.save(session)
@@ -79,30 +74,7 @@ class RequestAnalysisCommandHandler(CommandHandler[CommandResult]):
             # Save the position for reference
             await self.position_repository.save(command.position)
             
-            # Publish domain event
-            session.add_event(AnalysisRequestedEvent(
-                session_id=session.id,
-                position=command.position,
-                analysis_type=command.analysis_type,
-                timestamp=command.timestamp
-            ))
-            
-            # Start async calculation
-            asyncio.create_task(self._perform_analysis(
-                session=session,
-                command=command
-            ))
-            
-            logger.info(f"Analysis requested: Session {session.id}")
-            
-            return CommandResult.ok(
-                data={
-                    "session_id": str(session.id),
-                    "status": "processing",
-                    "estimated_time_seconds": self._estimate_calculation_time(command)
-                },
-                command_id=command.command_id
-            )
+            return self._start_analysis(session, command)
             
         except Exception as e:
             logger.error(f"Failed to request analysis: {str(e)}")
@@ -111,6 +83,182 @@ class RequestAnalysisCommandHandler(CommandHandler[CommandResult]):
                 command_id=command.command_id
             )
     
+    async def handle_many(
+        self,
+        commands: List[RequestAnalysisCommand],
+        max_parallel: Optional[int] = None
+    ) -> List[CommandResult]:
+        """
+        Request analysis for several positions, persisting them in one batch.
+        
+        Sessions and positions are buffered and written with a single
+        save_many() per repository instead of one save() per command.
+        At most max_parallel cache lookups run at once (unbounded if None).
+        Each command gets its own result; one failing command doesn't fail
+        the others.
+        """
+        results: List[Optional[CommandResult]] = [None] * len(commands)
+        semaphore = asyncio.Semaphore(max_parallel or max(1, len(commands)))
+        
+        async def lookup(command: RequestAnalysisCommand) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._get_cached_strategy(command)
+        
+        # Check cache for every command concurrently; a failed lookup only
+        # fails its own command
+        cached = await asyncio.gather(
+            *(lookup(command) for command in commands),
+            return_exceptions=True
+        )
+        
+        pending = []
+        for i, (command, cached_strategy) in enumerate(zip(commands, cached)):
+            if isinstance(cached_strategy, Exception):
+                results[i] = self._failed(command, cached_strategy)
+            elif cached_strategy:
+                results[i] = CommandResult.ok(
+                    data={
+                        "strategy": cached_strategy,
+                        "cache_hit": True,
+                        "session_id": None
+                    },
+                    command_id=command.command_id
+                )
+            else:
+                try:
+                    pending.append((i, command, self._create_session(command)))
+                except Exception as e:
+                    results[i] = self._failed(command, e)
+        
+        # Sessions first, then positions for the sessions that were saved
+        errors = await self._save_each(
+            self.analysis_repository.save,
+            self.analysis_repository.save_many,
+            [session for _, _, session in pending]
+        )
+        pending = self._without_failed(pending, errors, results)
+        
+        errors = await self._save_each(
+            self.position_repository.save,
+            self.position_repository.save_many,
+            [command.position for _, command, _ in pending]
+        )
+        pending = self._without_failed(pending, errors, results)
+        
+        for i, command, session in pending:
+            try:
+                results[i] = self._start_analysis(session, command)
+            except Exception as e:
+                results[i] = self._failed(command, e)
+        
+        assert all(result is not None for result in results)
+        return [result for result in results if result is not None]
+    
+    @staticmethod
+    async def _save_each(
+        save: Callable[[Any], Awaitable[None]],
+        save_many: Callable[[List[Any]], Awaitable[None]],
+        items: List[Any]
+    ) -> List[Optional[Exception]]:
+        """
+        Save items in one batch, falling back to one save() per item if the
+        batch fails, so failures can be told apart. Returns each item's error.
+        """
+        if not items:
+            return []
+        try:
+            await save_many(items)
+            return [None] * len(items)
+        except Exception as e:
+            logger.warning(f"Batch save failed, saving individually: {str(e)}")
+        
+        errors: List[Optional[Exception]] = []
+        for item in items:
+            try:
+                await save(item)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+    
+    def _without_failed(
+        self,
+        pending: List[Any],
+        errors: List[Optional[Exception]],
+        results: List[Optional[CommandResult]]
+    ) -> List[Any]:
+        """
+        Record failed results and keep the (index, command, session) entries
+        that succeeded.
+        """
+        remaining = []
+        for entry, error in zip(pending, errors):
+            if error is None:
+                remaining.append(entry)
+            else:
+                results[entry[0]] = self._failed(entry[1], error)
+        return remaining
+    
+    @staticmethod
+    def _failed(command: RequestAnalysisCommand, error: Exception) -> CommandResult:
+        """Failed result for one command of a batch."""
+        logger.error(f"Failed to request analysis: {str(error)}")
+        return CommandResult.fail(
+            error=str(error),
+            command_id=command.command_id
+        )
+    
+    async def _get_cached_strategy(
+        self, command: RequestAnalysisCommand
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached strategy unless recalculation is forced."""
+        if command.force_recalculate:
+            return None
+        strategy: Optional[Dict[str, Any]] = await self.cache_manager.get_strategy(
+            command.position
+        )
+        return strategy
+    
+    def _create_session(self, command: RequestAnalysisCommand) -> AnalysisSession:
+        """Create the analysis session for a request."""
+        return AnalysisSession.create(
+            position=command.position,
+            analysis_type=command.analysis_type,
+            calculation_depth=command.calculation_depth,
+            priority=command.priority
+        )
+    
+    def _start_analysis(
+        self,
+        session: AnalysisSession,
+        command: RequestAnalysisCommand
+    ) -> CommandResult:
+        """Publish the request event and start the calculation for a saved session."""
+        # Publish domain event
+        session.add_event(AnalysisRequestedEvent(
+            session_id=session.id,
+            position=command.position,
+            analysis_type=command.analysis_type,
+            timestamp=command.timestamp
+        ))
+        
+        # Start async calculation
+        asyncio.create_task(self._perform_analysis(
+            session=session,
+            command=command
+        ))
+        
+        logger.info(f"Analysis requested: Session {session.id}")
+        
+        return CommandResult.ok(
+            data={
+                "session_id": str(session.id),
+                "status": "processing",
+                "estimated_time_seconds": self._estimate_calculation_time(command)
+            },
+            command_id=command.command_id
+        )
+    
     async def _perform_analysis(
         self,
         session: AnalysisSession,
@@ -307,30 +455,29 @@ class BatchAnalysisCommandHandler(CommandHandler[CommandResult]):
     async def handle(self, command: BatchAnalysisCommand) -> CommandResult:
         """Process batch analysis requests."""
         try:
-            session_ids = []
-            
-            # Create individual analysis requests with rate limiting
-            semaphore = asyncio.Semaphore(command.max_parallel)
-            
-            async def process_position(position):
-                async with semaphore:
-                    individual_command = RequestAnalysisCommand(
-                        position=position,
-                        analysis_type=command.analysis_type,
-                        priority=command.priority,
-                        user_id=command.user_id
-                    )
-                    result = await self.request_handler.handle(individual_command)
-                    if result.success and result.data.get("session_id"):
-                        return result.data["session_id"]
-                    return None
+            # Create individual analysis requests
+            individual_commands = []
+            for position in command.positions:
+                individual_command = RequestAnalysisCommand(
+                    position=position,
+                    analysis_type=command.analysis_type,
+                    priority=command.priority
+                )
+                individual_command.user_id = command.user_id
+                individual_commands.append(individual_command)
             
-            # Process all positions
-            tasks = [process_position(pos) for pos in command.positions]
-            results = await asyncio.gather(*tasks)
+            # Submit them together so sessions/positions are saved in one batch,
+            # with at most max_parallel requests in flight
+            results = await self.request_handler.handle_many(
+                individual_commands, max_parallel=command.max_parallel
+            )
             
-            # Filter out None results
-            session_ids = [sid for sid in results if sid is not None]
+            # Keep only the requests that started a session
+            session_ids = [
+                result.data["session_id"]
+                for result in results
+                if result.success and result.data.get("session_id")
+            ]
             
             logger.info(
                 f"Batch analysis started: {len(session_ids)} sessions created "
@@ -1,5 +1,6 @@
 """Command validators for ensuring command integrity."""
 from typing import Optional, Set
+import asyncio
 import re
 
 from ..commands.base import Command, CommandValidator
@@ -22,6 +23,15 @@ from ...domain.exceptions.validation_exceptions import ValidationException
 from ...domain.value_objects.card import Card, Rank, Suit
 
 
+# Lookup tables shared by all validator calls (built once at import)
+VALID_GAME_VARIANTS = ("standard", "pineapple", "progressive_pineapple")
+VALID_ANALYSIS_TYPES = ("optimal", "monte_carlo", "heuristic")
+VALID_ROWS = ("top", "middle", "bottom")
+ROW_CAPACITY = {"top": 3, "middle": 5, "bottom": 5}
+_VALID_RANKS = frozenset(Rank)
+_VALID_SUITS = frozenset(Suit)
+
+
 class CreateGameCommandValidator(CommandValidator):
     """Validator for CreateGameCommand."""
     
@@ -41,18 +51,19 @@ class CreateGameCommandValidator(CommandValidator):
         if len(set(command.player_ids)) != len(command.player_ids):
             raise ValidationException("Duplicate player IDs found")
         
-        # Validate each player exists
-        for player_id in command.player_ids:
-            player = await self.player_repository.get_by_id(player_id)
+        # Validate each player exists (lookups are independent)
+        players = await asyncio.gather(
+            *(self.player_repository.get_by_id(pid) for pid in command.player_ids)
+        )
+        for player_id, player in zip(command.player_ids, players):
             if not player:
                 raise ValidationException(f"Player not found: {player_id}")
         
         # Validate game variant
-        valid_variants = ["standard", "pineapple", "progressive_pineapple"]
-        if command.game_variant not in valid_variants:
+        if command.game_variant not in VALID_GAME_VARIANTS:
             raise ValidationException(
                 f"Invalid game variant: {command.game_variant}. "
-                f"Must be one of: {', '.join(valid_variants)}"
+                f"Must be one of: {', '.join(VALID_GAME_VARIANTS)}"
             )
         
         # Validate rules
@@ -74,8 +85,7 @@ class PlaceCardCommandValidator(CommandValidator):
             raise ValidationException("Game not found")
         
         # Validate player is in the game
-        player_ids = [p.id for p in game.players]
-        if command.player_id not in player_ids:
+        if not any(p.id == command.player_id for p in game.players):
             raise ValidationException("Player is not in this game")
         
         # Validate it's the player's turn
@@ -92,19 +102,17 @@ class PlaceCardCommandValidator(CommandValidator):
             raise ValidationException("Card is not available in the deck")
         
         # Validate position
-        valid_rows = ["top", "middle", "bottom"]
-        if command.position.row not in valid_rows:
+        if command.position.row not in VALID_ROWS:
             raise ValidationException(
                 f"Invalid row: {command.position.row}. "
-                f"Must be one of: {', '.join(valid_rows)}"
+                f"Must be one of: {', '.join(VALID_ROWS)}"
             )
         
         # Validate position index
         player = game.get_player(command.player_id)
         current_row_cards = len(player.get_row_cards(command.position.row))
-        max_cards = {"top": 3, "middle": 5, "bottom": 5}
         
-        if current_row_cards >= max_cards[command.position.row]:
+        if current_row_cards >= ROW_CAPACITY[command.position.row]:
             raise ValidationException(
                 f"{command.position.row.capitalize()} row is already full"
             )
@@ -112,8 +120,8 @@ class PlaceCardCommandValidator(CommandValidator):
     def _is_valid_card(self, card: Card) -> bool:
         """Check if card is valid."""
         return (
-            card.rank in Rank and
-            card.suit in Suit and
+            card.rank in _VALID_RANKS and
+            card.suit in _VALID_SUITS and
             not card.is_joker  # Standard OFC doesn't use jokers
         )
 
@@ -170,11 +178,10 @@ class RequestAnalysisCommandValidator(CommandValidator):
     async def validate(self, command: RequestAnalysisCommand) -> None:
         """Validate analysis request command."""
         # Validate analysis type
-        valid_types = ["optimal", "monte_carlo", "heuristic"]
-        if command.analysis_type not in valid_types:
+        if command.analysis_type not in VALID_ANALYSIS_TYPES:
             raise ValidationException(
                 f"Invalid analysis type: {command.analysis_type}. "
-                f"Must be one of: {', '.join(valid_types)}"
+                f"Must be one of: {', '.join(VALID_ANALYSIS_TYPES)}"
             )
         
         # Validate calculation depth
@@ -222,8 +229,7 @@ class BatchAnalysisCommandValidator(CommandValidator):
             )
         
         # Validate analysis type
-        valid_types = ["optimal", "monte_carlo", "heuristic"]
-        if command.analysis_type not in valid_types:
+        if command.analysis_type not in VALID_ANALYSIS_TYPES:
             raise ValidationException(
                 f"Invalid analysis type: {command.analysis_type}"
             )
@@ -271,8 +277,7 @@ class SubmitTrainingMoveCommandValidator(CommandValidator):
         if not command.position:
             raise ValidationException("Position is required")
         
-        valid_rows = ["top", "middle", "bottom"]
-        if command.position.row not in valid_rows:
+        if command.position.row not in VALID_ROWS:
             raise ValidationException(f"Invalid row: {command.position.row}")
 
 
@@ -24,6 +24,9 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = 10
     pool_timeout: int = 30
 
+    # Prepared statements cached per asyncpg connection
+    statement_cache_size: int = 1024
+
     @property
     def url(self) -> str:
         """Get the database URL."""
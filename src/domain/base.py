@@ -25,6 +25,8 @@ class ValueObject(ABC):
     They have no conceptual identity and should be side-effect free.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         """Value objects are equal if all their attributes are equal."""
         if not isinstance(other, self.__class__):
@@ -194,6 +196,16 @@ class Repository(ABC, Generic[T, EntityId]):
         """Save an entity to the repository."""
         pass
 
+    async def save_many(self, entities: List[T]) -> None:
+        """
+        Save several entities in one batch.
+
+        Defaults to one save() per entity; database-backed repositories
+        should override this with a multi-row insert.
+        """
+        for entity in entities:
+            await self.save(entity)
+
     @abstractmethod
     async def delete(self, entity: T) -> None:
         """Delete an entity from the repository."""
@@ -45,6 +45,9 @@ class Player(DomainEntity):
         # Cards in hand (not yet placed)
         self._hand_cards: List[Card] = []
 
+        # Running count of placed cards, so completeness is one int compare
+        self._total_placed = 0
+
         # Track if player has placed card this round
         self._placed_card_this_round = False
 
@@ -92,6 +95,15 @@ class Player(DomainEntity):
         """Get total number of cards placed in layout."""
         return len(self._top_row) + len(self._middle_row) + len(self._bottom_row)
 
+    @property
+    def placed_mask(self) -> int:
+        """Get the 52-bit deck mask of cards placed in layout."""
+        return (
+            Card.to_mask(self._top_row)
+            | Card.to_mask(self._middle_row)
+            | Card.to_mask(self._bottom_row)
+        )
+
     def receive_initial_cards(self, cards: List[Card]) -> None:
         """Receive initial dealing of cards."""
         if len(self._hand_cards) > 0:
@@ -172,6 +184,7 @@ class Player(DomainEntity):
         elif position == CardPosition.BOTTOM:
             self._bottom_row.append(card)
 
+        self._total_placed += 1
         self._placed_card_this_round = True
         self._increment_version()
 
@@ -214,7 +227,7 @@ class Player(DomainEntity):
 
     def is_layout_complete(self) -> bool:
         """Check if player has placed all 13 cards."""
-        return self.total_cards_placed == 13
+        return self._total_placed == 13
 
     def has_placed_card_this_round(self) -> bool:
         """Check if player has placed a card this round."""
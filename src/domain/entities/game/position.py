@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 
 from ...base import DomainEntity
 from ...value_objects import Card, GameRules, Hand, Move
+from ...value_objects.zobrist import TURN_KEYS, deck_key, placement_key, round_key
 from .player import PlayerId
 
 PositionId = str
@@ -50,6 +51,7 @@ class Position(DomainEntity):
 
         # Calculated properties (computed on demand)
         self._position_hash: Optional[str] = None
+        self._zobrist_hash: Optional[int] = None
         self._complexity_score: Optional[float] = None
 
     @property
@@ -139,6 +141,17 @@ class Position(DomainEntity):
             self._position_hash = self._calculate_position_hash()
         return self._position_hash
 
+    def get_zobrist_hash(self) -> int:
+        """
+        Get 64-bit Zobrist hash for this position.
+
+        Cheap integer key for transposition and cache lookups. Unlike
+        get_position_hash it identifies players by seat, not by ID.
+        """
+        if self._zobrist_hash is None:
+            self._zobrist_hash = self._calculate_zobrist_hash()
+        return self._zobrist_hash
+
     def get_complexity_score(self) -> float:
         """
         Get complexity score for this position.
@@ -192,7 +205,7 @@ class Position(DomainEntity):
         next_player_id = player_ids[(current_index + 1) % len(player_ids)]
 
         # Create new position
-        return Position(
+        new_position = Position(
             game_id=self._game_id,
             players_hands=new_hands,
             remaining_cards=new_remaining,
@@ -201,6 +214,17 @@ class Position(DomainEntity):
             rules=self._rules,
         )
 
+        # Update the Zobrist hash incrementally if it is already known
+        if self._zobrist_hash is not None:
+            zobrist = self._zobrist_hash
+            zobrist ^= TURN_KEYS[current_index]
+            zobrist ^= TURN_KEYS[(current_index + 1) % len(player_ids)]
+            if len(new_remaining) != len(self._remaining_cards):
+                zobrist ^= deck_key(move.card)
+            new_position._zobrist_hash = zobrist
+
+        return new_position
+
     def to_analysis_format(self) -> Dict:
         """Convert position to format suitable for analysis engines."""
         return {
@@ -260,6 +284,24 @@ class Position(DomainEntity):
         data_str = str(sorted(normalized_data.items()))
         return hashlib.md5(data_str.encode(), usedforsecurity=False).hexdigest()
 
+    def _calculate_zobrist_hash(self) -> int:
+        """Calculate Zobrist hash from scratch."""
+        zobrist = round_key(self._round_number)
+        for seat, (player_id, hand) in enumerate(self._players_hands.items()):
+            for slot, cards in (
+                ("top", hand.top_row),
+                ("middle", hand.middle_row),
+                ("bottom", hand.bottom_row),
+                ("hand", hand.hand_cards),
+            ):
+                for card in cards:
+                    zobrist ^= placement_key(card, seat, slot)
+            if player_id == self._current_player_id:
+                zobrist ^= TURN_KEYS[seat]
+        for card in self._remaining_cards:
+            zobrist ^= deck_key(card)
+        return zobrist
+
     def _calculate_complexity_score(self) -> float:
         """Calculate position complexity for analysis prioritization."""
         base_score = 1.0
@@ -0,0 +1,223 @@
+"""
+Cactus-Kev Hand Ranking Tables
+
+Lookup tables over Card.code (Cactus-Kev encoding) for ranking OFC rows
+without building HandRanking objects. 5-card hands get the standard
+1 (royal flush) .. 7462 (7-5-4-3-2) rank, lower is stronger. Rows are
+compared against the top row through a "top view" key: hand type plus the
+first three ranks ordered by multiplicity, which is exactly what
+HandRanking.compare_to looks at when one side has 3 cards.
+
+Tables are generated at import (a few milliseconds) rather than shipped.
+NumPy copies of the tables rank whole batches of hands at once.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..value_objects import Card
+from ..value_objects.hand_ranking import HandType
+
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_RANKS_DESC = tuple(range(12, -1, -1))  # Rank indices, ace (12) first
+
+# Straights by high card, ace-high first; the wheel plays 5-high
+_STRAIGHTS = tuple(
+    [0b11111 << (high - 4) for high in range(12, 3, -1)] + [0b1000000001111]
+)
+
+# Rank bits -> numeric rank of the straight's high card (0 = no straight)
+STRAIGHT_HIGHS = bytearray(1 << 13)
+for _high, _bits in zip(range(14, 4, -1), _STRAIGHTS):
+    STRAIGHT_HIGHS[_bits] = _high
+del _high, _bits
+
+# Rank bits (OR of card codes >> 16) -> rank, for flushes and no-pair hands
+_FLUSH_RANKS: Dict[int, int] = {}
+_UNIQUE_RANKS: Dict[int, int] = {}
+# Prime product -> rank, for hands with a paired rank
+_PAIRED_RANKS: Dict[int, int] = {}
+# Rank -> top-row comparison key
+_TOP_VIEW: List[int] = [0]
+# Rank -> HandRanking hand type, strength value and kickers
+_HAND_DETAILS: List[Tuple[HandType, int, Tuple[int, ...]]] = [
+    (HandType.HIGH_CARD, 0, ())
+]
+# Prime product of a 3-card top row -> top-row comparison key
+_TOP_KEYS: Dict[int, int] = {}
+
+
+def _top_key(hand_type: HandType, ordered: Sequence[int]) -> int:
+    """Pack hand type and first three multiplicity-ordered rank indices."""
+    return (hand_type.value << 12) | (ordered[0] << 8) | (ordered[1] << 4) | ordered[2]
+
+
+def _details(
+    hand_type: HandType, ordered: Sequence[int]
+) -> Tuple[HandType, int, Tuple[int, ...]]:
+    """Strength and kickers as HandEvaluator reports them, as numeric ranks."""
+    if hand_type in (HandType.STRAIGHT, HandType.STRAIGHT_FLUSH, HandType.ROYAL_FLUSH):
+        return hand_type, STRAIGHT_HIGHS[sum(1 << rank for rank in ordered)], ()
+    # Distinct ranks by multiplicity: the strength rank, then the kickers
+    distinct = list(dict.fromkeys(ordered))
+    return hand_type, distinct[0] + 2, tuple(rank + 2 for rank in distinct[1:])
+
+
+def _bits_ranks(bits: int) -> List[int]:
+    """Rank indices set in a rank bit pattern, highest first."""
+    return [rank for rank in _RANKS_DESC if bits >> rank & 1]
+
+
+def _product(ranks: Sequence[int]) -> int:
+    product = 1
+    for rank in ranks:
+        product *= _PRIMES[rank]
+    return product
+
+
+def _build_tables() -> None:
+    """Fill the tables in rank order (strongest first)."""
+    straights = set(_STRAIGHTS)
+    high_cards = [
+        sum(1 << rank for rank in ranks)
+        for ranks in combinations(_RANKS_DESC, 5)
+        if sum(1 << rank for rank in ranks) not in straights
+    ]
+
+    def add_paired(hand_type: HandType, ordered: List[int]) -> None:
+        _PAIRED_RANKS[_product(ordered)] = len(_TOP_VIEW)
+        _TOP_VIEW.append(_top_key(hand_type, ordered))
+        _HAND_DETAILS.append(_details(hand_type, ordered))
+
+    def add_bits(
+        table: Dict[int, int], hand_type: HandType, bits: int, ordered: List[int]
+    ) -> None:
+        table[bits] = len(_TOP_VIEW)
+        _TOP_VIEW.append(_top_key(hand_type, ordered))
+        _HAND_DETAILS.append(_details(hand_type, ordered))
+
+    for bits in _STRAIGHTS:
+        royal = bits == _STRAIGHTS[0]
+        hand_type = HandType.ROYAL_FLUSH if royal else HandType.STRAIGHT_FLUSH
+        add_bits(_FLUSH_RANKS, hand_type, bits, _bits_ranks(bits))
+    for quad in _RANKS_DESC:
+        for kicker in _RANKS_DESC:
+            if kicker != quad:
+                add_paired(HandType.FOUR_OF_A_KIND, [quad] * 4 + [kicker])
+    for trips in _RANKS_DESC:
+        for pair in _RANKS_DESC:
+            if pair != trips:
+                add_paired(HandType.FULL_HOUSE, [trips] * 3 + [pair] * 2)
+    for bits in high_cards:
+        add_bits(_FLUSH_RANKS, HandType.FLUSH, bits, _bits_ranks(bits))
+    for bits in _STRAIGHTS:
+        add_bits(_UNIQUE_RANKS, HandType.STRAIGHT, bits, _bits_ranks(bits))
+    for trips in _RANKS_DESC:
+        others = [rank for rank in _RANKS_DESC if rank != trips]
+        for kickers in combinations(others, 2):
+            add_paired(HandType.THREE_OF_A_KIND, [trips] * 3 + list(kickers))
+    for high, low in combinations(_RANKS_DESC, 2):
+        for kicker in _RANKS_DESC:
+            if kicker not in (high, low):
+                add_paired(HandType.TWO_PAIR, [high] * 2 + [low] * 2 + [kicker])
+    for pair in _RANKS_DESC:
+        others = [rank for rank in _RANKS_DESC if rank != pair]
+        for pair_kickers in combinations(others, 3):
+            add_paired(HandType.PAIR, [pair] * 2 + list(pair_kickers))
+    for bits in high_cards:
+        add_bits(_UNIQUE_RANKS, HandType.HIGH_CARD, bits, _bits_ranks(bits))
+
+    # 3-card top rows: trips, pairs, high cards
+    for rank in _RANKS_DESC:
+        _TOP_KEYS[_PRIMES[rank] ** 3] = _top_key(HandType.THREE_OF_A_KIND, [rank] * 3)
+        for kicker in _RANKS_DESC:
+            if kicker != rank:
+                ordered = [rank, rank, kicker]
+                _TOP_KEYS[_product(ordered)] = _top_key(HandType.PAIR, ordered)
+    for ranks in combinations(_RANKS_DESC, 3):
+        _TOP_KEYS[_product(ranks)] = _top_key(HandType.HIGH_CARD, ranks)
+
+
+_build_tables()
+
+# Array forms for batch ranking: rank bits index the flush/unique tables
+# directly (0 = no entry), prime products are found by binary search
+_FLUSH_ARRAY = np.zeros(1 << 13, dtype=np.int64)
+_FLUSH_ARRAY[list(_FLUSH_RANKS)] = list(_FLUSH_RANKS.values())
+_UNIQUE_ARRAY = np.zeros(1 << 13, dtype=np.int64)
+_UNIQUE_ARRAY[list(_UNIQUE_RANKS)] = list(_UNIQUE_RANKS.values())
+_PAIRED_PRODUCTS = np.array(sorted(_PAIRED_RANKS), dtype=np.int64)
+_PAIRED_ARRAY = np.array([_PAIRED_RANKS[p] for p in _PAIRED_PRODUCTS], dtype=np.int64)
+_TOP_PRODUCTS = np.array(sorted(_TOP_KEYS), dtype=np.int64)
+_TOP_ARRAY = np.array([_TOP_KEYS[p] for p in _TOP_PRODUCTS], dtype=np.int64)
+
+
+def five_card_rank(cards: Sequence[Card]) -> int:
+    """Rank a 5-card hand, 1 (royal flush) .. 7462 (7-5-4-3-2 offsuit)."""
+    c1, c2, c3, c4, c5 = (card.code for card in cards)
+    bits = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _FLUSH_RANKS[bits]
+    rank = _UNIQUE_RANKS.get(bits)
+    if rank is not None:
+        return rank
+    return _PAIRED_RANKS[
+        (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+    ]
+
+
+def top_view(rank: int) -> int:
+    """Get the top-row comparison key of a 5-card rank (higher is stronger)."""
+    return _TOP_VIEW[rank]
+
+
+def hand_details(rank: int) -> Tuple[HandType, int, Tuple[int, ...]]:
+    """Get the hand type, strength value and kickers of a 5-card rank."""
+    return _HAND_DETAILS[rank]
+
+
+def top_row_key(cards: Sequence[Card]) -> int:
+    """Get the comparison key of a 3-card top row (higher is stronger)."""
+    c1, c2, c3 = (card.code for card in cards)
+    return _TOP_KEYS[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF)]
+
+
+def _fold(held: Sequence[Card]) -> Tuple[int, int, int]:
+    """OR, AND and prime product of the held cards' codes."""
+    held_or, held_and, product = 0, -1, 1
+    for card in held:
+        held_or |= card.code
+        held_and &= card.code
+        product *= card.code & 0xFF
+    return held_or, held_and, product
+
+
+def five_card_ranks(codes: np.ndarray, held: Sequence[Card] = ()) -> NDArray[np.int64]:
+    """
+    Rank an (n, 5) array of card codes; same values as five_card_rank.
+
+    Cards common to every hand can be passed as held, with codes holding
+    only the (n, 5 - len(held)) cards that vary; they are folded in once.
+    """
+    held_or, held_and, held_product = _fold(held)
+    codes = np.asarray(codes, dtype=np.int64)
+    bits = (np.bitwise_or.reduce(codes, axis=1) | held_or) >> 16
+    flush = (np.bitwise_and.reduce(codes, axis=1) & held_and & 0xF000) != 0
+    ranks = np.where(flush, _FLUSH_ARRAY[bits], _UNIQUE_ARRAY[bits])
+
+    paired = ranks == 0
+    if paired.any():
+        products = np.prod(codes[paired] & 0xFF, axis=1) * held_product
+        ranks[paired] = _PAIRED_ARRAY[np.searchsorted(_PAIRED_PRODUCTS, products)]
+    return np.asarray(ranks, dtype=np.int64)
+
+
+def top_row_keys(codes: np.ndarray, held: Sequence[Card] = ()) -> NDArray[np.int64]:
+    """Get top-row keys for an (n, 3) array of card codes, like top_row_key."""
+    held_product = _fold(held)[2]
+    products = np.prod(np.asarray(codes, dtype=np.int64) & 0xFF, axis=1)
+    keys = _TOP_ARRAY[np.searchsorted(_TOP_PRODUCTS, products * held_product)]
+    return np.asarray(keys, dtype=np.int64)
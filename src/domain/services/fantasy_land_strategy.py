@@ -5,13 +5,154 @@ MVP implementation for analyzing Fantasy Land entry strategies.
 Focuses on simple heuristics and basic EV calculation.
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 from collections import Counter
+from itertools import combinations
+
+import numpy as np
 
 from ..base import DomainService
 from ..value_objects import Card, Rank
 from .pineapple_evaluator import PineappleHandEvaluator
 
+# Fantasy Land deals 14 cards: 3 top, 5 middle, 5 bottom, 1 discard
+FL_CARD_COUNT = 14
+
+# Row score category -> Pineapple royalties (indices match HandType values)
+_MIDDLE_ROYALTIES = np.array([0, 0, 0, 2, 4, 8, 12, 20, 30, 50], dtype=np.int32)
+_BOTTOM_ROYALTIES = np.array([0, 0, 0, 0, 2, 4, 6, 10, 15, 25], dtype=np.int32)
+
+# Sum of per-card rank multiplicities identifies the paired hand type, per
+# row size (e.g. two pair: 2+2+2+2+1 = 9, but 3-card trips is also 9)
+_CATEGORY_BY_COUNT_SUM = {
+    3: np.zeros(10, dtype=np.int64),
+    5: np.zeros(18, dtype=np.int64),
+}
+_CATEGORY_BY_COUNT_SUM[3][[3, 5, 9]] = [0, 1, 3]
+_CATEGORY_BY_COUNT_SUM[5][[5, 7, 9, 11, 13, 17]] = [0, 1, 2, 3, 6, 7]
+
+_WHEEL_BITS = 0b1000000001111  # A-2-3-4-5
+_BROADWAY_BITS = 0b1111100000000  # T-J-Q-K-A
+
+# Street row priorities (top, middle, bottom), indexed by [street][top open]:
+# early streets chase the top row for FL while it has under 2 cards, street 2
+# balances, and later streets protect the bottom against fouling
+_EARLY_PRIORITIES = (0.7, 0.2, 0.1)
+_BALANCED_PRIORITIES = (0.4, 0.4, 0.2)
+_LATE_PRIORITIES = (0.1, 0.3, 0.6)
+_STREET_PRIORITIES = (
+    (_LATE_PRIORITIES, _EARLY_PRIORITIES),
+    (_LATE_PRIORITIES, _EARLY_PRIORITIES),
+    (_BALANCED_PRIORITIES, _BALANCED_PRIORITIES),
+    (_LATE_PRIORITIES, _LATE_PRIORITIES),
+    (_LATE_PRIORITIES, _LATE_PRIORITIES),
+)
+
+# Numeric rank values and their bit shifts within one suit of a deck mask
+_RANK_VALUES = np.arange(2, 15)
+_RANK_SHIFTS = np.arange(13, dtype=np.uint64)
+
+# Partition table, built on first use (see _fl_partitions)
+_PARTITIONS: Optional[Dict[str, np.ndarray]] = None
+
+
+def _combination_table(n: int, k: int) -> np.ndarray:
+    """All k-subsets of range(n) as rows of indices."""
+    return np.array(list(combinations(range(n), k)), dtype=np.int64)
+
+
+def _fl_partitions() -> Dict[str, np.ndarray]:
+    """
+    Get every way to split 14 card slots into top/two 5-card rows/discard.
+
+    The two 5-card rows are stored as an unordered pair; the stronger one
+    is assigned to the bottom per deal, which halves the table to ~504k rows.
+    """
+    global _PARTITIONS
+    if _PARTITIONS is not None:
+        return _PARTITIONS
+
+    full_mask = (1 << FL_CARD_COUNT) - 1
+    subsets5 = _combination_table(FL_CARD_COUNT, 5)
+    subsets3 = _combination_table(FL_CARD_COUNT, 3)
+    index5 = np.full(full_mask + 1, -1, dtype=np.int64)
+    index5[(1 << subsets5).sum(axis=1)] = np.arange(len(subsets5))
+    index3 = np.full(full_mask + 1, -1, dtype=np.int64)
+    index3[(1 << subsets3).sum(axis=1)] = np.arange(len(subsets3))
+
+    # For each 5-subset A, enumerate 5-subsets B of the 9 slots left over
+    in_a = np.zeros((len(subsets5), FL_CARD_COUNT), dtype=bool)
+    np.put_along_axis(in_a, subsets5, True, axis=1)
+    leftover = np.argsort(in_a, axis=1, kind="stable")[:, : FL_CARD_COUNT - 5]
+    b_slots = leftover[:, _combination_table(FL_CARD_COUNT - 5, 5)]
+    b_index = index5[(1 << b_slots).sum(axis=2)]
+    a_index = np.broadcast_to(np.arange(len(subsets5))[:, None], b_index.shape)
+    keep = a_index < b_index
+    a_index, b_index = a_index[keep], b_index[keep]
+
+    # The 4 slots left give 4 choices of discard; the other 3 go on top
+    rest = full_mask ^ (1 << subsets5[a_index]).sum(axis=1)
+    rest ^= (1 << subsets5[b_index]).sum(axis=1)
+    top, discard = [], []
+    remaining = rest.copy()
+    for _ in range(4):
+        low = remaining & -remaining
+        top.append(index3[rest ^ low])
+        discard.append(np.log2(low).astype(np.int64))
+        remaining ^= low
+
+    _PARTITIONS = {
+        "subsets3": subsets3,
+        "subsets5": subsets5,
+        "top": np.concatenate(top),
+        "pair_a": np.tile(a_index, 4),
+        "pair_b": np.tile(b_index, 4),
+        "discard": np.concatenate(discard),
+    }
+    return _PARTITIONS
+
+
+def _score_rows(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score many rows of Cactus-Kev card codes at once.
+
+    Args:
+        codes: int64[rows, 3 or 5] card codes
+
+    Returns:
+        (comparable key, hand type value, primary rank) per row; keys of 3-
+        and 5-card rows are comparable for foul checks
+    """
+    card_count = codes.shape[1]
+    ranks = (codes >> 8) & 0xF
+    counts = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2)
+
+    # Cards ordered by (multiplicity, rank) descending give the tiebreak
+    order = np.sort(counts * 16 + ranks, axis=1)[:, ::-1]
+    ordered_ranks = (order & 0xF) + 2
+    packed = np.zeros(len(codes), dtype=np.int64)
+    for i in range(card_count):
+        packed |= ordered_ranks[:, i] << (4 * (4 - i))
+
+    category = _CATEGORY_BY_COUNT_SUM[card_count][counts.sum(axis=1)]
+    if card_count == 5:
+        rank_bits = np.bitwise_or.reduce(1 << ranks, axis=1)
+        unpaired = counts.max(axis=1) == 1
+        wheel = rank_bits == _WHEEL_BITS
+        straight = unpaired & (
+            ((rank_bits // (rank_bits & -rank_bits)) == 0b11111) | wheel
+        )
+        flush = (np.bitwise_and.reduce(codes, axis=1) & 0xF000) != 0
+        category = np.where(straight, 4, category)
+        category = np.where(flush, 5, category)
+        category = np.where(straight & flush, 8, category)
+        category = np.where(
+            straight & flush & (rank_bits == _BROADWAY_BITS), 9, category
+        )
+        packed = np.where(wheel & straight, 0x54321, packed)
+
+    return (category << 20) | packed, category, ordered_ranks[:, 0]
+
 
 class FantasyLandStrategyAnalyzer(DomainService):
     """
@@ -32,6 +173,10 @@ class FantasyLandStrategyAnalyzer(DomainService):
         self.FL_ENTRY_BONUS = 10.0  # Conservative estimate
         self.QQ_PROBABILITY_THRESHOLD = 0.15  # Min probability to pursue
 
+        # Top-row analysis only depends on ranks (a 3-card top has no
+        # straights/flushes), so it is cached by rank multiset
+        self._top_row_cache: Dict[Tuple[Tuple[int, ...], int, int], Dict] = {}
+
     def analyze_top_row_placement(
         self,
         current_top: List[Card],
@@ -58,6 +203,15 @@ class FantasyLandStrategyAnalyzer(DomainService):
         if len(current_top) >= 3:
             return analysis  # Row full
 
+        cache_key = (
+            tuple(sorted(card.rank.numeric_value for card in current_top)),
+            candidate_card.rank.numeric_value,
+            remaining_streets,
+        )
+        cached = self._top_row_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         # Simulate placing the card
         test_top = current_top + [candidate_card]
 
@@ -81,7 +235,75 @@ class FantasyLandStrategyAnalyzer(DomainService):
         else:
             analysis["recommendation"] = ev / 10.0  # Normalize
 
-        return analysis
+        self._top_row_cache[cache_key] = analysis
+        return analysis.copy()
+
+    def analyze_top_row_placement_batch(
+        self,
+        top_masks: np.ndarray,
+        candidate_ranks: np.ndarray,
+        remaining_streets: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Analyze many top-row placements at once.
+
+        Vectorized analyze_top_row_placement for scenario sweeps. Current
+        top rows are 52-bit deck masks (see Card.to_mask) and candidates
+        are numeric ranks, as the analysis only looks at ranks.
+
+        Returns the same four scores, one array entry per scenario.
+        """
+        masks = np.asarray(top_masks, dtype=np.uint64)
+        candidates = np.asarray(candidate_ranks, dtype=np.int64)
+        streets = np.asarray(remaining_streets, dtype=np.int64)
+
+        # Rank counts of each top row after placing the candidate
+        counts = np.zeros((len(masks), 13), dtype=np.int64)
+        for suit_index in range(4):
+            suit_bits = (masks >> np.uint64(suit_index * 13)) & np.uint64(0x1FFF)
+            counts += ((suit_bits[:, None] >> _RANK_SHIFTS) & np.uint64(1)).astype(
+                np.int64
+            )
+        open_rows = counts.sum(axis=1) < 3
+        counts[np.arange(len(masks)), candidates - 2] += 1
+        size = counts.sum(axis=1)
+
+        pair_rank = np.where(counts >= 2, _RANK_VALUES, 0).max(axis=1, initial=0)
+        high_cards = counts[:, 10:].sum(axis=1)  # Q, K, A
+
+        # FL probability (see _calculate_fl_probability)
+        opportunities = np.minimum(3 - size, streets * 2)
+        draw_prob = np.select([high_cards == 0, high_cards == 1], [0.05, 0.15], 0.25)
+        qualified = (counts.max(axis=1) == 3) | (pair_rank >= 12)
+        fl_prob = np.where(
+            size >= 3,
+            qualified.astype(np.float64),
+            np.where(pair_rank >= 12, 0.95, np.minimum(draw_prob * opportunities, 0.8)),
+        )
+
+        # Foul risk (see _assess_foul_risk)
+        risk = candidates / 14.0 * 0.4
+        risk = np.minimum(np.where(size == 2, risk * 1.5, risk), 0.9)
+        risk = np.where((size >= 2) & (pair_rank >= 10), 0.2, risk)
+
+        ev = (fl_prob * self.FL_ENTRY_BONUS) - (risk * self.FOUL_PENALTY)
+        recommendation = np.select(
+            [(fl_prob >= self.QQ_PROBABILITY_THRESHOLD) & (risk < 0.3), risk > 0.5],
+            [np.minimum(1.0, fl_prob * 2), -1.0],
+            ev / 10.0,
+        )
+
+        # Full rows score zero, as in the single-scenario analysis
+        return {
+            "fl_probability": np.where(open_rows, fl_prob, 0.0),
+            "risk_score": np.where(open_rows, risk, 0.0),
+            "ev_score": np.where(open_rows, ev, 0.0),
+            "recommendation": np.where(open_rows, recommendation, 0.0),
+        }
+
+    def clear_cache(self) -> None:
+        """Clear the top-row analysis cache (e.g. after tuning the weights)."""
+        self._top_row_cache.clear()
 
     def _calculate_fl_probability(
         self,
@@ -175,16 +397,14 @@ class FantasyLandStrategyAnalyzer(DomainService):
     def recommend_fantasy_land_play(
         self,
         dealt_cards: List[Card],
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Recommend optimal play for Fantasy Land (14 cards).
 
-        Simple algorithm:
-        1. Find best bottom row (5 cards)
-        2. Find best middle row from remaining
-        3. Place rest in top, verify QQ+ for staying
+        Picks the non-fouling split with the most royalties, counting
+        FL_ENTRY_BONUS when the rows qualify to stay in Fantasy Land.
         """
-        recommendation = {
+        recommendation: Dict[str, Any] = {
             "top": [],
             "middle": [],
             "bottom": [],
@@ -209,52 +429,51 @@ class FantasyLandStrategyAnalyzer(DomainService):
         """
         Find best card combination for Fantasy Land.
 
-        Simplified: Try a few good combinations, not exhaustive search.
+        Exhaustive search over every non-fouling top/middle/bottom/discard
+        split, maximizing Pineapple royalties plus FL_ENTRY_BONUS for
+        staying. All 5- and 3-card subsets are scored once, then combined
+        through a precomputed partition table in a single NumPy pass.
         """
-        # This is a simplified version
-        # In practice, would need more sophisticated algorithm
-
-        # For MVP, just return a valid combination
-        if len(cards) != 14:
+        if len(cards) != FL_CARD_COUNT:
             return []
 
-        # Sort by rank for easier processing
-        sorted_cards = sorted(cards, key=lambda c: c.rank.numeric_value, reverse=True)
-
-        # Simple heuristic: put high pairs in top for staying
-        # Put flush/straight potential in middle/bottom
+        partitions = _fl_partitions()
+        codes = np.array([card.code for card in cards], dtype=np.int64)
+        key3, type3, rank3 = _score_rows(codes[partitions["subsets3"]])
+        key5, type5, _ = _score_rows(codes[partitions["subsets5"]])
 
-        result = {
-            "top": sorted_cards[:3],
-            "middle": sorted_cards[3:8],
-            "bottom": sorted_cards[8:13],
-            "discarded": sorted_cards[13],
-            "can_stay": False,
-            "expected_royalties": 0,
-        }
+        pair_a, pair_b = partitions["pair_a"], partitions["pair_b"]
+        a_weaker = key5[pair_a] <= key5[pair_b]
+        middle = np.where(a_weaker, pair_a, pair_b)
+        bottom = np.where(a_weaker, pair_b, pair_a)
+        top = partitions["top"]
 
-        # Check if can stay
-        top_eval = self.evaluator.evaluate_hand(result["top"])
-        middle_eval = self.evaluator.evaluate_hand(result["middle"])
-        bottom_eval = self.evaluator.evaluate_hand(result["bottom"])
-
-        # Calculate royalties
+        # Top royalties: 66 = 1 ... AA = 9, 222 = 10 ... AAA = 22
+        top_royalties = np.where(
+            type3 == 3, rank3 + 8, np.where((type3 == 1) & (rank3 >= 6), rank3 - 5, 0)
+        )
         royalties = (
-            top_eval.royalty_bonus
-            + middle_eval.royalty_bonus
-            + bottom_eval.royalty_bonus
+            top_royalties[top]
+            + _MIDDLE_ROYALTIES[type5[middle]]
+            + _BOTTOM_ROYALTIES[type5[bottom]]
         )
-        result["expected_royalties"] = royalties
+        can_stay = (type3[top] == 3) | (type5[middle] >= 6) | (type5[bottom] >= 7)
+
+        value = royalties + can_stay * self.FL_ENTRY_BONUS
+        value = np.where(key3[top] <= key5[middle], value, -np.inf)
+        best = int(np.argmax(value))
 
-        # Check stay conditions (simplified)
-        from ..value_objects.hand_ranking import HandType
+        def row(subsets: np.ndarray, index: np.ndarray) -> List[Card]:
+            return [cards[i] for i in subsets[index[best]]]
 
-        if (
-            top_eval.hand_type == HandType.THREE_OF_A_KIND
-            or middle_eval.hand_type.value >= HandType.FULL_HOUSE.value
-            or bottom_eval.hand_type.value >= HandType.FOUR_OF_A_KIND.value
-        ):
-            result["can_stay"] = True
+        result = {
+            "top": row(partitions["subsets3"], top),
+            "middle": row(partitions["subsets5"], middle),
+            "bottom": row(partitions["subsets5"], bottom),
+            "discarded": cards[partitions["discard"][best]],
+            "can_stay": bool(can_stay[best]),
+            "expected_royalties": int(royalties[best]),
+        }
 
         return [result]
 
@@ -268,30 +487,8 @@ class FantasyLandStrategyAnalyzer(DomainService):
 
         Returns priority scores for top/middle/bottom.
         """
-        priorities = {
-            "top": 0.0,
-            "middle": 0.0,
-            "bottom": 0.0,
-        }
-
-        remaining_streets = 4 - street
-
-        # Early streets: prioritize top for FL
-        if street <= 1 and len(current_state.get("top", [])) < 2:
-            priorities["top"] = 0.7
-            priorities["middle"] = 0.2
-            priorities["bottom"] = 0.1
-
-        # Middle streets: balance
-        elif street == 2:
-            priorities["top"] = 0.4
-            priorities["middle"] = 0.4
-            priorities["bottom"] = 0.2
-
-        # Late streets: avoid fouling
-        else:
-            priorities["top"] = 0.1
-            priorities["middle"] = 0.3
-            priorities["bottom"] = 0.6
+        # Streets before 0 play like the first, streets after 4 like the last
+        street_row = _STREET_PRIORITIES[min(max(street, 0), 4)]
+        top, middle, bottom = street_row[len(current_state.get("top", [])) < 2]
 
-        return priorities
+        return {"top": top, "middle": middle, "bottom": bottom}
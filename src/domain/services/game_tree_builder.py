@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple
 from itertools import combinations
 import uuid
 
+import numpy as np
+
 from ..base import DomainService
 from ..value_objects import Card
 from ..value_objects.game_tree_node import GameTreeNode, NodeAction
@@ -20,6 +22,103 @@ from .tree_pruning import TreePruning
 from .transposition_table import TranspositionTable, PositionKey
 
 
+class NodeStore(dict):
+    """
+    Node storage that mirrors per-node scalars into NumPy columns.
+
+    Still a Dict[str, GameTreeNode] for traversal and pruning, but depth,
+    cards placed, dealt cards (Cactus-Kev codes) and status flags are also
+    kept in parallel arrays, one row per node, so tree-wide statistics are
+    vectorized reductions instead of walks over node objects.
+    """
+
+    # Bits in the flags column; removed nodes have no bits set
+    LIVE = 1
+    TERMINAL = 2
+    FOULED = 4
+    LEAF = 8
+
+    def __init__(self, capacity: int = 1024):
+        super().__init__()
+        self._rows: Dict[str, int] = {}
+        # Node id of every row ever used; rows are never compacted
+        self._ids: List[str] = []
+        self.size = 0
+        self.depth = np.zeros(capacity, dtype=np.int32)
+        self.cards_placed = np.zeros(capacity, dtype=np.int8)
+        self.dealt_cards = np.zeros((capacity, 3), dtype=np.int32)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+
+    def __setitem__(self, node_id: str, node: GameTreeNode) -> None:
+        row = self._rows.get(node_id)
+        if row is None:
+            if self.size == len(self.flags):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self._rows[node_id] = row
+            self._ids.append(node_id)
+
+        self.depth[row] = node.depth
+        self.cards_placed[row] = node.cards_placed
+        # Rows are reused for updates, so unused slots are always cleared
+        codes = [card.code for card in node.dealt_cards or ()]
+        self.dealt_cards[row] = 0
+        self.dealt_cards[row, : len(codes)] = codes
+        self.flags[row] = (
+            self.LIVE
+            | (self.TERMINAL if node.is_terminal else 0)
+            | (self.FOULED if node.is_fouled else 0)
+            | (self.LEAF if node.is_leaf else 0)
+        )
+        super().__setitem__(node_id, node)
+
+    def __delitem__(self, node_id: str) -> None:
+        super().__delitem__(node_id)
+        self.flags[self._rows.pop(node_id)] = 0
+
+    def row(self, node_id: str) -> int:
+        """Get the column row index of a node."""
+        return self._rows[node_id]
+
+    def count(self, flag: int) -> int:
+        """Count stored nodes with a flag set."""
+        return int(np.count_nonzero(self.flags[: self.size] & flag))
+
+    def max_depth(self) -> int:
+        """Get the deepest stored node's depth."""
+        live = (self.flags[: self.size] & self.LIVE) != 0
+        return int(self.depth[: self.size][live].max(initial=0))
+
+    def dump(self, path: str) -> None:
+        """Save the live nodes' columns to a compressed .npz file."""
+        live = (self.flags[: self.size] & self.LIVE) != 0
+        node_ids = np.array(self._ids, dtype=np.str_)
+        np.savez_compressed(
+            path,
+            node_id=node_ids[live],
+            depth=self.depth[: self.size][live],
+            cards_placed=self.cards_placed[: self.size][live],
+            dealt_cards=self.dealt_cards[: self.size][live],
+            flags=self.flags[: self.size][live],
+        )
+
+    def _grow(self) -> None:
+        """Double column capacity; new rows start zeroed."""
+        capacity = len(self.flags) * 2
+        self.depth = self._grown(self.depth, capacity)
+        self.cards_placed = self._grown(self.cards_placed, capacity)
+        self.dealt_cards = self._grown(self.dealt_cards, capacity)
+        self.flags = self._grown(self.flags, capacity)
+
+    @staticmethod
+    def _grown(column: np.ndarray, capacity: int) -> np.ndarray:
+        """Copy a column into a zero-filled one with more rows."""
+        grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+        grown[: len(column)] = column
+        return grown
+
+
 class GameTreeBuilder(DomainService):
     """
     Builds game decision trees for Pineapple OFC positions.
@@ -31,10 +130,13 @@ class GameTreeBuilder(DomainService):
     def __init__(self, evaluator: Optional[PineappleHandEvaluator] = None):
         """Initialize with hand evaluator."""
         self.evaluator = evaluator or PineappleHandEvaluator()
-        self.nodes: Dict[str, GameTreeNode] = {}  # Node storage
+        self.nodes = NodeStore()  # Node storage
         self.actions: Dict[str, NodeAction] = {}  # Action storage
         self._node_counter = 0
 
+        # Fouling only depends on the three rows, reached by many paths
+        self._foul_cache: Dict[Tuple[int, int, int], bool] = {}
+
         # Additional services
         self.traversal = TreeTraversal(self.nodes, self.actions)
         self.pruning = TreePruning(self.nodes, self.actions, self.traversal)
@@ -118,6 +220,7 @@ class GameTreeBuilder(DomainService):
         self.nodes[node.node_id] = updated_node
 
         children_ids = []  # Track children we create
+        new_deck = remaining_deck[3:]  # Remove dealt cards
 
         # Create child nodes for each possible action
         for i, (card1, card2) in enumerate(possible_placements):
@@ -132,7 +235,9 @@ class GameTreeBuilder(DomainService):
 
             # Check for transposition (if enabled)
             if self.transposition:
-                position_key = PositionKey.from_hand(child_hand, node.cards_placed + 2)
+                position_key = PositionKey.from_hand(
+                    child_hand, node.cards_placed + 2, new_deck
+                )
                 existing_node_id = self.transposition.lookup(position_key)
 
                 if existing_node_id and existing_node_id in self.nodes:
@@ -165,7 +270,6 @@ class GameTreeBuilder(DomainService):
 
             # Store in transposition table (if enabled)
             if self.transposition:
-                position_key = PositionKey.from_hand(child_hand, node.cards_placed + 2)
                 self.transposition.store(position_key, child_id)
 
             # Create action
@@ -185,7 +289,6 @@ class GameTreeBuilder(DomainService):
             children_ids.append(child_id)
 
             # Recursively expand child
-            new_deck = remaining_deck[3:]  # Remove dealt cards
             self._expand_node(child, new_deck, remaining_depth - 1)
 
         # After all children created, update parent node with children IDs
@@ -226,32 +329,26 @@ class GameTreeBuilder(DomainService):
         if len(available_positions) < 2:
             return None
 
-        # First, add cards to hand_cards (they need to be available to place)
-        # This is a bit hacky for MVP but works
-        new_hand = Hand.from_layout(
-            top=list(hand.top_row),
-            middle=list(hand.middle_row),
-            bottom=list(hand.bottom_row),
-            hand=list(cards),  # Add the cards to be placed
-        )
-
         # For MVP, just try first available positions
         # (In real solver, we'd try all combinations)
-        position_idx = 0
-
-        for card in cards:
-            if position_idx >= len(available_positions):
-                return None
-
-            position = available_positions[position_idx]
-            try:
-                new_hand = new_hand.place_card(card, position)
-                position_idx += 1
-            except Exception as e:
-                print(f"DEBUG: Exception placing {card} at {position}: {e}")
-                return None
+        if len(cards) > len(available_positions):
+            return None
 
-        return new_hand
+        added: Dict[CardPosition, List[Card]] = {
+            CardPosition.TOP: [],
+            CardPosition.MIDDLE: [],
+            CardPosition.BOTTOM: [],
+        }
+        for card, position in zip(cards, available_positions):
+            added[position].append(card)
+
+        # One new Hand with every card added; no cards are left in hand
+        return hand.with_added(
+            top=added[CardPosition.TOP],
+            middle=added[CardPosition.MIDDLE],
+            bottom=added[CardPosition.BOTTOM],
+            hand_cards=[],
+        )
 
     def _check_fouled(self, hand: Hand) -> bool:
         """
@@ -259,17 +356,23 @@ class GameTreeBuilder(DomainService):
 
         MVP: Simple check - just validate row strengths.
         """
-        if not hand.is_complete:
-            return False
-
         # Need complete rows to evaluate (3 for top, 5 for middle/bottom)
-        if (
-            len(hand.top_row) != 3
-            or len(hand.middle_row) != 5
-            or len(hand.bottom_row) != 5
-        ):
+        if not hand.is_complete():
             return False  # Can't be fouled if not complete
 
+        cache_key = (
+            Card.to_mask(hand.top_row),
+            Card.to_mask(hand.middle_row),
+            Card.to_mask(hand.bottom_row),
+        )
+        fouled = self._foul_cache.get(cache_key)
+        if fouled is None:
+            fouled = self._compare_rows_fouled(hand)
+            self._foul_cache[cache_key] = fouled
+        return fouled
+
+    def _compare_rows_fouled(self, hand: Hand) -> bool:
+        """Check row strength progression: bottom >= middle >= top."""
         # Evaluate each row
         top_rank = self.evaluator.evaluate_hand(hand.top_row)
         middle_rank = self.evaluator.evaluate_hand(hand.middle_row)
@@ -302,18 +405,25 @@ class GameTreeBuilder(DomainService):
 
         MVP: Simple stats for debugging.
         """
-        total_nodes = len(self.nodes)
-        leaf_nodes = sum(1 for n in self.nodes.values() if n.is_leaf)
-        terminal_nodes = sum(1 for n in self.nodes.values() if n.is_terminal)
-        fouled_nodes = sum(1 for n in self.nodes.values() if n.is_fouled)
-
-        max_depth = max((n.depth for n in self.nodes.values()), default=0)
-
         return {
-            "total_nodes": total_nodes,
-            "leaf_nodes": leaf_nodes,
-            "terminal_nodes": terminal_nodes,
-            "fouled_nodes": fouled_nodes,
-            "max_depth": max_depth,
+            "total_nodes": len(self.nodes),
+            "leaf_nodes": self.nodes.count(NodeStore.LEAF),
+            "terminal_nodes": self.nodes.count(NodeStore.TERMINAL),
+            "fouled_nodes": self.nodes.count(NodeStore.FOULED),
+            "max_depth": self.nodes.max_depth(),
             "total_actions": len(self.actions),
+            "transposition_hits": (
+                self.transposition.hit_count if self.transposition else 0
+            ),
+            "transposition_misses": (
+                self.transposition.miss_count if self.transposition else 0
+            ),
         }
+
+    def dump_nodes(self, path: str) -> None:
+        """
+        Export the tree's node columns for offline analysis.
+
+        Writes one compressed NumPy archive instead of formatting each node.
+        """
+        self.nodes.dump(path)
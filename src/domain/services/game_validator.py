@@ -33,7 +33,7 @@ class GameValidator(DomainService):
     row strength progression, turn order, and game completion.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize game validator with dependencies."""
         self._hand_evaluator = HandEvaluator()
 
@@ -234,14 +234,14 @@ class GameValidator(DomainService):
                 is_valid=False, error_message="Duplicate player IDs found"
             )
 
-        # Check card distribution
-        all_placed_cards = []
+        # Check for duplicate cards across players (a duplicate shares a deck bit)
+        placed_mask = 0
+        placed_count = 0
         for player in game.players:
-            placed_cards = player.top_row + player.middle_row + player.bottom_row
-            all_placed_cards.extend(placed_cards)
+            placed_mask |= player.placed_mask
+            placed_count += player.total_cards_placed
 
-        # Check for duplicate cards across players
-        if len(all_placed_cards) != len(set(all_placed_cards)):
+        if placed_count != placed_mask.bit_count():
             return ValidationResult(
                 is_valid=False, error_message="Duplicate cards found across players"
             )
@@ -333,11 +333,7 @@ class GameValidator(DomainService):
 
     def _is_card_already_placed(self, game: Game, card: Card) -> bool:
         """Check if card is already placed anywhere in the game."""
-        for player in game.players:
-            all_player_cards = player.top_row + player.middle_row + player.bottom_row
-            if card in all_player_cards:
-                return True
-        return False
+        return any(player.placed_mask & card.bit for player in game.players)
 
     def get_available_positions(
         self, game: Game, player_id: PlayerId
@@ -5,12 +5,21 @@ Service for evaluating poker hand rankings and strengths
 according to OFC rules and royalty calculations.
 """
 
-from typing import Dict, List, Tuple
-from functools import lru_cache
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..base import DomainService
 from ..value_objects import Card, HandRanking
 from ..value_objects.hand_ranking import HandType
+from .cactus_kev import (
+    STRAIGHT_HIGHS,
+    five_card_rank,
+    five_card_ranks,
+    hand_details,
+    top_row_key,
+    top_view,
+)
 
 
 class HandEvaluator(DomainService):
@@ -21,9 +30,30 @@ class HandEvaluator(DomainService):
     OFC-specific considerations for royalties and hand comparisons.
     """
 
+    # Top-row royalties by numeric rank: 66 = 1 .. AA = 9, any trips = 10
+    _TOP_PAIR_ROYALTIES: ClassVar[Tuple[int, ...]] = (0,) * 6 + tuple(range(1, 10))
+    _TOP_TRIPS_ROYALTIES: ClassVar[Tuple[int, ...]] = (0, 0) + (10,) * 13
+    # Middle/bottom royalties by HandType.value: straight 2 .. royal flush 25
+    _ROW_ROYALTIES: ClassVar[Tuple[int, ...]] = (0, 0, 0, 0, 2, 4, 6, 10, 15, 25)
+    # Most evaluations kept; the oldest is dropped first
+    _CACHE_LIMIT = 1 << 16
+    # Set per class by instance(); the base default is never handed out
+    _shared_instance: ClassVar[Optional["HandEvaluator"]] = None
+
     def __init__(self):
         """Initialize hand evaluator."""
-        self._evaluation_cache: Dict[str, HandRanking] = {}
+        # Keyed by the sorted card codes, so any order of a hand hits
+        self._evaluation_cache: Dict[Tuple[int, ...], HandRanking] = {}
+
+    @classmethod
+    def instance(cls) -> "HandEvaluator":
+        """Get the evaluator shared by this class, created on first use."""
+        # Looked up on the class itself so subclasses get their own instance
+        shared: Optional[HandEvaluator] = cls.__dict__.get("_shared_instance")
+        if shared is None:
+            shared = cls()
+            cls._shared_instance = shared
+        return shared
 
     def evaluate_hand(self, cards: List[Card]) -> HandRanking:
         """
@@ -41,12 +71,13 @@ class HandEvaluator(DomainService):
         if len(cards) < 3 or len(cards) > 5:
             raise ValueError(f"Hand must have 3-5 cards, got {len(cards)}")
 
-        # Create cache key from sorted cards
-        cache_key = self._create_cache_key(cards)
+        cache_key = tuple(sorted([card.code for card in cards]))
 
         # Check cache first
-        if cache_key in self._evaluation_cache:
-            cached_result = self._evaluation_cache[cache_key]
+        cached_result = self._evaluation_cache.get(cache_key)
+        if cached_result is not None:
+            if cached_result.cards == cards:
+                return cached_result
             # Return a copy with the original card order
             return HandRanking(
                 hand_type=cached_result.hand_type,
@@ -60,7 +91,7 @@ class HandEvaluator(DomainService):
         hand_type, strength_value, kickers = self._analyze_hand(cards)
 
         # Calculate royalty bonus
-        royalty_bonus = self._calculate_royalty_bonus(cards, hand_type)
+        royalty_bonus = self._calculate_royalty_bonus(cards, hand_type, strength_value)
 
         result = HandRanking(
             hand_type=hand_type,
@@ -70,11 +101,77 @@ class HandEvaluator(DomainService):
             cards=cards.copy(),
         )
 
-        # Cache the result
+        # Cache the result, evicting in insertion (FIFO) order when full
+        if len(self._evaluation_cache) >= self._CACHE_LIMIT:
+            del self._evaluation_cache[next(iter(self._evaluation_cache))]
         self._evaluation_cache[cache_key] = result
 
         return result
 
+    def evaluate_hand_batch(self, hands: Sequence[Sequence[Card]]) -> List[HandRanking]:
+        """
+        Evaluate many 5-card hands at once.
+
+        All hands are ranked in one NumPy pass over the Cactus-Kev tables,
+        and each rank maps straight to its type, strength and kickers. Gives
+        the same rankings as evaluate_hand, without using its cache.
+
+        Raises:
+            ValueError: If a hand does not have 5 cards
+        """
+        if any(len(hand) != 5 for hand in hands):
+            raise ValueError("Batch evaluation needs 5-card hands")
+        if not hands:
+            return []
+
+        codes = np.array([[card.code for card in hand] for hand in hands], np.int64)
+        rankings = []
+        for hand, rank in zip(hands, five_card_ranks(codes).tolist()):
+            cards = list(hand)
+            hand_type, strength_value, kickers = hand_details(rank)
+            rankings.append(
+                HandRanking(
+                    hand_type=hand_type,
+                    strength_value=strength_value,
+                    kickers=list(kickers),
+                    royalty_bonus=self._calculate_royalty_bonus(
+                        cards, hand_type, strength_value
+                    ),
+                    cards=cards,
+                )
+            )
+        return rankings
+
+    def evaluate_top3(self, cards: List[Card]) -> HandRanking:
+        """
+        Evaluate a 3-card top row without the general pipeline.
+
+        Three cards can only make high card, a pair or trips, so the ranks
+        are compared directly and royalties come from per-rank tables.
+        Gives the same ranking as evaluate_hand.
+        """
+        high, middle, low = sorted([card.numeric_rank for card in cards], reverse=True)
+
+        if high == low:
+            hand_type, strength_value, kickers = HandType.THREE_OF_A_KIND, high, []
+            royalty_bonus = self._TOP_TRIPS_ROYALTIES[high]
+        elif high == middle or middle == low:
+            # The middle rank is always part of the pair
+            kicker = low if high == middle else high
+            hand_type, strength_value, kickers = HandType.PAIR, middle, [kicker]
+            royalty_bonus = self._TOP_PAIR_ROYALTIES[middle]
+        else:
+            hand_type, strength_value, kickers = HandType.HIGH_CARD, high, [middle, low]
+            royalty_bonus = 0
+
+        return HandRanking(
+            hand_type=hand_type,
+            strength_value=strength_value,
+            kickers=kickers,
+            royalty_bonus=royalty_bonus,
+            cards=list(cards),
+        )
+
     def compare_hands(self, hand1: HandRanking, hand2: HandRanking) -> int:
         """
         Compare two hands.
@@ -105,16 +202,17 @@ class HandEvaluator(DomainService):
         if len(top_cards) != 3 or len(middle_cards) != 5 or len(bottom_cards) != 5:
             return False
 
-        # Evaluate each hand
-        top_hand = self.evaluate_hand(top_cards)
-        middle_hand = self.evaluate_hand(middle_cards)
-        bottom_hand = self.evaluate_hand(bottom_cards)
+        # Table lookups on Cactus-Kev codes instead of full evaluations
+        middle_rank = five_card_rank(middle_cards)
+        bottom_rank = five_card_rank(bottom_cards)
 
-        # Check progression: bottom > middle > top (strict ordering, no equal hands)
-        bottom_beats_middle = self.compare_hands(bottom_hand, middle_hand) > 0
-        middle_beats_top = self.compare_hands(middle_hand, top_hand) > 0
+        # Check progression: bottom > middle > top (strict ordering, no equal hands).
+        # Both margins must be >= 0; OR-ing them keeps the sign bit of either,
+        # so one sign test replaces two data-dependent branches.
+        bottom_margin = middle_rank - bottom_rank - 1  # Lower rank is stronger
+        middle_margin = top_view(middle_rank) - top_row_key(top_cards) - 1
 
-        return bottom_beats_middle and middle_beats_top
+        return (bottom_margin | middle_margin) >= 0
 
     def is_fouled_hand(
         self, top_cards: List[Card], middle_cards: List[Card], bottom_cards: List[Card]
@@ -142,10 +240,16 @@ class HandEvaluator(DomainService):
         Returns:
             Tuple of (hand_type, strength_value, kickers)
         """
-        # Sort cards by rank (descending)
-        sorted_cards = sorted(cards, key=lambda c: c.rank.numeric_value, reverse=True)
-        ranks = [card.rank.numeric_value for card in sorted_cards]
-        suits = [card.suit for card in sorted_cards]
+        # Five distinct cards (five bits in the deck mask) are ranked by one
+        # table lookup; short or duplicated hands are classified by counting
+        if len(cards) == 5 and Card.to_mask(cards).bit_count() == 5:
+            hand_type, strength_value, detail_kickers = hand_details(
+                five_card_rank(cards)
+            )
+            return hand_type, strength_value, list(detail_kickers)
+
+        # Ranks, highest first
+        ranks = sorted([card.numeric_rank for card in cards], reverse=True)
 
         # Count rank frequencies
         rank_counts = {}
@@ -157,11 +261,17 @@ class HandEvaluator(DomainService):
             rank_counts.items(), key=lambda x: (x[1], x[0]), reverse=True
         )
 
-        # Check for flush
-        is_flush = len(set(suits)) == 1 and len(cards) == 5
+        # Rank and suit bits of the card codes: a shared suit bit is a flush,
+        # five adjacent rank bits a straight
+        rank_bits, suit_bits = 0, 0xF000
+        for card in cards:
+            rank_bits |= card.code
+            suit_bits &= card.code
+        rank_bits >>= 16
+        is_flush = suit_bits != 0 and len(cards) == 5
 
-        # Check for straight
-        is_straight, straight_high = self._check_straight(ranks)
+        straight_high = STRAIGHT_HIGHS[rank_bits]
+        is_straight = straight_high != 0
 
         # Determine hand type
         if is_straight and is_flush:
@@ -214,64 +324,20 @@ class HandEvaluator(DomainService):
         else:  # High card
             return HandType.HIGH_CARD, ranks[0], ranks[1:]
 
-    @staticmethod
-    @lru_cache(maxsize=1024)
-    def _check_straight_cached(ranks_tuple: Tuple[int, ...]) -> Tuple[bool, int]:
-        """
-        Check if ranks form a straight (cached version).
-
-        Returns:
-            Tuple of (is_straight, high_card_rank)
-        """
-        if len(ranks_tuple) != 5:
-            return False, 0
-
-        # Sort ranks
-        sorted_ranks = sorted(set(ranks_tuple))
-
-        # Check for regular straight
-        if len(sorted_ranks) == 5:
-            if sorted_ranks[-1] - sorted_ranks[0] == 4:
-                return True, sorted_ranks[-1]
-
-        # Check for A-2-3-4-5 straight (wheel)
-        if sorted_ranks == [2, 3, 4, 5, 14]:
-            return True, 5  # 5 is high in wheel
-
-        return False, 0
-
-    def _check_straight(self, ranks: List[int]) -> Tuple[bool, int]:
-        """
-        Check if ranks form a straight.
-
-        Returns:
-            Tuple of (is_straight, high_card_rank)
-        """
-        # Convert to tuple for caching
-        return self._check_straight_cached(tuple(ranks))
-
-    def _create_cache_key(self, cards: List[Card]) -> str:
-        """
-        Create a cache key from cards.
-
-        Cards are sorted to ensure same hands produce same keys.
-        """
-        sorted_cards = sorted(
-            cards, key=lambda c: (c.rank.numeric_value, ord(c.suit.value))
-        )
-        return "".join(str(card) for card in sorted_cards)
-
     def clear_cache(self) -> None:
         """Clear the evaluation cache."""
         self._evaluation_cache.clear()
 
-    def _calculate_royalty_bonus(self, cards: List[Card], hand_type: HandType) -> int:
+    def _calculate_royalty_bonus(
+        self, cards: List[Card], hand_type: HandType, strength_value: int
+    ) -> int:
         """
         Calculate OFC royalty bonus for hand.
 
         Args:
             cards: Cards in hand
             hand_type: Evaluated hand type
+            strength_value: Evaluated strength (pair/trips rank on the top row)
 
         Returns:
             Royalty bonus points
@@ -279,39 +345,20 @@ class HandEvaluator(DomainService):
         row_size = len(cards)
 
         if row_size == 3:  # Top row
-            return self._calculate_top_row_royalties(cards, hand_type)
+            return self._calculate_top_row_royalties(hand_type, strength_value)
         elif row_size == 5:  # Middle/Bottom row
-            return self._calculate_bottom_middle_royalties(cards, hand_type)
+            return self._calculate_bottom_middle_royalties(hand_type)
 
         return 0
 
-    def _calculate_top_row_royalties(
-        self, cards: List[Card], hand_type: HandType
-    ) -> int:
-        """Calculate top row (3-card) royalty bonuses."""
+    def _calculate_top_row_royalties(self, hand_type: HandType, rank: int) -> int:
+        """Calculate top row (3-card) royalty bonuses from the pair/trips rank."""
         if hand_type == HandType.THREE_OF_A_KIND:
-            return 10
+            return self._TOP_TRIPS_ROYALTIES[rank]
         elif hand_type == HandType.PAIR:
-            pair_rank = max(
-                card.rank.numeric_value
-                for card in cards
-                if sum(1 for c in cards if c.rank == card.rank) == 2
-            )
-            # Sixes or better get royalties
-            if pair_rank >= 6:
-                return pair_rank - 5
+            return self._TOP_PAIR_ROYALTIES[rank]
         return 0
 
-    def _calculate_bottom_middle_royalties(
-        self, cards: List[Card], hand_type: HandType
-    ) -> int:
+    def _calculate_bottom_middle_royalties(self, hand_type: HandType) -> int:
         """Calculate middle/bottom row (5-card) royalty bonuses."""
-        royalty_table = {
-            HandType.STRAIGHT.value: 2,
-            HandType.FLUSH.value: 4,
-            HandType.FULL_HOUSE.value: 6,
-            HandType.FOUR_OF_A_KIND.value: 10,
-            HandType.STRAIGHT_FLUSH.value: 15,
-            HandType.ROYAL_FLUSH.value: 25,
-        }
-        return royalty_table.get(hand_type.value, 0)
+        return self._ROW_ROYALTIES[hand_type.value]
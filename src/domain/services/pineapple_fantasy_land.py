@@ -5,7 +5,7 @@ MVP implementation focusing on core Fantasy Land mechanics only.
 Following YAGNI principle - only essential features.
 """
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..base import DomainService
 from ..value_objects import Card
@@ -27,6 +27,9 @@ class PineappleFantasyLandManager(DomainService):
     def __init__(self, evaluator: Optional[PineappleHandEvaluator] = None):
         """Initialize with evaluator."""
         self.evaluator = evaluator or PineappleHandEvaluator()
+        # A 3-card top row has no straights/flushes, so qualification depends
+        # only on the rank multiset
+        self._entry_cache: Dict[Tuple[int, ...], bool] = {}
 
     def check_entry_qualification(self, top_cards: List[Card]) -> bool:
         """
@@ -37,7 +40,12 @@ class PineappleFantasyLandManager(DomainService):
         if len(top_cards) != 3:
             return False
 
-        return self.evaluator.is_fantasy_land_qualifying(top_cards)
+        cache_key = tuple(sorted(card.rank.numeric_value for card in top_cards))
+        qualifies = self._entry_cache.get(cache_key)
+        if qualifies is None:
+            qualifies = self.evaluator.is_fantasy_land_qualifying(top_cards)
+            self._entry_cache[cache_key] = qualifies
+        return qualifies
 
     def check_stay_qualification(
         self,
@@ -83,6 +91,10 @@ class PineappleFantasyLandManager(DomainService):
 
         return True, None
 
+    def clear_cache(self) -> None:
+        """Clear the qualification cache."""
+        self._entry_cache.clear()
+
     @staticmethod
     def get_cards_count() -> int:
         """Get number of cards dealt in Pineapple Fantasy Land."""
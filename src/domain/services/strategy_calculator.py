@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 from ..base import DomainService
 from ..value_objects.strategy import Strategy, ActionRecommendation
 from ..value_objects.expected_value import ExpectedValue
@@ -42,11 +44,13 @@ class StrategyCalculator(DomainService):
         self,
         tree_builder: Optional[GameTreeBuilder] = None,
         evaluator: Optional[PineappleHandEvaluator] = None,
+        seed: Optional[int] = None,
     ):
-        """Initialize with necessary services."""
+        """Initialize with necessary services (seed makes sampling reproducible)."""
         self.tree_builder = tree_builder or GameTreeBuilder()
         self.evaluator = evaluator or PineappleHandEvaluator()
         self.evaluations: Dict[str, NodeEvaluation] = {}
+        self._rng = np.random.default_rng(seed)
 
         # Memoization cache for position evaluations
         self._position_cache: Dict[str, float] = {}
@@ -484,7 +488,6 @@ class StrategyCalculator(DomainService):
         Returns:
             Tuple of (mean_ev, lower_bound, upper_bound)
         """
-        import random
         import statistics
 
         # For very small iterations, just do single calculation
@@ -500,10 +503,15 @@ class StrategyCalculator(DomainService):
         # Save original deck state
         original_deck = remaining_deck.copy()
 
-        for i in range(min(iterations, 100)):  # Cap at 100 for MVP
+        # Draw every sample's deck order in one vectorized call
+        sample_count = min(iterations, 100)  # Cap at 100 for MVP
+        orders = self._rng.permuted(
+            np.tile(np.arange(len(original_deck)), (sample_count, 1)), axis=1
+        )
+
+        for i, order in enumerate(orders):
             # Shuffle remaining deck
-            shuffled_deck = original_deck.copy()
-            random.shuffle(shuffled_deck)
+            shuffled_deck = [original_deck[j] for j in order]
 
             # Clear caches for fresh calculation
             if i % 10 == 0:  # Clear cache every 10 iterations
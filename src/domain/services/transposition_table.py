@@ -18,26 +18,26 @@ class PositionKey:
     """
     Represents a unique position for transposition detection.
 
-    MVP: Simple key based on cards in each row.
+    Rows and the remaining deck are 52-bit card masks, so the order in
+    which cards were placed does not matter and hashing is a few int ops.
     """
 
-    top_cards: Tuple[str, ...]  # Sorted card strings
-    middle_cards: Tuple[str, ...]
-    bottom_cards: Tuple[str, ...]
+    top_mask: int
+    middle_mask: int
+    bottom_mask: int
+    deck_mask: int
     cards_placed: int
 
     @staticmethod
-    def from_hand(hand: Hand, cards_placed: int) -> "PositionKey":
-        """Create position key from hand."""
-        # Sort cards in each row for consistent keys
-        top = tuple(sorted(str(c) for c in hand.top_row))
-        middle = tuple(sorted(str(c) for c in hand.middle_row))
-        bottom = tuple(sorted(str(c) for c in hand.bottom_row))
-
+    def from_hand(
+        hand: Hand, cards_placed: int, remaining_deck: Optional[List[Card]] = None
+    ) -> "PositionKey":
+        """Create position key from hand and the cards still to come."""
         return PositionKey(
-            top_cards=top,
-            middle_cards=middle,
-            bottom_cards=bottom,
+            top_mask=Card.to_mask(hand.top_row),
+            middle_mask=Card.to_mask(hand.middle_row),
+            bottom_mask=Card.to_mask(hand.bottom_row),
+            deck_mask=Card.to_mask(remaining_deck or []),
             cards_placed=cards_placed,
         )
 
@@ -21,8 +21,8 @@ from .deck import Deck
 from .difficulty import Difficulty
 from .expected_value import ExpectedValue
 from .feedback import Feedback
-from .game_rules import GameRules
-from .hand import Hand, HandValidationError, InvalidCardPlacementError
+from .game_rules import DEFAULT_RULES, GameRules
+from .hand import Hand, HandBuilder, HandValidationError, InvalidCardPlacementError
 from .pineapple_action import PineappleAction, InitialPlacement
 from .position import Position, Row
 from .fantasy_land_state import FantasyLandState
@@ -51,10 +51,12 @@ __all__ = [
     "Suit",
     "Rank",
     "Hand",
+    "HandBuilder",
     "HandValidationError",
     "InvalidCardPlacementError",
     "Deck",
     "GameRules",
+    "DEFAULT_RULES",
     "CardPosition",
     "Move",
     "Score",
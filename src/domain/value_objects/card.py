@@ -4,9 +4,9 @@ Card Value Object
 Represents an immutable playing card with suit and rank.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from ..base import ValueObject
 
@@ -44,6 +44,19 @@ class Suit(Enum):
         return self in (Suit.SPADES, Suit.CLUBS)
 
 
+# Cactus-Kev suit bits and rank primes (indexed by numeric rank - 2)
+_SUIT_BITS = {
+    Suit.SPADES: 0x1000,
+    Suit.HEARTS: 0x2000,
+    Suit.DIAMONDS: 0x4000,
+    Suit.CLUBS: 0x8000,
+}
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Suit position in deck order, used for 52-bit deck masks
+_SUIT_INDEX = {suit: index for index, suit in enumerate(Suit)}
+
+
 class Rank(Enum):
     """Playing card ranks."""
 
@@ -94,27 +107,86 @@ class Rank(Enum):
         return sorted(cls, key=lambda r: r.numeric_value)
 
 
-@dataclass(frozen=True)
+# Interned instances of all 52 cards, filled once Card is defined
+_CARDS: Dict[Tuple[Suit, Rank], "Card"] = {}
+_CARDS_BY_STRING: Dict[str, "Card"] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class Card(ValueObject):
     """
     Immutable playing card value object.
 
-    Represents a single playing card with suit and rank.
+    Represents a single playing card with suit and rank. Only 52 instances
+    ever exist: constructing a card returns the interned one, so equality
+    is an identity check.
+
+    Besides suit and rank, each card carries plain-int views for hot paths:
+    numeric_rank (2-14), code (32-bit Cactus-Kev encoding, laid out as
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp: rank bit, suit bit, rank index,
+    rank prime), index (0-51, suit * 13 + rank in deck order) and bit
+    (1 << index, its bit in a 52-bit deck mask).
     """
 
     suit: Suit
     rank: Rank
-
-    def __post_init__(self):
+    numeric_rank: int = field(init=False, repr=False, compare=False)
+    code: int = field(init=False, repr=False, compare=False)
+    index: int = field(init=False, repr=False, compare=False)
+    bit: int = field(init=False, repr=False, compare=False)
+    _order: int = field(init=False, repr=False, compare=False)
+    _name: str = field(init=False, repr=False, compare=False)
+
+    def __new__(cls, suit: Suit, rank: Rank) -> "Card":
+        card = _CARDS.get((suit, rank))
+        if card is None:
+            # Not super(): slots=True rebuilds the class after this body runs
+            card = object.__new__(cls)
+        return card
+
+    def __post_init__(self) -> None:
         """Validate card creation parameters."""
+        # Re-constructing an interned card: already validated and filled in
+        if _CARDS.get((self.suit, self.rank)) is self:
+            return
         if not isinstance(self.suit, Suit):
             raise TypeError(f"suit must be a Suit enum, got {type(self.suit)}")
         if not isinstance(self.rank, Rank):
             raise TypeError(f"rank must be a Rank enum, got {type(self.rank)}")
 
+        # Plain slots rather than properties: read on every evaluation and
+        # far cheaper than a property call or going through the enums
+        rank_index = self.rank.numeric_value - 2
+        object.__setattr__(self, "numeric_rank", self.rank.numeric_value)
+        object.__setattr__(
+            self,
+            "code",
+            _SUIT_BITS[self.suit]
+            | (1 << (16 + rank_index))
+            | (rank_index << 8)
+            | _RANK_PRIMES[rank_index],
+        )
+        suit_index = _SUIT_INDEX[self.suit]
+        object.__setattr__(self, "index", suit_index * 13 + rank_index)
+        object.__setattr__(self, "bit", 1 << self.index)
+        # Sort position: rank first, then spades > hearts > diamonds > clubs
+        object.__setattr__(self, "_order", rank_index * 4 + 3 - suit_index)
+        # Formatted once; cards are printed and joined far more than created
+        object.__setattr__(self, "_name", f"{self.rank.symbol}{self.suit.value}")
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return self.code
+
+    def __reduce__(self) -> Tuple[Callable[..., "Card"], Tuple[Any, ...]]:
+        # Frozen slotted instances can't be restored attribute by attribute
+        return (Card.of, (self.suit, self.rank))
+
     def __str__(self) -> str:
         """String representation (e.g., 'As', 'Kh', '2c')."""
-        return f"{self.rank.symbol}{self.suit.value}"
+        return self._name
 
     def __repr__(self) -> str:
         """Detailed representation."""
@@ -122,23 +194,29 @@ class Card(ValueObject):
 
     def __lt__(self, other: "Card") -> bool:
         """Less than comparison - compare by rank first, then suit."""
-        if self.rank != other.rank:
-            return self.rank < other.rank
-        # For same rank, compare by suit (spades > hearts > diamonds > clubs)
-        suit_order = {Suit.CLUBS: 1, Suit.DIAMONDS: 2, Suit.HEARTS: 3, Suit.SPADES: 4}
-        return suit_order[self.suit] < suit_order[other.suit]
+        return self._order < other._order
 
     def __le__(self, other: "Card") -> bool:
         """Less than or equal comparison."""
-        return self < other or self == other
+        return self._order <= other._order
 
     def __gt__(self, other: "Card") -> bool:
         """Greater than comparison."""
-        return not self <= other
+        return self._order > other._order
 
     def __ge__(self, other: "Card") -> bool:
         """Greater than or equal comparison."""
-        return not self < other
+        return self._order >= other._order
+
+    @staticmethod
+    def of(suit: Suit, rank: Rank) -> "Card":
+        """
+        Get the shared instance for a suit and rank.
+
+        Cards are immutable, so hot paths should use this instead of
+        constructing new instances; equal cards are then also identical.
+        """
+        return _CARDS[(suit, rank)]
 
     @classmethod
     def from_string(cls, card_str: str) -> "Card":
@@ -154,6 +232,11 @@ class Card(ValueObject):
         Raises:
             ValueError: If string format is invalid
         """
+        card = _CARDS_BY_STRING.get(card_str)
+        if card is not None:
+            return card
+
+        # Not a known spelling; parse it to report what is wrong
         if len(card_str) != 2:
             raise ValueError(f"Card string must be 2 characters, got: {card_str}")
 
@@ -169,7 +252,7 @@ class Card(ValueObject):
         except ValueError:
             raise ValueError(f"Invalid suit symbol: {suit_symbol}")
 
-        return cls(suit=suit, rank=rank)
+        return cls.of(suit, rank)
 
     @property
     def is_face_card(self) -> bool:
@@ -191,14 +274,9 @@ class Card(ValueObject):
         """Check if card is black."""
         return self.suit.is_black
 
-    @property
-    def numeric_rank(self) -> int:
-        """Get numeric rank value."""
-        return self.rank.numeric_value
-
     def is_consecutive(self, other: "Card") -> bool:
         """Check if this card is consecutive with another."""
-        return abs(self.rank.numeric_value - other.rank.numeric_value) == 1
+        return abs(self.numeric_rank - other.numeric_rank) == 1
 
     def is_same_suit(self, other: "Card") -> bool:
         """Check if this card has same suit as another."""
@@ -211,11 +289,40 @@ class Card(ValueObject):
     @staticmethod
     def create_deck() -> List["Card"]:
         """Create a full 52-card deck."""
-        deck = []
-        for suit in Suit:
-            for rank in Rank:
-                deck.append(Card(suit=suit, rank=rank))
-        return deck
+        return list(_CARDS.values())
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        """Get the card for a Cactus-Kev encoding."""
+        return _CARDS_BY_CODE[code]
+
+    @staticmethod
+    def to_mask(cards: Iterable["Card"]) -> int:
+        """Combine cards into a 52-bit deck mask."""
+        mask = 0
+        for card in cards:
+            mask |= card.bit
+        return mask
+
+    @staticmethod
+    def from_mask(mask: int) -> List["Card"]:
+        """Get the cards in a deck mask, in deck order."""
+        cards = []
+        while mask:
+            low = mask & -mask
+            cards.append(_CARDS_BY_BIT[low])
+            mask ^= low
+        return cards
+
+    @staticmethod
+    def to_bytes(cards: Iterable["Card"]) -> bytes:
+        """Pack cards into one byte each, their 0-51 deck index."""
+        return bytes(card.index for card in cards)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> List["Card"]:
+        """Unpack cards packed by to_bytes, keeping their order."""
+        return [_CARDS_BY_INDEX[index] for index in data]
 
     @staticmethod
     def parse_cards(cards_str: str) -> List["Card"]:
@@ -236,7 +343,7 @@ class Card(ValueObject):
     @staticmethod
     def cards_to_string(cards: List["Card"]) -> str:
         """Convert list of cards to string representation."""
-        return " ".join(str(card) for card in cards)
+        return " ".join([card._name for card in cards])
 
     @staticmethod
     def group_by_suit(cards: List["Card"]) -> dict[Suit, List["Card"]]:
@@ -264,17 +371,35 @@ class Card(ValueObject):
     @staticmethod
     def sort_by_suit(cards: List["Card"]) -> List["Card"]:
         """Sort cards by suit."""
-        suit_order = {Suit.CLUBS: 1, Suit.DIAMONDS: 2, Suit.HEARTS: 3, Suit.SPADES: 4}
-        return sorted(cards, key=lambda c: (suit_order[c.suit], c.rank.numeric_value))
+        # Clubs first, then diamonds, hearts and spades
+        return sorted(cards, key=lambda c: (-(c.index // 13), c.numeric_rank))
 
     @staticmethod
     def validate_no_duplicates(cards: List["Card"]) -> bool:
         """Validate that there are no duplicate cards."""
-        return len(cards) == len(set(cards))
+        return len(cards) == Card.to_mask(cards).bit_count()
 
     @staticmethod
     def get_missing_cards(cards: List["Card"]) -> List["Card"]:
         """Get cards missing from a full deck."""
-        full_deck = set(Card.create_deck())
-        provided_cards = set(cards)
-        return list(full_deck - provided_cards)
+        return Card.from_mask(FULL_DECK_MASK & ~Card.to_mask(cards))
+
+
+# Flyweight table of all 52 cards, in suit-then-rank deck order
+for _suit in Suit:
+    for _rank in Rank:
+        _CARDS[(_suit, _rank)] = Card(suit=_suit, rank=_rank)
+del _suit, _rank
+# Every accepted spelling (rank and suit are case-insensitive), so parsing
+# valid input never falls through to the enum lookups
+_CARDS_BY_STRING.update(
+    (rank_symbol + suit_symbol, card)
+    for card in _CARDS.values()
+    for rank_symbol in {card.rank.symbol, card.rank.symbol.lower()}
+    for suit_symbol in (card.suit.value, card.suit.value.upper())
+)
+_CARDS_BY_CODE: Dict[int, Card] = {card.code: card for card in _CARDS.values()}
+_CARDS_BY_BIT: Dict[int, Card] = {card.bit: card for card in _CARDS.values()}
+_CARDS_BY_INDEX: List[Card] = sorted(_CARDS.values(), key=lambda card: card.index)
+
+FULL_DECK_MASK = (1 << 52) - 1
@@ -102,3 +102,7 @@ class GameRules(ValueObject):
             allow_scooping=False,
             royalty_multiplier=1.5,  # Higher stakes
         )
+
+
+# Shared default rules; GameRules is immutable so one instance serves all games
+DEFAULT_RULES = GameRules()
@@ -14,7 +14,7 @@ from .card import Card
 from .hand import Hand
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameTreeNode(ValueObject):
     """
     Represents a node in the OFC game tree.
@@ -32,7 +32,7 @@ class GameTreeNode(ValueObject):
     cards_placed: int  # Number of cards placed so far
 
     # For 3-pick-2 decisions
-    dealt_cards: Optional[Tuple[Card, Card, Card]] = None
+    dealt_cards: Optional[Tuple[Card, ...]] = None
     possible_actions: Optional[List[Tuple[Card, Card]]] = None  # Pairs to place
 
     # Tree structure (using IDs to save memory)
@@ -43,7 +43,7 @@ class GameTreeNode(ValueObject):
     is_terminal: bool = False
     is_fouled: bool = False
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validate node state."""
         if self.cards_placed < 0 or self.cards_placed > 13:
             raise ValueError(f"Invalid cards_placed: {self.cards_placed}")
@@ -73,7 +73,7 @@ class GameTreeNode(ValueObject):
         return 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeAction(ValueObject):
     """
     Represents an action taken at a node.
@@ -5,8 +5,8 @@ Represents a collection of cards in OFC (Open Face Chinese) layout.
 Handles the three-row structure and validation specific to OFC rules.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Set, Tuple
 
 from ..base import DomainException, ValueObject
 from .card import Card
@@ -25,7 +25,7 @@ class InvalidCardPlacementError(DomainException):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hand(ValueObject):
     """
     Hand value object representing OFC layout.
@@ -36,12 +36,19 @@ class Hand(ValueObject):
     - Bottom row: 5 cards (strongest hand)
 
     Plus cards still in hand waiting to be placed.
+
+    Each row and the cards in hand also get a 52-bit deck mask, computed
+    once here, so membership and placed-card checks are bit operations.
     """
 
     top_row: List[Card]
     middle_row: List[Card]
     bottom_row: List[Card]
     hand_cards: List[Card]
+    top_mask: int = field(init=False, repr=False, compare=False)
+    middle_mask: int = field(init=False, repr=False, compare=False)
+    bottom_mask: int = field(init=False, repr=False, compare=False)
+    hand_mask: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate hand state after initialization."""
@@ -59,15 +66,26 @@ class Hand(ValueObject):
                 f"Bottom row cannot have more than 5 cards, got {len(self.bottom_row)}"
             )
 
-        # Validate no duplicate cards across all positions
-        all_cards = self.top_row + self.middle_row + self.bottom_row + self.hand_cards
-        if len(all_cards) != len(set(all_cards)):
+        object.__setattr__(self, "top_mask", Card.to_mask(self.top_row))
+        object.__setattr__(self, "middle_mask", Card.to_mask(self.middle_row))
+        object.__setattr__(self, "bottom_mask", Card.to_mask(self.bottom_row))
+        object.__setattr__(self, "hand_mask", Card.to_mask(self.hand_cards))
+
+        # Validate no duplicate cards across all positions: each card owns
+        # one deck bit, so duplicates show up as fewer bits than cards
+        total_cards = (
+            len(self.top_row)
+            + len(self.middle_row)
+            + len(self.bottom_row)
+            + len(self.hand_cards)
+        )
+        if self.all_mask.bit_count() != total_cards:
             raise HandValidationError("Hand contains duplicate cards")
 
         # Validate total card count doesn't exceed 13 (OFC limit)
-        if len(all_cards) > 13:
+        if total_cards > 13:
             raise HandValidationError(
-                f"Hand cannot contain more than 13 cards, got {len(all_cards)}"
+                f"Hand cannot contain more than 13 cards, got {total_cards}"
             )
 
     @classmethod
@@ -99,6 +117,31 @@ class Hand(ValueObject):
             hand_cards=list(hand) if hand else [],
         )
 
+    @classmethod
+    def builder(cls, cards: Optional[List[Card]] = None) -> "HandBuilder":
+        """Start building a hand from cards in hand (not placed yet)."""
+        return HandBuilder(hand_cards=cards or [])
+
+    @classmethod
+    def from_masks(cls, top: int, middle: int, bottom: int, hand: int = 0) -> "Hand":
+        """Create hand from 52-bit deck masks per row (cards in deck order)."""
+        return cls(
+            top_row=Card.from_mask(top),
+            middle_row=Card.from_mask(middle),
+            bottom_row=Card.from_mask(bottom),
+            hand_cards=Card.from_mask(hand),
+        )
+
+    @property
+    def placed_mask(self) -> int:
+        """Get the 52-bit deck mask of cards placed in rows."""
+        return self.top_mask | self.middle_mask | self.bottom_mask
+
+    @property
+    def all_mask(self) -> int:
+        """Get the 52-bit deck mask of all cards in this hand (placed and unplaced)."""
+        return self.placed_mask | self.hand_mask
+
     def is_complete(self) -> bool:
         """Check if hand layout is complete (all 13 cards placed)."""
         return (
@@ -153,7 +196,7 @@ class Hand(ValueObject):
         Raises:
             InvalidCardPlacementError: If placement is invalid
         """
-        if card not in self.hand_cards:
+        if not self.hand_mask & card.bit:
             raise InvalidCardPlacementError(f"Card {card} is not available to place")
 
         if not self.can_place_card(position):
@@ -175,6 +218,43 @@ class Hand(ValueObject):
 
         return Hand.from_layout(new_top, new_middle, new_bottom, new_hand_cards)
 
+    def with_added(
+        self,
+        top: Sequence[Card] = (),
+        middle: Sequence[Card] = (),
+        bottom: Sequence[Card] = (),
+        hand_cards: Optional[List[Card]] = None,
+    ) -> "Hand":
+        """
+        Create new hand with cards added straight to the rows.
+
+        Unlike chained place_card calls, the cards need not be in hand and
+        only the final Hand is created and validated.
+
+        Args:
+            top: Cards to append to the top row
+            middle: Cards to append to the middle row
+            bottom: Cards to append to the bottom row
+            hand_cards: Cards left in hand; defaults to the current ones
+                minus any that were added
+
+        Returns:
+            New Hand instance with the cards added
+
+        Raises:
+            HandValidationError: If a row overflows or a card appears twice
+        """
+        if hand_cards is None:
+            added = Card.to_mask(top) | Card.to_mask(middle) | Card.to_mask(bottom)
+            hand_cards = [card for card in self.hand_cards if not added & card.bit]
+
+        return Hand(
+            top_row=self.top_row + list(top),
+            middle_row=self.middle_row + list(middle),
+            bottom_row=self.bottom_row + list(bottom),
+            hand_cards=list(hand_cards),
+        )
+
     def place_cards(self, placements: List[Tuple[Card, CardPosition]]) -> "Hand":
         """
         Place multiple cards at once.
@@ -185,10 +265,12 @@ class Hand(ValueObject):
         Returns:
             New Hand instance with all cards placed
         """
-        result = self
+        builder = HandBuilder(
+            self.hand_cards, self.top_row, self.middle_row, self.bottom_row
+        )
         for card, position in placements:
-            result = result.place_card(card, position)
-        return result
+            builder.place(card, position)
+        return builder.build()
 
     def remove_card(self, card: Card) -> "Hand":
         """
@@ -360,3 +442,57 @@ class Hand(ValueObject):
     def __len__(self) -> int:
         """Total number of cards in hand."""
         return len(self.get_all_cards())
+
+
+class HandBuilder:
+    """
+    Mutable staging area for placing many cards into a Hand.
+
+    Placements follow the same rules as Hand.place_card, but rows are
+    appended in place and the Hand is validated and created once in build().
+    """
+
+    def __init__(
+        self,
+        hand_cards: List[Card],
+        top: Optional[List[Card]] = None,
+        middle: Optional[List[Card]] = None,
+        bottom: Optional[List[Card]] = None,
+    ):
+        """Initialize builder with copies of the given cards and rows."""
+        self.hand_cards = list(hand_cards)
+        self._rows = {
+            CardPosition.TOP: list(top or []),
+            CardPosition.MIDDLE: list(middle or []),
+            CardPosition.BOTTOM: list(bottom or []),
+        }
+
+    def place(self, card: Card, position: CardPosition) -> "HandBuilder":
+        """
+        Move a card from hand into a row.
+
+        Returns:
+            This builder, so placements can be chained
+
+        Raises:
+            InvalidCardPlacementError: If placement is invalid
+        """
+        if card not in self.hand_cards:
+            raise InvalidCardPlacementError(f"Card {card} is not available to place")
+
+        row = self._rows.get(position)
+        if row is None or len(row) >= position.max_cards:
+            raise InvalidCardPlacementError(f"Cannot place card in {position}")
+
+        self.hand_cards.remove(card)
+        row.append(card)
+        return self
+
+    def build(self) -> Hand:
+        """Create the Hand with the current layout."""
+        return Hand.from_layout(
+            self._rows[CardPosition.TOP],
+            self._rows[CardPosition.MIDDLE],
+            self._rows[CardPosition.BOTTOM],
+            self.hand_cards,
+        )
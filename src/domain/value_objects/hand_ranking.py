@@ -6,7 +6,7 @@ along with OFC-specific royalty bonuses.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import ClassVar, List
 
 from ..base import ValueObject
 from .card import Card
@@ -15,6 +15,18 @@ from .card import Card
 class HandType:
     """Poker hand types in order of strength."""
 
+    # Assigned below the class, once HandType can be instantiated
+    HIGH_CARD: ClassVar["HandType"]
+    PAIR: ClassVar["HandType"]
+    TWO_PAIR: ClassVar["HandType"]
+    THREE_OF_A_KIND: ClassVar["HandType"]
+    STRAIGHT: ClassVar["HandType"]
+    FLUSH: ClassVar["HandType"]
+    FULL_HOUSE: ClassVar["HandType"]
+    FOUR_OF_A_KIND: ClassVar["HandType"]
+    STRAIGHT_FLUSH: ClassVar["HandType"]
+    ROYAL_FLUSH: ClassVar["HandType"]
+
     def __init__(self, value: int, display_name: str):
         self.value = value
         self.display_name = display_name
@@ -6,9 +6,13 @@ Joker can represent any card when evaluating hands.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from itertools import chain, combinations, combinations_with_replacement
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple
 
-from .card import Card, Rank, Suit
+import numpy as np
+
+from .card import FULL_DECK_MASK, Card
 from ..base import ValueObject
 
 
@@ -48,15 +52,34 @@ class JokerHandEvaluator:
     Simple evaluator for hands containing jokers.
 
     MVP approach:
-    - Find best possible substitution for each joker
-    - Use existing hand evaluator for actual evaluation
-    - No complex optimization, just reasonable heuristics
+    - Search every substitution for the jokers among unused cards
+    - Score candidates with table lookups, then use the base evaluator
+      for the final ranking (royalties etc.)
     """
 
+    # Set per class by instance(); the base default is never handed out
+    _shared_instance: ClassVar[Optional["JokerHandEvaluator"]] = None
+
     def __init__(self, base_evaluator):
         """Initialize with base evaluator."""
         self.base_evaluator = base_evaluator
 
+        # Best substitution by (mask of regular cards, joker count); the
+        # search only depends on which cards are held, not their order
+        self._substitution_cache: Dict[Tuple[int, int], Tuple[Card, ...]] = {}
+
+    @classmethod
+    def instance(cls) -> "JokerHandEvaluator":
+        """Get the evaluator shared by this class, over the shared Pineapple one."""
+        shared: Optional[JokerHandEvaluator] = cls.__dict__.get("_shared_instance")
+        if shared is None:
+            # Deferred: services import the value objects package
+            from ..services.pineapple_evaluator import PineappleHandEvaluator
+
+            shared = cls(PineappleHandEvaluator.instance())
+            cls._shared_instance = shared
+        return shared
+
     def evaluate_with_jokers(
         self,
         cards: List[Card],
@@ -65,9 +88,9 @@ class JokerHandEvaluator:
         """
         Evaluate hand with jokers by finding best substitution.
 
-        Simplified algorithm:
+        Algorithm:
         1. If no jokers, use base evaluator
-        2. For each joker, try common beneficial substitutions
+        2. Try every substitution from the cards not in the hand
         3. Return best result
 
         Returns dict with:
@@ -75,28 +98,45 @@ class JokerHandEvaluator:
         - substitutions: What each joker represents
         - ranking: Hand ranking result
         """
+        # Top rows have their own 3-card fast path
+        if len(cards) + len(jokers) == 3:
+            evaluate = self.base_evaluator.evaluate_top3
+        else:
+            evaluate = self.base_evaluator.evaluate_hand
+
         if not jokers:
             # No jokers, just evaluate normally
-            ranking = self.base_evaluator.evaluate_hand(cards)
+            ranking = evaluate(cards)
             return {
                 "best_hand": cards,
                 "substitutions": {},
                 "ranking": ranking,
             }
 
-        # For MVP, use simple heuristics
-        best_substitution = self._find_best_substitution(cards, len(jokers))
+        cache_key = (Card.to_mask(cards), len(jokers))
+        substitution = self._substitution_cache.get(cache_key)
+        if substitution is None:
+            substitution = tuple(
+                self._find_best_substitution(cards, len(jokers))["cards"]
+            )
+            self._substitution_cache[cache_key] = substitution
 
         # Create substituted hand
-        substituted_cards = cards + best_substitution["cards"]
-        ranking = self.base_evaluator.evaluate_hand(substituted_cards)
+        substituted_cards = cards + list(substitution)
+        ranking = evaluate(substituted_cards)
 
         return {
             "best_hand": substituted_cards,
-            "substitutions": best_substitution["mapping"],
+            "substitutions": {
+                f"JOKER_{i}": str(card) for i, card in enumerate(substitution)
+            },
             "ranking": ranking,
         }
 
+    def clear_cache(self) -> None:
+        """Clear the substitution cache."""
+        self._substitution_cache.clear()
+
     def _find_best_substitution(
         self,
         existing_cards: List[Card],
@@ -105,65 +145,145 @@ class JokerHandEvaluator:
         """
         Find best cards to substitute for jokers.
 
-        Simplified heuristics:
-        - For pairs/trips: match existing high cards
-        - For flushes: match dominant suit
-        - For straights: fill gaps
-        - Default: high cards (Aces/Kings)
+        Searches the cards still out of the hand. 3- and 5-card hands are
+        scored in one batch over card codes with the Cactus-Kev tables;
+        other sizes fall back to the base evaluator. Only candidates that
+        can be best are scored: one set of cards per rank combination, plus
+        single-suit completions when a flush is reachable. The result is
+        the same as trying every set, ties going to the lowest cards.
         """
-        # Count existing ranks and suits
-        rank_counts = {}
-        suit_counts = {}
-
-        for card in existing_cards:
-            rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-            suit_counts[card.suit] = suit_counts.get(card.suit, 0) + 1
-
-        substitutions = []
-        mapping = {}
-
-        # Simple strategy: prioritize pairs/trips with high cards
-        high_ranks = [Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK]
-
-        for i in range(joker_count):
-            joker_id = f"JOKER_{i}"
-
-            # Check for pair potential
-            for rank in high_ranks:
-                if rank_counts.get(rank, 0) == 1 and joker_count > 0:
-                    # Make a pair
-                    suit = self._get_different_suit(existing_cards, rank)
-                    card = Card(suit, rank)
-                    substitutions.append(card)
-                    mapping[joker_id] = str(card)
-                    joker_count -= 1
-                    break
+        # Deferred: services import the value objects package
+        from ..services.cactus_kev import top_row_keys
+
+        hand_size = len(existing_cards) + joker_count
+
+        best_cards: Optional[Tuple[Card, ...]] = None
+        if hand_size in (3, 5):
+            # One row of deck indices per candidate, with a score where lower
+            # is stronger; the held cards are folded in by the ranker
+            free = FULL_DECK_MASK & ~Card.to_mask(existing_cards)
+            if hand_size == 3:
+                # Top rows ignore flushes, so only ranks matter
+                picks = _rank_representatives(free, joker_count)
+                scores = -top_row_keys(_DECK_CODES[picks], existing_cards)
             else:
-                # Default to high card
-                if joker_count > 0:
-                    card = Card(Suit.SPADES, Rank.ACE)
-                    substitutions.append(card)
-                    mapping[joker_id] = str(card)
-                    joker_count -= 1
+                picks, scores = _five_card_candidates(existing_cards, free, joker_count)
+            best_cards = tuple(_DECK[i] for i in _first_best(picks, scores))
+        else:
+            remaining = Card.get_missing_cards(existing_cards)
+            best_ranking = None
+            for candidate in combinations(remaining, joker_count):
+                ranking = self.base_evaluator.evaluate_hand(
+                    existing_cards + list(candidate)
+                )
+                if best_ranking is None or ranking.compare_to(best_ranking) > 0:
+                    best_ranking, best_cards = ranking, candidate
+
+        substitutions = list(best_cards or ())
+        mapping = {f"JOKER_{i}": str(card) for i, card in enumerate(substitutions)}
 
         return {
             "cards": substitutions,
             "mapping": mapping,
         }
 
-    def _get_different_suit(
-        self,
-        existing_cards: List[Card],
-        rank: Rank,
-    ) -> Suit:
-        """Get a suit not already used for this rank."""
-        used_suits = {card.suit for card in existing_cards if card.rank == rank}
 
-        for suit in [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]:
-            if suit not in used_suits:
-                return suit
+# Deck in bit order, with each card's code and bit index
+_DECK = Card.from_mask(FULL_DECK_MASK)
+_DECK_CODES = np.array([card.code for card in _DECK], dtype=np.int64)
+_DECK_SHIFTS = np.arange(len(_DECK), dtype=np.int64)
+# Cactus-Kev ranks 1-10 are the straight flushes, royal first
+_WORST_STRAIGHT_FLUSH = 10
+
 
-        return Suit.SPADES  # Default
+@lru_cache(maxsize=None)
+def _combination_indices(n: int, k: int) -> np.ndarray:
+    """All k-subsets of range(n) as an array of index rows, in lexicographic order."""
+    flat = chain.from_iterable(combinations(range(n), k))
+    return np.fromiter(flat, dtype=np.intp).reshape(-1, k)
+
+
+@lru_cache(maxsize=None)
+def _rank_multisets(k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All multisets of k ranks, as rank rows plus, for each entry, how many
+    earlier entries of the row share its rank.
+    """
+    ranks = np.array(list(combinations_with_replacement(range(13), k)), dtype=np.intp)
+    repeats = np.zeros_like(ranks)
+    for column in range(1, k):
+        repeats[:, column] = np.where(
+            ranks[:, column] == ranks[:, column - 1], repeats[:, column - 1] + 1, 0
+        )
+    return ranks, repeats
+
+
+def _rank_representatives(free: int, count: int) -> np.ndarray:
+    """
+    One row of deck indices per multiset of ranks that can still be drawn.
+
+    Each rank uses its lowest free cards: these are the ones the full
+    search would pick first among hands that differ only by suit.
+    """
+    # Deck order is suit-major: index = suit * 13 + rank
+    held = (((free >> _DECK_SHIFTS) & 1) == 0).reshape(4, 13)
+    suit_order = np.argsort(held, axis=0, kind="stable")
+    free_counts = 4 - held.sum(axis=0)
+
+    ranks, repeats = _rank_multisets(count)
+    drawable = (repeats < free_counts[ranks]).all(axis=1)
+    ranks, repeats = ranks[drawable], repeats[drawable]
+    return np.sort(suit_order[repeats, ranks] * 13 + ranks, axis=1)
+
+
+def _suited_completions(free: int, suits: Iterable[int], count: int) -> np.ndarray:
+    """Rows of deck indices completing with free cards of a single suit."""
+    rows = []
+    for suit in suits:
+        start = suit * 13
+        in_suit = _DECK_SHIFTS[start : start + 13]
+        available = np.flatnonzero((free >> in_suit) & 1) + start
+        rows.append(available[_combination_indices(len(available), count)])
+    return np.vstack(rows)
+
+
+def _five_card_candidates(
+    held: List[Card], free: int, count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Picks that can complete the best 5-card hand, with their ranks.
+
+    Hands differing only by suit rank alike unless they make a flush, so
+    rank representatives cover every other hand. Flushes need one suit
+    across the held cards; when that is possible, the single-suit
+    completions come first, and a straight flush among them is a bound
+    nothing else reachable can beat.
+    """
+    # Deferred: services import the value objects package
+    from ..services.cactus_kev import five_card_ranks
+
+    representatives = _rank_representatives(free, count)
+    suits = {card.index // 13 for card in held}
+    if len(suits) > 1:
+        return representatives, five_card_ranks(_DECK_CODES[representatives], held)
+
+    suited = _suited_completions(free, suits or range(4), count)
+    suited_ranks = five_card_ranks(_DECK_CODES[suited], held)
+    if suited_ranks.size and suited_ranks.min() <= _WORST_STRAIGHT_FLUSH:
+        return suited, suited_ranks
+
+    ranks = five_card_ranks(_DECK_CODES[representatives], held)
+    return np.vstack((suited, representatives)), np.concatenate((suited_ranks, ranks))
+
+
+def _first_best(picks: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """The lexicographically lowest row among those with the lowest score."""
+    best = np.flatnonzero(scores == scores.min())
+    if len(best) == 1:
+        return picks[best[0]]
+    # lexsort keys run from least to most significant
+    tied = picks[best]
+    return tied[np.lexsort(tied.T[::-1])[0]]
 
 
 def identify_jokers_in_hand(cards: list) -> tuple[List[Card], List[JokerCard]]:
@@ -177,7 +297,14 @@ def identify_jokers_in_hand(cards: list) -> tuple[List[Card], List[JokerCard]]:
     joker_cards = []
 
     for card in cards:
-        if isinstance(card, JokerCard):
+        # Exact type checks first; isinstance on the ABC-based value
+        # objects goes through ABCMeta and costs several times more
+        card_type = type(card)
+        if card_type is Card:
+            regular_cards.append(card)
+        elif card_type is JokerCard:
+            joker_cards.append(card)
+        elif isinstance(card, JokerCard):
             joker_cards.append(card)
         elif isinstance(card, Card):
             regular_cards.append(card)
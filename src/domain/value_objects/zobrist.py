@@ -0,0 +1,52 @@
+"""
+Zobrist Hashing Keys
+
+Fixed 64-bit random keys used to hash OFC positions. A position hash is the
+XOR of the keys for every (card, seat, slot) placement plus the side to move
+and the round, so applying a move only needs to XOR the keys that changed.
+"""
+
+import random
+from typing import Dict, Tuple
+
+from .card import Card
+
+# Up to 4 players per game (matches the games.player_count check)
+MAX_SEATS = 4
+
+# Where a card can sit for a given seat; "deck" is shared (seat 0)
+SLOTS = ("top", "middle", "bottom", "hand", "deck")
+
+# Rounds are folded into this many keys
+ROUND_KEY_COUNT = 64
+
+# Seeded so hashes are stable across processes and can be persisted
+_rng = random.Random(0)
+
+PLACEMENT_KEYS: Dict[Tuple[Card, int, str], int] = {
+    (card, seat, slot): _rng.getrandbits(64)
+    for card in Card.create_deck()
+    for seat in range(MAX_SEATS)
+    for slot in SLOTS
+}
+
+TURN_KEYS: Tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(MAX_SEATS))
+
+ROUND_KEYS: Tuple[int, ...] = tuple(
+    _rng.getrandbits(64) for _ in range(ROUND_KEY_COUNT)
+)
+
+
+def placement_key(card: Card, seat: int, slot: str) -> int:
+    """Get the key for a card sitting in a seat's row/hand slot."""
+    return PLACEMENT_KEYS[(card, seat, slot)]
+
+
+def deck_key(card: Card) -> int:
+    """Get the key for a card still in the deck."""
+    return PLACEMENT_KEYS[(card, 0, "deck")]
+
+
+def round_key(round_number: int) -> int:
+    """Get the key for a round number."""
+    return ROUND_KEYS[round_number % ROUND_KEY_COUNT]
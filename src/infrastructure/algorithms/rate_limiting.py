@@ -4,9 +4,10 @@ Implements multiple algorithms: Token Bucket, Sliding Window, and Adaptive Rate
 """
 
 import time
+import functools
 import asyncio
 import threading
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Iterable
 from dataclasses import dataclass
 from collections import deque
 from enum import Enum
@@ -49,54 +50,97 @@ class TokenBucketLimiter:
     """
     High-performance token bucket rate limiter.
     Most accurate algorithm for burst handling and steady-state limiting.
+
+    Tokens are held as an exact integer count of refill units against a
+    monotonic nanosecond clock, so a refill is one integer multiply-add with
+    no float drift and no fractions lost between checks.
     """
 
+    # Refill units per token: at N requests/minute the bucket gains
+    # exactly N units per nanosecond
+    UNITS_PER_TOKEN = 60_000_000_000
+
     def __init__(self, requests_per_minute: int, burst_size: int):
         self.capacity = burst_size
-        self.tokens = float(burst_size)
+        self.requests_per_minute = requests_per_minute
         self.refill_rate = requests_per_minute / 60.0  # tokens per second
-        self.last_refill = time.time()
-        self._lock = threading.RLock()
+        self._capacity_units = burst_size * self.UNITS_PER_TOKEN
+        self._units = self._capacity_units
+        self._last_refill_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens held as of the last check."""
+        return self._units / self.UNITS_PER_TOKEN
+
+    def _seconds_to_refill(self, units: int) -> float:
+        """Time for the bucket to gain the given number of units."""
+        return units / (self.requests_per_minute * 1e9)
 
     def check_limit(self, requested_tokens: int = 1) -> RateLimitResult:
         """Check if request is within rate limit."""
         with self._lock:
-            current_time = time.time()
-            
-            # Refill tokens based on elapsed time
-            elapsed = current_time - self.last_refill
-            tokens_to_add = elapsed * self.refill_rate
-            self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-            self.last_refill = current_time
-            
+            self._refill()
+            cost = requested_tokens * self.UNITS_PER_TOKEN
+
             # Check if we have enough tokens
-            if self.tokens >= requested_tokens:
-                self.tokens -= requested_tokens
-                return RateLimitResult(
-                    allowed=True,
-                    remaining_tokens=int(self.tokens),
-                    reset_time=current_time + (self.capacity - self.tokens) / self.refill_rate,
-                    algorithm_used="token_bucket"
-                )
-            else:
-                # Calculate retry after time
-                tokens_needed = requested_tokens - self.tokens
-                retry_after = tokens_needed / self.refill_rate
-                
-                return RateLimitResult(
-                    allowed=False,
-                    remaining_tokens=int(self.tokens),
-                    reset_time=current_time + retry_after,
-                    retry_after=retry_after,
-                    algorithm_used="token_bucket"
-                )
+            allowed = self._units >= cost
+            if allowed:
+                self._units -= cost
+            return self._result(allowed, cost)
+
+    def check_burst(self, count: int) -> Tuple[int, RateLimitResult]:
+        """
+        Check a burst of single-token requests arriving together.
+        Returns how many (the first ones) are allowed, and the result of the
+        first blocked request, or of the last one if none were blocked.
+        """
+        with self._lock:
+            self._refill()
+            allowed = min(count, self._units // self.UNITS_PER_TOKEN)
+            self._units -= allowed * self.UNITS_PER_TOKEN
+            return allowed, self._result(allowed == count, self.UNITS_PER_TOKEN)
+
+    def _refill(self):
+        """Refill tokens based on elapsed time; called with the lock held."""
+        now_ns = time.monotonic_ns()
+        self._units = min(
+            self._capacity_units,
+            self._units + (now_ns - self._last_refill_ns) * self.requests_per_minute
+        )
+        self._last_refill_ns = now_ns
+
+    def _result(self, allowed: bool, cost: int) -> RateLimitResult:
+        """Build the result of a check that needed the given units."""
+        if allowed:
+            return RateLimitResult(
+                allowed=True,
+                remaining_tokens=self._units // self.UNITS_PER_TOKEN,
+                reset_time=time.time() + self._seconds_to_refill(self._capacity_units - self._units),
+                algorithm_used="token_bucket"
+            )
+        else:
+            # Calculate retry after time
+            retry_after = self._seconds_to_refill(cost - self._units)
+
+            return RateLimitResult(
+                allowed=False,
+                remaining_tokens=self._units // self.UNITS_PER_TOKEN,
+                reset_time=time.time() + retry_after,
+                retry_after=retry_after,
+                algorithm_used="token_bucket"
+            )
 
     def get_status(self) -> Dict[str, Any]:
         """Get current limiter status."""
         with self._lock:
-            current_time = time.time()
-            elapsed = current_time - self.last_refill
-            available_tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            elapsed_ns = time.monotonic_ns() - self._last_refill_ns
+            available_units = min(
+                self._capacity_units,
+                self._units + elapsed_ns * self.requests_per_minute
+            )
+            available_tokens = available_units / self.UNITS_PER_TOKEN
             
             return {
                 "algorithm": "token_bucket",
@@ -122,39 +166,57 @@ class SlidingWindowLimiter:
     def check_limit(self, requested_tokens: int = 1) -> RateLimitResult:
         """Check if request is within rate limit."""
         with self._lock:
-            current_time = time.time()
-            window_start = current_time - self.window_size
-            
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < window_start:
-                self.requests.popleft()
+            current_time = self._expire_old_requests()
             
             # Check if adding new requests would exceed limit
-            if len(self.requests) + requested_tokens <= self.limit:
+            allowed = len(self.requests) + requested_tokens <= self.limit
+            if allowed:
                 # Add timestamps for each token
-                for _ in range(requested_tokens):
-                    self.requests.append(current_time)
-                
-                return RateLimitResult(
-                    allowed=True,
-                    remaining_tokens=self.limit - len(self.requests),
-                    reset_time=self.requests[0] + self.window_size if self.requests else current_time,
-                    algorithm_used="sliding_window"
-                )
-            else:
-                # Calculate when the oldest request will expire
-                if self.requests:
-                    retry_after = (self.requests[0] + self.window_size) - current_time
-                else:
-                    retry_after = 0
-                
-                return RateLimitResult(
-                    allowed=False,
-                    remaining_tokens=max(0, self.limit - len(self.requests)),
-                    reset_time=self.requests[0] + self.window_size if self.requests else current_time,
-                    retry_after=max(0, retry_after),
-                    algorithm_used="sliding_window"
-                )
+                self.requests.extend([current_time] * requested_tokens)
+            return self._result(allowed, current_time)
+
+    def check_burst(self, count: int) -> Tuple[int, RateLimitResult]:
+        """
+        Check a burst of single-token requests arriving together.
+        Returns how many (the first ones) are allowed, and the result of the
+        first blocked request, or of the last one if none were blocked.
+        """
+        with self._lock:
+            current_time = self._expire_old_requests()
+            allowed = max(0, min(count, self.limit - len(self.requests)))
+            self.requests.extend([current_time] * allowed)
+            return allowed, self._result(allowed == count, current_time)
+
+    def _expire_old_requests(self) -> float:
+        """Remove requests outside the window; returns the current time."""
+        current_time = time.time()
+        window_start = current_time - self.window_size
+        
+        while self.requests and self.requests[0] < window_start:
+            self.requests.popleft()
+        return current_time
+
+    def _result(self, allowed: bool, current_time: float) -> RateLimitResult:
+        """Build the result of a check made at the given time."""
+        reset_time = self.requests[0] + self.window_size if self.requests else current_time
+        if allowed:
+            return RateLimitResult(
+                allowed=True,
+                remaining_tokens=self.limit - len(self.requests),
+                reset_time=reset_time,
+                algorithm_used="sliding_window"
+            )
+        else:
+            # Calculate when the oldest request will expire
+            retry_after = reset_time - current_time
+            
+            return RateLimitResult(
+                allowed=False,
+                remaining_tokens=max(0, self.limit - len(self.requests)),
+                reset_time=reset_time,
+                retry_after=max(0, retry_after),
+                algorithm_used="sliding_window"
+            )
 
     def get_status(self) -> Dict[str, Any]:
         """Get current limiter status."""
@@ -216,6 +278,16 @@ class AdaptiveLimiter:
             
             return result
 
+    def check_burst(self, count: int) -> Tuple[int, RateLimitResult]:
+        """Check a burst of single-token requests with adaptive adjustment."""
+        with self._lock:
+            self._adjust_limits_if_needed()
+            
+            allowed, result = self.limiter.check_burst(count)
+            result.algorithm_used = "adaptive"
+            
+            return allowed, result
+
     def _adjust_limits_if_needed(self):
         """Adjust rate limits based on system performance."""
         current_time = time.time()
@@ -353,28 +425,38 @@ class HierarchicalLimiter:
             "endpoint": {},
             "user_endpoint": {}
         }
+        # Guards adding limiters only; checks read the dicts lock-free and
+        # each limiter serializes its own state, so users never contend
         self._lock = threading.RLock()
 
     def add_limiter(self, tier: str, key: str, config: RateLimitConfig):
         """Add a rate limiter at specific tier and key."""
-        with self._lock:
-            if tier not in self.limiters:
-                self.limiters[tier] = {}
-            
-            # Create appropriate limiter based on algorithm
-            if config.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
-                limiter = TokenBucketLimiter(config.requests_per_minute, config.burst_size)
-            elif config.algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
-                limiter = SlidingWindowLimiter(config.requests_per_minute, config.window_size_seconds)
-            elif config.algorithm == RateLimitAlgorithm.ADAPTIVE:
-                limiter = AdaptiveLimiter(config)
-            else:
-                limiter = TokenBucketLimiter(config.requests_per_minute, config.burst_size)
-            
-            self.limiters[tier][key] = {
-                "limiter": limiter,
+        self.add_limiters(tier, {key: config})
+
+    def add_limiters(self, tier: str, configs: Dict[str, RateLimitConfig]):
+        """Add rate limiters for many keys of one tier under a single lock."""
+        # Limiters are built before taking the lock, which only covers the insert
+        limiters = {
+            key: {
+                "limiter": self._create_limiter(config),
                 "config": config
             }
+            for key, config in configs.items()
+        }
+        
+        with self._lock:
+            self.limiters.setdefault(tier, {}).update(limiters)
+
+    def _create_limiter(self, config: RateLimitConfig):
+        """Create appropriate limiter based on algorithm."""
+        if config.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            return TokenBucketLimiter(config.requests_per_minute, config.burst_size)
+        elif config.algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
+            return SlidingWindowLimiter(config.requests_per_minute, config.window_size_seconds)
+        elif config.algorithm == RateLimitAlgorithm.ADAPTIVE:
+            return AdaptiveLimiter(config)
+        else:
+            return TokenBucketLimiter(config.requests_per_minute, config.burst_size)
 
     def check_limits(
         self, 
@@ -387,41 +469,77 @@ class HierarchicalLimiter:
         Check all applicable rate limits in hierarchy.
         Returns first limit violation or success if all pass.
         """
-        with self._lock:
-            # Check in order of precedence
-            checks = [
-                ("global", "all"),
-                ("user", user_id),
-                ("endpoint", endpoint),
-                ("user_endpoint", f"{user_id}:{endpoint}")
-            ]
+        for limiter in self._applicable_limiters(user_id, endpoint):
             
-            for tier, key in checks:
-                if tier in self.limiters and key in self.limiters[tier]:
-                    limiter_info = self.limiters[tier][key]
-                    limiter = limiter_info["limiter"]
-                    
-                    # Use adaptive check if supported
-                    if hasattr(limiter, 'check_limit') and response_time is not None:
-                        if isinstance(limiter, AdaptiveLimiter):
-                            result = limiter.check_limit(requested_tokens, response_time)
-                        else:
-                            result = limiter.check_limit(requested_tokens)
-                    else:
-                        result = limiter.check_limit(requested_tokens)
-                    
-                    if not result.allowed:
-                        result.user_id = user_id
-                        return result
+            # Use adaptive check if supported
+            if response_time is not None and isinstance(limiter, AdaptiveLimiter):
+                result = limiter.check_limit(requested_tokens, response_time)
+            else:
+                result = limiter.check_limit(requested_tokens)
             
-            # All checks passed
-            return RateLimitResult(
-                allowed=True,
-                remaining_tokens=float('inf'),
-                reset_time=time.time() + 60,
-                algorithm_used="hierarchical",
-                user_id=user_id
-            )
+            if not result.allowed:
+                result.user_id = user_id
+                return result
+        
+        # All checks passed
+        return self._passed_result(user_id)
+
+    def check_burst(
+        self, 
+        user_id: str, 
+        endpoint: str, 
+        count: int
+    ) -> Tuple[int, RateLimitResult, Dict[str, int]]:
+        """
+        Check a burst of single-token requests arriving together.
+        Each tier only sees the requests that passed the tiers before it, so
+        the allowed count is the smallest any tier grants. Returns that count,
+        the result of the first blocked request (or of the last one if none
+        were blocked) and how many requests each algorithm blocked.
+        """
+        allowed = count
+        blocked_result = None
+        blocked_by: Dict[str, int] = {}
+        
+        for limiter in self._applicable_limiters(user_id, endpoint):
+            tier_allowed, result = limiter.check_burst(allowed)
+            
+            # The last tier to cut the count is where the first blocked
+            # request stopped
+            if tier_allowed < allowed:
+                result.user_id = user_id
+                blocked_result = result
+                algorithm = result.algorithm_used or "unknown"
+                blocked_by[algorithm] = blocked_by.get(algorithm, 0) + allowed - tier_allowed
+            allowed = tier_allowed
+        
+        return allowed, blocked_result or self._passed_result(user_id), blocked_by
+
+    def _applicable_limiters(self, user_id: str, endpoint: str) -> List[Any]:
+        """Get the limiters that apply to a request, in order of precedence."""
+        checks = [
+            ("global", "all"),
+            ("user", user_id),
+            ("endpoint", endpoint),
+            ("user_endpoint", f"{user_id}:{endpoint}")
+        ]
+        
+        limiters = []
+        for tier, key in checks:
+            limiter_info = self.limiters.get(tier, {}).get(key)
+            if limiter_info is not None:
+                limiters.append(limiter_info["limiter"])
+        return limiters
+
+    def _passed_result(self, user_id: str) -> RateLimitResult:
+        """Result for a request that passed every tier."""
+        return RateLimitResult(
+            allowed=True,
+            remaining_tokens=float('inf'),
+            reset_time=time.time() + 60,
+            algorithm_used="hierarchical",
+            user_id=user_id
+        )
 
     def get_all_status(self) -> Dict[str, Any]:
         """Get status of all limiters in hierarchy."""
@@ -444,6 +562,35 @@ class RateLimitManager:
     Provides unified interface for all rate limiting algorithms.
     """
 
+    # User-specific limits based on type
+    USER_TYPE_LIMITS: Dict[str, RateLimitConfig] = {
+        "anonymous": RateLimitConfig(
+            requests_per_minute=30,
+            burst_size=5,
+            algorithm=RateLimitAlgorithm.TOKEN_BUCKET
+        ),
+        "demo": RateLimitConfig(
+            requests_per_minute=100,
+            burst_size=20,
+            algorithm=RateLimitAlgorithm.ADAPTIVE
+        ),
+        "basic": RateLimitConfig(
+            requests_per_minute=200,
+            burst_size=40,
+            algorithm=RateLimitAlgorithm.ADAPTIVE
+        ),
+        "premium": RateLimitConfig(
+            requests_per_minute=500,
+            burst_size=100,
+            algorithm=RateLimitAlgorithm.ADAPTIVE
+        ),
+        "test": RateLimitConfig(
+            requests_per_minute=1000,
+            burst_size=200,
+            algorithm=RateLimitAlgorithm.SLIDING_WINDOW
+        )
+    }
+
     def __init__(self):
         self.hierarchical_limiter = HierarchicalLimiter()
         self.metrics = {
@@ -457,37 +604,18 @@ class RateLimitManager:
 
     def setup_user_limits(self, user_id: str, user_type: str):
         """Setup rate limits for a user based on their type."""
-        # User-specific limits based on type
-        user_configs = {
-            "anonymous": RateLimitConfig(
-                requests_per_minute=30,
-                burst_size=5,
-                algorithm=RateLimitAlgorithm.TOKEN_BUCKET
-            ),
-            "demo": RateLimitConfig(
-                requests_per_minute=100,
-                burst_size=20,
-                algorithm=RateLimitAlgorithm.ADAPTIVE
-            ),
-            "basic": RateLimitConfig(
-                requests_per_minute=200,
-                burst_size=40,
-                algorithm=RateLimitAlgorithm.ADAPTIVE
-            ),
-            "premium": RateLimitConfig(
-                requests_per_minute=500,
-                burst_size=100,
-                algorithm=RateLimitAlgorithm.ADAPTIVE
-            ),
-            "test": RateLimitConfig(
-                requests_per_minute=1000,
-                burst_size=200,
-                algorithm=RateLimitAlgorithm.SLIDING_WINDOW
-            )
-        }
-        
-        config = user_configs.get(user_type, user_configs["anonymous"])
-        self.hierarchical_limiter.add_limiter("user", user_id, config)
+        self.setup_user_limits_bulk([(user_id, user_type)])
+
+    def setup_user_limits_bulk(self, users: Iterable[Tuple[str, str]]):
+        """Setup rate limits for many (user_id, user_type) pairs in one update."""
+        default = self.USER_TYPE_LIMITS["anonymous"]
+        self.hierarchical_limiter.add_limiters(
+            "user",
+            {
+                user_id: self.USER_TYPE_LIMITS.get(user_type, default)
+                for user_id, user_type in users
+            }
+        )
 
     def setup_endpoint_limits(self, endpoint: str, limit_config: RateLimitConfig):
         """Setup rate limits for specific endpoints."""
@@ -501,13 +629,14 @@ class RateLimitManager:
         response_time: Optional[float] = None
     ) -> RateLimitResult:
         """Check rate limits and update metrics."""
+        # The limiters lock themselves; only the metrics need this lock
+        result = self.hierarchical_limiter.check_limits(
+            user_id, endpoint, requested_tokens, response_time
+        )
+        
         with self._lock:
             self.metrics["total_requests"] += 1
             
-            result = self.hierarchical_limiter.check_limits(
-                user_id, endpoint, requested_tokens, response_time
-            )
-            
             # Update metrics
             if result.allowed:
                 self.metrics["allowed_requests"] += 1
@@ -520,6 +649,31 @@ class RateLimitManager:
             
             return result
 
+    def check_many(self, user_id: str, endpoint: str, n: int) -> Tuple[int, RateLimitResult]:
+        """
+        Check a burst of n single-token requests arriving together and update
+        metrics. Returns how many of the first requests are allowed, and the
+        result of the first blocked request (or of the last one if none were).
+        """
+        allowed_count, result, blocked_by = self.hierarchical_limiter.check_burst(
+            user_id, endpoint, n
+        )
+        
+        with self._lock:
+            self.metrics["total_requests"] += n
+            self.metrics["allowed_requests"] += allowed_count
+            self.metrics["blocked_requests"] += n - allowed_count
+            
+            # Allowed requests report the hierarchical pass, blocked ones the
+            # limiter that stopped them
+            usage = self.metrics["algorithm_usage"]
+            if allowed_count:
+                usage["hierarchical"] = usage.get("hierarchical", 0) + allowed_count
+            for algorithm, blocked in blocked_by.items():
+                usage[algorithm] = usage.get(algorithm, 0) + blocked
+            
+            return allowed_count, result
+
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get comprehensive performance metrics."""
         with self._lock:
@@ -539,43 +693,45 @@ class RateLimitManager:
             }
 
 
-# Global rate limit manager
-rate_limit_manager = RateLimitManager()
-
-# Setup global limits
-rate_limit_manager.hierarchical_limiter.add_limiter(
-    "global", 
-    "all", 
-    RateLimitConfig(
-        requests_per_minute=10000,  # Global system limit
-        burst_size=1000,
-        algorithm=RateLimitAlgorithm.SLIDING_WINDOW
-    )
-)
-
-# Setup endpoint-specific limits
-endpoint_configs = {
-    "analysis": RateLimitConfig(
-        requests_per_minute=100,  # Analysis is resource-intensive
-        burst_size=10,
-        algorithm=RateLimitAlgorithm.ADAPTIVE
-    ),
-    "games": RateLimitConfig(
-        requests_per_minute=500,  # Game operations are lighter
-        burst_size=50,
-        algorithm=RateLimitAlgorithm.TOKEN_BUCKET
-    ),
-    "training": RateLimitConfig(
-        requests_per_minute=200,
-        burst_size=20,
-        algorithm=RateLimitAlgorithm.ADAPTIVE
+@functools.cache
+def get_rate_limit_manager() -> RateLimitManager:
+    """
+    Get the process-wide rate limit manager instance.
+    Built on first use with the global and endpoint-specific limits.
+    """
+    rate_limit_manager = RateLimitManager()
+
+    # Setup global limits
+    rate_limit_manager.hierarchical_limiter.add_limiter(
+        "global", 
+        "all", 
+        RateLimitConfig(
+            requests_per_minute=10000,  # Global system limit
+            burst_size=1000,
+            algorithm=RateLimitAlgorithm.SLIDING_WINDOW
+        )
     )
-}
 
-for endpoint, config in endpoint_configs.items():
-    rate_limit_manager.setup_endpoint_limits(endpoint, config)
+    # Setup endpoint-specific limits
+    endpoint_configs = {
+        "analysis": RateLimitConfig(
+            requests_per_minute=100,  # Analysis is resource-intensive
+            burst_size=10,
+            algorithm=RateLimitAlgorithm.ADAPTIVE
+        ),
+        "games": RateLimitConfig(
+            requests_per_minute=500,  # Game operations are lighter
+            burst_size=50,
+            algorithm=RateLimitAlgorithm.TOKEN_BUCKET
+        ),
+        "training": RateLimitConfig(
+            requests_per_minute=200,
+            burst_size=20,
+            algorithm=RateLimitAlgorithm.ADAPTIVE
+        )
+    }
 
+    for endpoint, config in endpoint_configs.items():
+        rate_limit_manager.setup_endpoint_limits(endpoint, config)
 
-def get_rate_limit_manager() -> RateLimitManager:
-    """Get the rate limit manager instance."""
-    return rate_limit_manager
\ No newline at end of file
+    return rate_limit_manager
@@ -0,0 +1,80 @@
+from typing import Any, Dict, Sequence, Type
+import logging
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import Base
+from .models import PerformanceMetric, Position
+
+logger = logging.getLogger(__name__)
+
+
+async def copy_rows(
+    session: AsyncSession,
+    model: Type[Base],
+    rows: Sequence[Dict[str, Any]],
+    synchronous_commit: bool = False,
+) -> int:
+    """
+    Bulk-load rows into a model's table with binary COPY.
+
+    COPY skips the per-row parse/plan cost of INSERT, so use this for
+    replays and backfills; single-row API writes should keep using the ORM.
+    Columns left out of the rows get their server defaults.
+
+    Args:
+        session: Session whose transaction the load runs in
+        model: ORM model of the target table
+        rows: Row dicts keyed by column name, all with the same keys
+        synchronous_commit: Set False to skip waiting for the WAL flush on
+            commit; only scoped to this transaction
+
+    Returns:
+        Number of rows copied
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    columns = list(rows[0].keys())
+    # The asyncpg dialect's JSONB codec takes already-serialized text; None
+    # stays SQL NULL rather than becoming the JSON 'null' literal
+    json_columns = {
+        name for name in columns if isinstance(table.columns[name].type, JSONB)
+    }
+    records = [
+        tuple(
+            orjson.dumps(row[name]).decode()
+            if name in json_columns and row[name] is not None
+            else row[name]
+            for name in columns
+        )
+        for row in rows
+    ]
+
+    if not synchronous_commit:
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
+
+    logger.info(f"Copied {len(records)} rows into {table.name}")
+    return len(records)
+
+
+async def copy_positions(session: AsyncSession, rows: Sequence[Dict[str, Any]]) -> int:
+    """Bulk-load historical positions."""
+    return await copy_rows(session, Position, rows)
+
+
+async def copy_performance_metrics(
+    session: AsyncSession, rows: Sequence[Dict[str, Any]]
+) -> int:
+    """Bulk-load performance metrics for replayed training sessions."""
+    return await copy_rows(session, PerformanceMetric, rows)
@@ -56,6 +56,8 @@ class ConnectionPoolManager:
                 "server_settings": {"application_name": "ofc_solver", "jit": "off"},
                 "command_timeout": 60,
                 "timeout": settings.database.pool_timeout,
+                # Reuse server-side prepared statements across commands
+                "prepared_statement_cache_size": settings.database.statement_cache_size,
             },
         )
 
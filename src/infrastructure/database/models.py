@@ -5,19 +5,34 @@ from sqlalchemy import (
     String,
     Integer,
     Boolean,
+    LargeBinary,
     DateTime,
-    Numeric,
+    Enum,
+    Float,
+    REAL,
     ForeignKey,
     CheckConstraint,
     Index,
-    JSON,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from .base import Base
 
+# Native PostgreSQL enum types (created by the initial migration)
+GAME_STATUS = Enum("active", "completed", "paused", "cancelled", name="game_status")
+CALCULATION_METHOD = Enum(
+    "heuristic", "monte_carlo", "exhaustive", "hybrid", name="calculation_method"
+)
+DIFFICULTY_LEVEL = Enum(
+    "beginner", "intermediate", "advanced", "expert", name="difficulty_level"
+)
+SESSION_STATUS = Enum(
+    "active", "completed", "paused", "abandoned", name="session_status"
+)
+METRIC_TYPE = Enum("counter", "gauge", "histogram", "summary", name="metric_type")
+
 
 class Game(Base):
     """Game entity for OFC games."""
@@ -27,10 +42,10 @@ class Game(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     player_count = Column(Integer, nullable=False)
     rules_variant = Column(String(50), nullable=False, default="standard")
-    status = Column(String(20), nullable=False, default="active")
+    status = Column(GAME_STATUS, nullable=False, default="active")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
-    final_scores = Column(JSON, nullable=True)
+    final_scores = Column(JSONB, nullable=True)
 
     # Relationships
     positions = relationship(
@@ -40,11 +55,12 @@ class Game(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint("player_count BETWEEN 2 AND 4", name="valid_player_count"),
-        CheckConstraint(
-            "status IN ('active', 'completed', 'paused', 'cancelled')",
-            name="valid_status",
+        Index(
+            "idx_games_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
         ),
-        Index("idx_games_created_at", "created_at"),
         Index("idx_games_status", "status"),
         Index("idx_games_completed_at", "completed_at"),
     )
@@ -61,9 +77,9 @@ class Position(Base):
     )
     round_number = Column(Integer, nullable=False)
     current_player = Column(Integer, nullable=False)
-    players_hands = Column(JSON, nullable=False)
-    remaining_cards = Column(JSON, nullable=False)  # Array of integers
-    position_hash = Column(String(32), nullable=False)
+    players_hands = Column(JSONB, nullable=False)
+    remaining_cards = Column(JSONB, nullable=False)  # Array of integers
+    position_hash = Column(LargeBinary(16), nullable=False)  # Raw 128-bit digest
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -76,9 +92,26 @@ class Position(Base):
     __table_args__ = (
         CheckConstraint("round_number > 0", name="valid_round_number"),
         CheckConstraint("current_player >= 0", name="valid_current_player"),
-        Index("idx_positions_game_id", "game_id"),
-        Index("idx_positions_hash", "position_hash"),
-        Index("idx_positions_created_at", "created_at"),
+        CheckConstraint("octet_length(position_hash) = 16", name="valid_position_hash"),
+        Index("idx_positions_hash", "position_hash", postgresql_using="hash"),
+        Index(
+            "idx_positions_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "idx_positions_hands_gin",
+            "players_hands",
+            postgresql_using="gin",
+            postgresql_ops={"players_hands": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_positions_remaining_gin",
+            "remaining_cards",
+            postgresql_using="gin",
+            postgresql_ops={"remaining_cards": "jsonb_path_ops"},
+        ),
         Index(
             "idx_positions_game_round_player",
             "game_id",
@@ -100,11 +133,11 @@ class AnalysisResult(Base):
         ForeignKey("positions.id", ondelete="CASCADE"),
         nullable=False,
     )
-    optimal_strategy = Column(JSON, nullable=False)
-    expected_value = Column(Numeric(10, 6), nullable=False)
-    calculation_method = Column(String(20), nullable=False)
+    optimal_strategy = Column(JSONB, nullable=False)
+    expected_value = Column(Float(precision=53), nullable=False)
+    calculation_method = Column(CALCULATION_METHOD, nullable=False)
     calculation_time_ms = Column(Integer, nullable=False)
-    confidence_level = Column(Numeric(4, 3), nullable=True)
+    confidence_level = Column(REAL, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -112,17 +145,50 @@ class AnalysisResult(Base):
 
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "calculation_method IN ('heuristic', 'monte_carlo', 'exhaustive', 'hybrid')",
-            name="valid_calculation_method",
-        ),
         CheckConstraint("calculation_time_ms >= 0", name="valid_calculation_time"),
         CheckConstraint(
             "confidence_level BETWEEN 0 AND 1", name="valid_confidence_level"
         ),
-        Index("idx_analysis_position_id", "position_id"),
+        Index(
+            "idx_analysis_position_covering",
+            "position_id",
+            postgresql_include=["expected_value", "calculation_method"],
+            postgresql_with={"fillfactor": 90},
+        ),
         Index("idx_analysis_method", "calculation_method"),
-        Index("idx_analysis_created_at", "created_at"),
+        Index(
+            "idx_analysis_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
+
+class PositionAnalysis(Base):
+    """Denormalized position + analysis row for solver lookups by hash.
+
+    Populated by a trigger on analysis_results; not written directly.
+    """
+
+    __tablename__ = "position_analysis"
+
+    position_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("positions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    game_id = Column(UUID(as_uuid=True), nullable=False)
+    position_hash = Column(LargeBinary(16), nullable=False)
+    optimal_strategy = Column(JSONB, nullable=False)
+    expected_value = Column(Float(precision=53), nullable=False)
+    calculation_method = Column(CALCULATION_METHOD, nullable=False)
+    confidence_level = Column(REAL, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Constraints
+    __table_args__ = (
+        Index("idx_position_analysis_hash", "position_hash", postgresql_using="hash"),
     )
 
 
@@ -133,11 +199,11 @@ class TrainingSession(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), nullable=True)  # NULL for anonymous sessions
-    difficulty_level = Column(String(20), nullable=False, default="intermediate")
+    difficulty_level = Column(DIFFICULTY_LEVEL, nullable=False, default="intermediate")
     scenario_type = Column(String(30), nullable=False, default="general")
     total_scenarios = Column(Integer, nullable=False)
     completed_scenarios = Column(Integer, nullable=False, default=0)
-    status = Column(String(20), nullable=False, default="active")
+    status = Column(SESSION_STATUS, nullable=False, default="active")
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -148,14 +214,6 @@ class TrainingSession(Base):
 
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "difficulty_level IN ('beginner', 'intermediate', 'advanced', 'expert')",
-            name="valid_difficulty",
-        ),
-        CheckConstraint(
-            "status IN ('active', 'completed', 'paused', 'abandoned')",
-            name="valid_session_status",
-        ),
         CheckConstraint("total_scenarios > 0", name="valid_total_scenarios"),
         CheckConstraint("completed_scenarios >= 0", name="valid_completed_scenarios"),
         CheckConstraint(
@@ -173,16 +231,17 @@ class PerformanceMetric(Base):
     __tablename__ = "performance_metrics"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Partition key, so it must be part of the primary key
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("training_sessions.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
     scenario_id = Column(String(100), nullable=False)
     user_answer = Column(String(200), nullable=True)
     optimal_answer = Column(String(200), nullable=False)
     is_correct = Column(Boolean, nullable=False)
-    ev_difference = Column(Numeric(8, 4), nullable=True)
+    ev_difference = Column(Float(precision=53), nullable=True)
     decision_time_seconds = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -193,8 +252,14 @@ class PerformanceMetric(Base):
     __table_args__ = (
         CheckConstraint("decision_time_seconds >= 0", name="valid_decision_time"),
         Index("idx_performance_session_id", "session_id"),
-        Index("idx_performance_created_at", "created_at"),
+        Index(
+            "idx_performance_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("idx_performance_is_correct", "is_correct"),
+        {"postgresql_partition_by": "HASH (session_id)"},
     )
 
 
@@ -205,18 +270,24 @@ class SystemMetric(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     metric_name = Column(String(100), nullable=False)
-    metric_value = Column(Numeric(15, 6), nullable=False)
-    metric_type = Column(String(20), nullable=False, default="gauge")
-    tags = Column(JSON, nullable=True)
+    metric_value = Column(Float(precision=53), nullable=False)
+    metric_type = Column(METRIC_TYPE, nullable=False, default="gauge")
+    tags = Column(JSONB, nullable=True)
     recorded_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "metric_type IN ('counter', 'gauge', 'histogram', 'summary')",
-            name="valid_metric_type",
+        Index(
+            "idx_system_metrics_recorded_at",
+            "recorded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
         ),
-        Index("idx_system_metrics_name", "metric_name"),
-        Index("idx_system_metrics_recorded_at", "recorded_at"),
         Index("idx_system_metrics_name_time", "metric_name", "recorded_at"),
+        Index(
+            "idx_system_metrics_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
     )
@@ -1,7 +1,12 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 from sqlalchemy.pool import NullPool, QueuePool
 
 from src.config import settings
@@ -13,25 +18,42 @@ class DatabaseSession:
     def __init__(self):
         self._engine = None
         self._sessionmaker = None
+        self._owns_engine = True
 
-    def init(self):
-        """Initialize database engine and session maker."""
-        # Create engine with appropriate pool settings
-        if settings.environment == "testing":
-            # Use NullPool for testing to avoid connection issues
-            pool_class = NullPool
+    def init(self, engine: Optional[AsyncEngine] = None):
+        """
+        Initialize database engine and session maker.
+
+        Args:
+            engine: Existing engine to share (e.g. the connection pool's), so
+                sessions reuse its connections and prepared statements.
+        """
+        self._owns_engine = engine is None
+
+        if engine is not None:
+            self._engine = engine
         else:
-            pool_class = QueuePool
-
-        self._engine = create_async_engine(
-            settings.database.url,
-            echo=settings.debug and settings.environment == "development",
-            pool_size=settings.database.min_connections,
-            max_overflow=settings.database.max_overflow,
-            pool_timeout=settings.database.pool_timeout,
-            pool_pre_ping=True,  # Enable connection health checks
-            poolclass=pool_class,
-        )
+            # Create engine with appropriate pool settings
+            if settings.environment == "testing":
+                # Use NullPool for testing to avoid connection issues
+                pool_class = NullPool
+            else:
+                pool_class = QueuePool
+
+            self._engine = create_async_engine(
+                settings.database.url,
+                echo=settings.debug and settings.environment == "development",
+                pool_size=settings.database.min_connections,
+                max_overflow=settings.database.max_overflow,
+                pool_timeout=settings.database.pool_timeout,
+                pool_pre_ping=True,  # Enable connection health checks
+                poolclass=pool_class,
+                connect_args={
+                    "prepared_statement_cache_size": (
+                        settings.database.statement_cache_size
+                    ),
+                },
+            )
 
         self._sessionmaker = async_sessionmaker(
             bind=self._engine,
@@ -43,7 +65,8 @@ class DatabaseSession:
 
     async def close(self):
         """Close database connections."""
-        if self._engine:
+        # A shared engine is disposed by its owner
+        if self._engine and self._owns_engine:
             await self._engine.dispose()
 
     @asynccontextmanager
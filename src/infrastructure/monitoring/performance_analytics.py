@@ -4,14 +4,14 @@ Real-time metrics collection, anomaly detection, and performance optimization in
 """
 
 import time
+import functools
 import asyncio
 import statistics
 import logging
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from typing import Dict, List, Any, Optional, Callable, Tuple, Sequence, Hashable
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 from enum import Enum
-import json
 import threading
 from datetime import datetime, timezone
 
@@ -111,6 +111,25 @@ class PerformanceMetrics:
             self.timers[key].append(duration)
             self._record_metric(name, duration, MetricType.TIMER, tags)
 
+    def record_timer_batch(self, name: str, durations: Sequence[float], tags: Optional[Dict[str, str]] = None):
+        """Record many timer values sharing one tag set under a single lock."""
+        with self._lock:
+            key = self._generate_key(name, tags)
+            self.timers[key].extend(durations)
+            
+            timestamp = time.time()
+            tags = tags or {}
+            self.metrics[key].extend(
+                MetricPoint(
+                    name=name,
+                    value=duration,
+                    timestamp=timestamp,
+                    tags=tags,
+                    metric_type=MetricType.TIMER
+                )
+                for duration in durations
+            )
+
     def timer(self, name: str, tags: Optional[Dict[str, str]] = None):
         """Context manager for timing operations."""
         return TimerContext(self, name, tags)
@@ -408,40 +427,69 @@ class PerformanceAnalyzer:
         self.analysis_cache = {}
         self.last_analysis = time.time()
 
+    @staticmethod
+    def _group_durations(durations: Sequence[float], outcomes: Sequence[Hashable]) -> Dict[Hashable, List[float]]:
+        """Split durations by outcome, so each group shares one tag set."""
+        groups: Dict[Hashable, List[float]] = {}
+        for duration, outcome in zip(durations, outcomes):
+            groups.setdefault(outcome, []).append(duration)
+        return groups
+
     # Core API performance metrics
     def record_api_request(self, endpoint: str, method: str, duration: float, status_code: int):
         """Record API request metrics."""
-        tags = {
-            "endpoint": endpoint,
-            "method": method,
-            "status": str(status_code)
-        }
-        
-        self.metrics.increment_counter("api_requests_total", 1.0, tags)
-        self.metrics.record_timer("api_request_duration", duration, tags)
-        
-        if status_code >= 400:
-            self.metrics.increment_counter("api_errors_total", 1.0, tags)
+        self.record_api_request_batch(endpoint, method, (duration,), (status_code,))
+
+    def record_api_request_batch(
+        self, endpoint: str, method: str, durations: Sequence[float], status_codes: Sequence[int]
+    ):
+        """Record many requests to one endpoint, one metrics update per status code."""
+        for status_code, group in self._group_durations(durations, status_codes).items():
+            tags = {
+                "endpoint": endpoint,
+                "method": method,
+                "status": str(status_code)
+            }
+            
+            self.metrics.increment_counter("api_requests_total", float(len(group)), tags)
+            self.metrics.record_timer_batch("api_request_duration", group, tags)
+            
+            if status_code >= 400:
+                self.metrics.increment_counter("api_errors_total", float(len(group)), tags)
 
     def record_database_query(self, query_type: str, duration: float, success: bool):
         """Record database query metrics."""
-        tags = {
-            "query_type": query_type,
-            "success": str(success)
-        }
-        
-        self.metrics.increment_counter("db_queries_total", 1.0, tags)
-        self.metrics.record_timer("db_query_duration", duration, tags)
+        self.record_database_query_batch(query_type, (duration,), (success,))
+
+    def record_database_query_batch(
+        self, query_type: str, durations: Sequence[float], successes: Sequence[bool]
+    ):
+        """Record many queries of one type, one metrics update per outcome."""
+        for success, group in self._group_durations(durations, successes).items():
+            tags = {
+                "query_type": query_type,
+                "success": str(success)
+            }
+            
+            self.metrics.increment_counter("db_queries_total", float(len(group)), tags)
+            self.metrics.record_timer_batch("db_query_duration", group, tags)
 
     def record_cache_operation(self, operation: str, hit: bool, duration: float):
         """Record cache operation metrics."""
-        tags = {
-            "operation": operation,
-            "result": "hit" if hit else "miss"
-        }
-        
-        self.metrics.increment_counter("cache_operations_total", 1.0, tags)
-        self.metrics.record_timer("cache_operation_duration", duration, tags)
+        self.record_cache_operation_batch(operation, (hit,), (duration,))
+
+    def record_cache_operation_batch(
+        self, operation: str, hits: Sequence[bool], durations: Sequence[float]
+    ):
+        """Record many cache operations of one kind, one metrics update per result."""
+        for hit, group in self._group_durations(durations, hits).items():
+            tags = {
+                "operation": operation,
+                "result": "hit" if hit else "miss"
+            }
+            
+            self.metrics.increment_counter("cache_operations_total", float(len(group)), tags)
+            self.metrics.record_timer_batch("cache_operation_duration", group, tags)
 
     def record_authentication(self, method: str, success: bool, duration: float):
         """Record authentication metrics."""
@@ -708,10 +756,7 @@ class PerformanceAnalyzer:
         return max(0, score)
 
 
-# Global performance analyzer instance
-performance_analyzer = PerformanceAnalyzer()
-
-
+@functools.cache
 def get_performance_analyzer() -> PerformanceAnalyzer:
-    """Get the performance analyzer instance."""
-    return performance_analyzer
\ No newline at end of file
+    """Get the process-wide performance analyzer instance, built on first use."""
+    return PerformanceAnalyzer()
\ No newline at end of file
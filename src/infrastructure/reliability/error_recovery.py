@@ -5,6 +5,7 @@ Data-driven approach to system reliability and fault tolerance.
 
 import asyncio
 import time
+import functools
 import logging
 from typing import Dict, Any, Optional, Callable, Awaitable, Union
 from dataclasses import dataclass, field
@@ -473,41 +474,44 @@ class CircuitOpenError(Exception):
     pass
 
 
-# Global fault tolerance manager
-fault_tolerance = FaultToleranceManager()
-
-# Default configurations for common services
-fault_tolerance.register_service(
-    "database",
-    retry_config=RetryConfig(
-        max_attempts=3,
-        base_delay=0.5,
-        max_delay=10.0,
-        retry_on_exceptions=(ConnectionError, TimeoutError)
-    ),
-    circuit_config=CircuitBreakerConfig(
-        failure_threshold=5,
-        recovery_timeout=30.0,
-        success_threshold=3
+@functools.cache
+def get_fault_tolerance() -> FaultToleranceManager:
+    """
+    Get the process-wide fault tolerance manager instance.
+    Built on first use with the default service configurations.
+    """
+    fault_tolerance = FaultToleranceManager()
+
+    # Default configurations for common services
+    fault_tolerance.register_service(
+        "database",
+        retry_config=RetryConfig(
+            max_attempts=3,
+            base_delay=0.5,
+            max_delay=10.0,
+            retry_on_exceptions=(ConnectionError, TimeoutError)
+        ),
+        circuit_config=CircuitBreakerConfig(
+            failure_threshold=5,
+            recovery_timeout=30.0,
+            success_threshold=3
+        )
     )
-)
-
-fault_tolerance.register_service(
-    "external_api",
-    retry_config=RetryConfig(
-        max_attempts=5,
-        base_delay=1.0,
-        max_delay=30.0,
-        retry_on_exceptions=(ConnectionError, TimeoutError)
-    ),
-    circuit_config=CircuitBreakerConfig(
-        failure_threshold=3,
-        recovery_timeout=60.0,
-        success_threshold=2
+
+    fault_tolerance.register_service(
+        "external_api",
+        retry_config=RetryConfig(
+            max_attempts=5,
+            base_delay=1.0,
+            max_delay=30.0,
+            retry_on_exceptions=(ConnectionError, TimeoutError)
+        ),
+        circuit_config=CircuitBreakerConfig(
+            failure_threshold=3,
+            recovery_timeout=60.0,
+            success_threshold=2
+        )
     )
-)
 
 
-def get_fault_tolerance() -> FaultToleranceManager:
-    """Get the fault tolerance manager instance."""
-    return fault_tolerance
\ No newline at end of file
+    return fault_tolerance
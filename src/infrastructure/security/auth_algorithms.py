@@ -4,12 +4,13 @@ Data-driven approach to authentication security and performance.
 """
 
 import hashlib
+import functools
 import hmac
 import secrets
 import time
 from typing import Dict, Optional, Tuple, Any
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 import jwt
@@ -351,6 +352,62 @@ class JWTManager:
             return None
 
 
+class JWTVerificationCache:
+    """
+    Bounded LRU+TTL cache of verified JWT access tokens.
+    Repeated tokens skip the RS256 signature check until their entry expires.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: float = 10.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # Token digest -> (validated result, monotonic expiry); dict order is
+        # recency order, so the first entry is the one to evict
+        self._entries: Dict[bytes, Tuple[AuthResult, float]] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Short digest of the token, so raw tokens are never kept as keys."""
+        return hashlib.sha256(token.encode()).digest()[:16]
+
+    def get(self, token: str) -> Optional[AuthResult]:
+        """Get a copy of the cached result for a token, if still fresh."""
+        key = self._key(token)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        result, expires = entry
+        if time.monotonic() >= expires:
+            return None
+
+        # Re-insert to mark as most recently used
+        self._entries[key] = entry
+        return replace(result, features=list(result.features))
+
+    def put(self, token: str, result: AuthResult) -> None:
+        """Cache a successful validation; failures are never cached."""
+        if not result.success:
+            return
+
+        # Never outlive the token itself
+        ttl = self.ttl_seconds
+        if result.expires_at is not None:
+            ttl = min(ttl, (result.expires_at - datetime.now(timezone.utc)).total_seconds())
+        if ttl <= 0:
+            return
+
+        # Re-caching a token replaces its entry rather than evicting another
+        key = self._key(token)
+        if self._entries.pop(key, None) is None and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (result, time.monotonic() + ttl)
+
+    def clear(self) -> None:
+        """Drop all cached validations."""
+        self._entries.clear()
+
+
 class AuthenticationService:
     """
     Unified authentication service.
@@ -360,6 +417,7 @@ class AuthenticationService:
     def __init__(self):
         self.api_key_manager = SecureAPIKeyManager()
         self.jwt_manager = JWTManager()
+        self.verification_cache = JWTVerificationCache()
         self.auth_metrics = {
             "total_requests": 0,
             "successful_auths": 0,
@@ -380,7 +438,10 @@ class AuthenticationService:
         try:
             # Try JWT first (more secure)
             if jwt_token:
-                result = self.jwt_manager.validate_token(jwt_token)
+                result = self.verification_cache.get(jwt_token)
+                if result is None:
+                    result = self.jwt_manager.validate_token(jwt_token)
+                    self.verification_cache.put(jwt_token, result)
                 if result.success:
                     self.auth_metrics["successful_auths"] += 1
                     self.auth_metrics["jwt_auths"] += 1
@@ -444,10 +505,10 @@ class AuthenticationService:
         }
 
 
-# Global authentication service instance
-auth_service = AuthenticationService()
-
-
+@functools.cache
 def get_auth_service() -> AuthenticationService:
-    """Get the authentication service instance."""
-    return auth_service
\ No newline at end of file
+    """
+    Get the process-wide authentication service instance.
+    Built on first use, so importing the module skips RSA key generation.
+    """
+    return AuthenticationService()
\ No newline at end of file
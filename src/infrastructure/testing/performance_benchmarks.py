@@ -4,6 +4,7 @@ Validates authentication algorithms, rate limiting, and error recovery performan
 """
 
 import asyncio
+import functools
 import time
 import statistics
 import concurrent.futures
@@ -104,18 +105,21 @@ class AuthenticationBenchmark:
         failure_count = 0
         
         # Main benchmark
-        tasks = []
         end_time = start_time + config.duration_seconds
         
-        while time.time() < end_time:
-            # Create batch of concurrent tasks
-            batch_size = min(config.concurrent_users, 50)  # Limit batch size
-            batch_tasks = [_single_auth_test() for _ in range(batch_size)]
-            
-            await asyncio.gather(*batch_tasks)
-            
-            # Small delay to prevent overwhelming
-            await asyncio.sleep(0.01)
+        async def _user_worker():
+            """Run authentication tests back to back until the deadline."""
+            while time.time() < end_time:
+                await _single_auth_test()
+                
+                # Let the other users run between tests
+                await asyncio.sleep(0)
+        
+        # One long-lived task per user instead of a fresh batch of tasks
+        # for every round
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(config.concurrent_users, 50)):  # Limit concurrency
+                tg.create_task(_user_worker())
         
         # Calculate results
         total_duration = time.time() - start_time
@@ -745,10 +749,7 @@ class PerformanceBenchmarkSuite:
         return recommendations
 
 
-# Global benchmark suite instance
-benchmark_suite = PerformanceBenchmarkSuite()
-
-
+@functools.cache
 def get_benchmark_suite() -> PerformanceBenchmarkSuite:
-    """Get the performance benchmark suite instance."""
-    return benchmark_suite
\ No newline at end of file
+    """Get the process-wide performance benchmark suite instance, built on first use."""
+    return PerformanceBenchmarkSuite()
\ No newline at end of file
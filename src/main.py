@@ -10,9 +10,9 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import uvicorn
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
 # Import middleware
 from src.infrastructure.web.middleware.auth_middleware import AuthenticationMiddleware
@@ -64,8 +64,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await connection_pool.initialize()
         logger.info("Connection pools initialized")
 
-        # Initialize database session
-        db_session.init()
+        # Initialize database session on the shared connection pool
+        db_session.init(connection_pool.postgres)
         logger.info("Database session initialized")
 
         # Warm up connections
@@ -135,8 +135,9 @@ def create_app() -> FastAPI:
         allow_headers=settings.security.allowed_headers,
     )
 
-    # 2. GZip - Compress responses
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # 2. Compression - Brotli, falling back to gzip for clients without br
+    #    support; small payloads are sent as-is since framing outweighs savings
+    app.add_middleware(BrotliMiddleware, minimum_size=2048, gzip_fallback=True)
 
     # 3. Error handling - Catch and format errors
     app.add_middleware(ErrorHandlerMiddleware)
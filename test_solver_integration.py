@@ -30,11 +30,7 @@ def print_section(title):
 
 def create_deck():
     """Create a standard 52-card deck."""
-    deck = []
-    for suit in Suit:
-        for rank in Rank:
-            deck.append(Card(suit, rank))
-    return deck
+    return Card.create_deck()
 
 
 def test_complete_solver_pipeline():
@@ -64,7 +60,7 @@ def test_complete_solver_pipeline():
     
     deck = create_deck()
     used_cards = hand.get_all_cards()
-    remaining_deck = [c for c in deck if c not in used_cards]
+    remaining_deck = Card.from_mask(Card.to_mask(deck) & ~Card.to_mask(used_cards))
     random.shuffle(remaining_deck)
     
     print(f"  Remaining deck: {len(remaining_deck)} cards")
@@ -5,6 +5,7 @@ from unittest.mock import Mock, AsyncMock
 from uuid import uuid4
 from datetime import datetime
 
+from src.application.commands.base import CommandResult
 from src.application.commands.analysis_commands import (
     RequestAnalysisCommand,
     CancelAnalysisCommand,
@@ -181,6 +182,75 @@ class TestRequestAnalysisCommandHandler:
         assert result.data["status"] == "processing"
 
 
+    @pytest.fixture
+    def batch_handler(self, handler):
+        """Handler whose sessions are mocks, so only batching is exercised."""
+        handler._create_session = Mock(side_effect=lambda command: Mock(id=uuid4()))
+        handler._start_analysis = Mock(
+            side_effect=lambda session, command: CommandResult.ok(
+                data={"session_id": str(session.id), "status": "processing"},
+                command_id=command.command_id
+            )
+        )
+        return handler
+    
+    @pytest.mark.asyncio
+    async def test_handle_many_isolates_failed_lookup(
+        self,
+        batch_handler,
+        mock_position,
+        mock_cache_manager,
+        mock_analysis_repository
+    ):
+        """Test that a failed cache lookup only fails its own command."""
+        # Arrange
+        mock_cache_manager.get_strategy = AsyncMock(
+            side_effect=[RuntimeError("cache down"), None]
+        )
+        commands = [
+            RequestAnalysisCommand(position=mock_position, analysis_type="optimal")
+            for _ in range(2)
+        ]
+        
+        # Act
+        results = await batch_handler.handle_many(commands, max_parallel=1)
+        
+        # Assert
+        assert results[0].success is False
+        assert "cache down" in results[0].error
+        assert results[1].success is True
+        assert results[1].data["status"] == "processing"
+        mock_analysis_repository.save_many.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_handle_many_falls_back_to_single_saves(
+        self,
+        batch_handler,
+        mock_position,
+        mock_analysis_repository
+    ):
+        """Test that a failed batch save only fails the sessions that can't be saved."""
+        # Arrange
+        commands = [
+            RequestAnalysisCommand(
+                position=mock_position,
+                analysis_type="optimal",
+                force_recalculate=True
+            )
+            for _ in range(2)
+        ]
+        mock_analysis_repository.save_many = AsyncMock(side_effect=RuntimeError("batch"))
+        mock_analysis_repository.save = AsyncMock(side_effect=[None, RuntimeError("row")])
+        
+        # Act
+        results = await batch_handler.handle_many(commands)
+        
+        # Assert
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "row" in results[1].error
+    
+
 class TestCancelAnalysisCommandHandler:
     """Test CancelAnalysisCommand handler."""
     
@@ -379,10 +449,10 @@ class TestBatchAnalysisCommandHandler:
         """Create mock request analysis handler."""
         handler = AsyncMock()
         # Return successful results with session IDs
-        handler.handle = AsyncMock(side_effect=lambda cmd: Mock(
-            success=True,
-            data={"session_id": str(uuid4())}
-        ))
+        handler.handle_many = AsyncMock(side_effect=lambda cmds, max_parallel=None: [
+            Mock(success=True, data={"session_id": str(uuid4())})
+            for _ in cmds
+        ])
         return handler
     
     @pytest.fixture
@@ -401,6 +471,7 @@ class TestBatchAnalysisCommandHandler:
     async def test_batch_analysis_success(
         self,
         handler,
+        mock_request_handler,
         mock_positions
     ):
         """Test successful batch analysis."""
@@ -419,6 +490,9 @@ class TestBatchAnalysisCommandHandler:
         assert result.data["total_positions"] == 3
         assert result.data["sessions_created"] == 3
         assert len(result.data["session_ids"]) == 3
+        # All positions are submitted in a single batch, honouring max_parallel
+        mock_request_handler.handle_many.assert_awaited_once()
+        assert mock_request_handler.handle_many.call_args.kwargs["max_parallel"] == 2
 
 
 class TestCompareStrategiesCommandHandler:
@@ -145,6 +145,19 @@ class TestPlayer:
         assert player.is_layout_complete()
         assert player.total_cards_placed == 13
 
+    def test_placed_mask(self):
+        """Test the deck mask of placed cards."""
+        player = Player("player1", "Alice")
+        assert player.placed_mask == 0
+
+        cards = Card.parse_cards("As Kh 2c 7d 9s")
+        player.receive_initial_cards(cards)
+        player.place_card(cards[0], CardPosition.TOP)
+        player.place_card(cards[1], CardPosition.BOTTOM)
+
+        # Cards still in hand are not part of the layout
+        assert player.placed_mask == Card.to_mask(cards[:2])
+
     def test_get_available_positions(self):
         """Test getting available positions for card placement."""
         player = Player("player1", "Alice")
@@ -225,6 +225,42 @@ class TestPosition:
         hash3 = position3.get_position_hash()
         assert hash1 != hash3
 
+    def test_zobrist_hash(self):
+        """Test 64-bit Zobrist hash for transposition lookups."""
+        position1 = self.create_test_position()
+        position2 = self.create_test_position()
+
+        zobrist = position1.get_zobrist_hash()
+        assert isinstance(zobrist, int)
+        assert 0 <= zobrist < 2**64
+        assert zobrist == position2.get_zobrist_hash()
+
+        # Changing the side to move changes the hash
+        position3 = self.create_test_position()
+        position3._current_player_id = "player2"
+        assert position3.get_zobrist_hash() != zobrist
+
+    def test_zobrist_hash_incremental_update(self):
+        """Test apply_move updates the Zobrist hash incrementally."""
+        hand = Hand.from_cards(Card.parse_cards("As Ks"))
+        position = Position(
+            game_id="game1",
+            players_hands={"p1": hand, "p2": Hand.empty()},
+            remaining_cards=Card.parse_cards("Qs Js"),
+            current_player_id="p1",
+            round_number=1,
+            rules=GameRules(),
+        )
+        position.get_zobrist_hash()
+
+        for card_str in ("As", "Qs"):
+            move = Move(card=Card.from_string(card_str), position=CardPosition.TOP)
+            new_position = position.apply_move(move)
+
+            incremental = new_position.get_zobrist_hash()
+            new_position._zobrist_hash = None
+            assert incremental == new_position.get_zobrist_hash()
+
     def test_position_equality(self):
         """Test position equality based on hash."""
         position1 = self.create_test_position()
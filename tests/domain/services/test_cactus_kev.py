@@ -0,0 +1,77 @@
+"""
+Tests for Cactus-Kev hand ranking tables
+"""
+
+import random
+
+from src.domain.services.cactus_kev import (
+    five_card_rank,
+    five_card_ranks,
+    top_row_key,
+    top_row_keys,
+    top_view,
+)
+from src.domain.services.hand_evaluator import HandEvaluator
+from src.domain.value_objects import Card
+
+
+class TestCactusKevTables:
+    """Test suite for table-based hand ranking."""
+
+    def test_five_card_rank_bounds(self):
+        """Test the strongest and weakest 5-card hands."""
+        assert five_card_rank(Card.parse_cards("As Ks Qs Js Ts")) == 1
+        assert five_card_rank(Card.parse_cards("5d 4d 3d 2d Ad")) == 10
+        assert five_card_rank(Card.parse_cards("7h 5d 4c 3s 2h")) == 7462
+
+    def test_five_card_rank_matches_evaluator_order(self):
+        """Test that ranks order hands the same way as HandRanking."""
+        evaluator = HandEvaluator()
+        deck = Card.create_deck()
+        random.seed(11)
+
+        for _ in range(500):
+            hand1 = random.sample(deck, 5)
+            hand2 = random.sample(deck, 5)
+            expected = evaluator.evaluate_hand(hand1).compare_to(
+                evaluator.evaluate_hand(hand2)
+            )
+            rank1, rank2 = five_card_rank(hand1), five_card_rank(hand2)
+            actual = (rank1 < rank2) - (rank1 > rank2)
+            assert actual == expected
+
+    def test_top_row_key_against_five_card_rows(self):
+        """Test top-row keys compare like HandRanking against 5-card rows."""
+        pair_top = top_row_key(Card.parse_cards("Kh Kd 9c"))
+        assert top_view(five_card_rank(Card.parse_cards("Ks Kc Qh 3d 2d"))) > pair_top
+        assert top_view(five_card_rank(Card.parse_cards("Qs Qc Ah 3d 2d"))) < pair_top
+
+        # Only the first three ranks count against the top row
+        high_top = top_row_key(Card.parse_cards("Kh Qd Jc"))
+        same_three = five_card_rank(Card.parse_cards("Ks Qh Jd 3c 2d"))
+        assert top_view(same_three) == high_top
+
+    def test_batch_ranks_match_single_ranks(self):
+        """Test that the array versions agree with the per-hand lookups."""
+        deck = Card.create_deck()
+        random.seed(13)
+        fives = [random.sample(deck, 5) for _ in range(300)]
+        threes = [random.sample(deck, 3) for _ in range(300)]
+
+        ranks = five_card_ranks([[card.code for card in hand] for hand in fives])
+        keys = top_row_keys([[card.code for card in hand] for hand in threes])
+
+        assert list(ranks) == [five_card_rank(hand) for hand in fives]
+        assert list(keys) == [top_row_key(hand) for hand in threes]
+
+    def test_batch_ranks_with_held_cards(self):
+        """Test that held cards folded in once rank like full rows."""
+        held = Card.parse_cards("Ah Kh Qh")
+        rest = [card for card in Card.create_deck() if card not in held]
+        pairs = [[a, b] for a, b in zip(rest[::2], rest[1::2])]
+
+        ranks = five_card_ranks([[card.code for card in pair] for pair in pairs], held)
+        keys = top_row_keys([[pair[0].code] for pair in pairs], held[:2])
+
+        assert list(ranks) == [five_card_rank(held + pair) for pair in pairs]
+        assert list(keys) == [top_row_key(held[:2] + pair[:1]) for pair in pairs]
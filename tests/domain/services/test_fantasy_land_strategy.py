@@ -0,0 +1,102 @@
+"""
+Tests for Fantasy Land Strategy Analyzer
+"""
+
+import random
+
+import pytest
+
+from src.domain.services import FantasyLandStrategyAnalyzer
+from src.domain.services.pineapple_evaluator import PineappleHandEvaluator
+from src.domain.value_objects import Card
+
+
+class TestFantasyLandStrategyAnalyzer:
+    """Test suite for Fantasy Land strategy analyzer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = FantasyLandStrategyAnalyzer()
+        self.evaluator = PineappleHandEvaluator()
+
+    def test_recommend_play_finds_best_split(self):
+        """Test that the search finds trips on top over a flush/full house."""
+        cards = Card.parse_cards("Kh Kd Kc As Qs Js Ts 9s Qh Jd Th 9c 8d 7h")
+
+        recommendation = self.analyzer.recommend_fantasy_land_play(cards)
+
+        assert sorted(recommendation["top"]) == sorted(Card.parse_cards("Kh Kd Kc"))
+        assert sorted(recommendation["bottom"]) == sorted(
+            Card.parse_cards("As Qs Js Ts 9s")
+        )
+        assert recommendation["discarded"] == Card.from_string("7h")
+        assert recommendation["can_stay"]
+        # KKK top (21) + straight middle (4) + flush bottom (4)
+        assert recommendation["expected_royalties"] == 29
+
+    def test_recommend_play_never_fouls(self):
+        """Test that recommended rows keep bottom >= middle >= top."""
+        random.seed(7)
+        deck = Card.create_deck()
+
+        for _ in range(5):
+            cards = random.sample(deck, 14)
+            recommendation = self.analyzer.recommend_fantasy_land_play(cards)
+
+            placed = (
+                recommendation["top"]
+                + recommendation["middle"]
+                + recommendation["bottom"]
+                + [recommendation["discarded"]]
+            )
+            assert sorted(placed) == sorted(cards)
+
+            top = self.evaluator.evaluate_hand(recommendation["top"])
+            middle = self.evaluator.evaluate_hand(recommendation["middle"])
+            bottom = self.evaluator.evaluate_hand(recommendation["bottom"])
+            assert top.hand_type <= middle.hand_type <= bottom.hand_type
+
+    def test_recommend_play_requires_14_cards(self):
+        """Test that other card counts return an empty recommendation."""
+        recommendation = self.analyzer.recommend_fantasy_land_play(
+            Card.parse_cards("As Ks Qs")
+        )
+
+        assert recommendation["top"] == []
+        assert recommendation["discarded"] is None
+
+    def test_street_priorities(self):
+        """Test row priorities follow the street and top row fill."""
+        empty = {"top": [], "middle": [], "bottom": []}
+        assert self.analyzer.calculate_street_priorities(empty, 0) == {
+            "top": 0.7,
+            "middle": 0.2,
+            "bottom": 0.1,
+        }
+        assert self.analyzer.calculate_street_priorities(empty, 2)["top"] == 0.4
+        assert self.analyzer.calculate_street_priorities(empty, 4)["bottom"] == 0.6
+
+        # A nearly full top row stops chasing Fantasy Land early
+        started = {"top": Card.parse_cards("Qh Qd")}
+        assert self.analyzer.calculate_street_priorities(started, 1)["top"] == 0.1
+
+    def test_top_row_batch_matches_single_analysis(self):
+        """Test that the batch analysis scores like per-scenario calls."""
+        random.seed(5)
+        deck = Card.create_deck()
+        scenarios = []
+        for _ in range(200):
+            size = random.randint(0, 3)
+            cards = random.sample(deck, size + 1)
+            scenarios.append((cards[:size], cards[size], random.randint(0, 4)))
+
+        batch = self.analyzer.analyze_top_row_placement_batch(
+            [Card.to_mask(top) for top, _, _ in scenarios],
+            [candidate.numeric_rank for _, candidate, _ in scenarios],
+            [streets for _, _, streets in scenarios],
+        )
+
+        for i, (top, candidate, streets) in enumerate(scenarios):
+            single = self.analyzer.analyze_top_row_placement(top, candidate, streets)
+            for name, value in single.items():
+                assert batch[name][i] == pytest.approx(value)
@@ -0,0 +1,61 @@
+"""
+Tests for the game tree builder's node storage.
+"""
+
+import numpy as np
+
+from src.domain.services.game_tree_builder import NodeStore
+from src.domain.value_objects import Card, Hand
+from src.domain.value_objects.game_tree_node import GameTreeNode
+
+
+def make_node(node_id: str, depth: int, dealt: str = "") -> GameTreeNode:
+    """Create a node with an empty hand and the given dealt cards."""
+    return GameTreeNode(
+        node_id=node_id,
+        depth=depth,
+        player_hand=Hand.empty(),
+        cards_placed=0,
+        dealt_cards=tuple(Card.parse_cards(dealt)) if dealt else None,
+    )
+
+
+class TestNodeStore:
+    """Test the NumPy columns mirrored by NodeStore."""
+
+    def test_grow_keeps_rows(self):
+        """Test that growing copies old rows and leaves new rows zeroed."""
+        store = NodeStore(capacity=2)
+        store["a"] = make_node("a", 0, "As Kh Qc")
+        store["b"] = make_node("b", 1, "2s 3h 4d")
+        store["c"] = make_node("c", 2)
+
+        assert len(store.flags) == 4
+        assert list(store.depth[:3]) == [0, 1, 2]
+        assert list(store.dealt_cards[store.row("a")]) == [
+            card.code for card in Card.parse_cards("As Kh Qc")
+        ]
+        assert not store.dealt_cards[store.row("c")].any()
+        assert not store.flags[3:].any()
+
+    def test_update_clears_dealt_cards(self):
+        """Test that storing a node again without dealt cards clears its row."""
+        store = NodeStore(capacity=2)
+        store["a"] = make_node("a", 0, "As Kh Qc")
+        store["a"] = make_node("a", 0)
+
+        assert not store.dealt_cards[store.row("a")].any()
+
+    def test_dump_after_delete(self, tmp_path):
+        """Test that dumped ids line up with their rows after a removal."""
+        store = NodeStore(capacity=2)
+        for depth, node_id in enumerate("abc"):
+            store[node_id] = make_node(node_id, depth)
+        del store["b"]
+
+        path = tmp_path / "nodes.npz"
+        store.dump(str(path))
+
+        with np.load(path) as dumped:
+            assert list(dumped["node_id"]) == ["a", "c"]
+            assert list(dumped["depth"]) == [0, 2]
@@ -5,6 +5,7 @@ Unit tests for HandEvaluator domain service.
 import pytest
 
 from src.domain.services.hand_evaluator import HandEvaluator
+from src.domain.services.pineapple_evaluator import PineappleHandEvaluator
 from src.domain.value_objects.card import Card
 from src.domain.value_objects.hand_ranking import HandType
 
@@ -21,6 +22,14 @@ class TestHandEvaluator:
         evaluator = HandEvaluator()
         assert evaluator is not None
 
+    def test_shared_instance(self):
+        """Test that each evaluator class has its own shared instance."""
+        shared = HandEvaluator.instance()
+
+        assert shared is HandEvaluator.instance()
+        assert type(shared) is HandEvaluator
+        assert type(PineappleHandEvaluator.instance()) is PineappleHandEvaluator
+
     def test_evaluate_hand_invalid_size(self):
         """Test hand evaluation with invalid card count."""
         # Too few cards
@@ -657,6 +666,56 @@ class TestPerformanceOptimization:
         self.evaluator.clear_cache()
         assert len(self.evaluator._evaluation_cache) == 0
 
+    def test_cache_reuses_ranking(self):
+        """Test that repeated hands share one cache entry in any order."""
+        cards = Card.parse_cards("As Kh Qc Jd 9s")
+
+        first = self.evaluator.evaluate_hand(cards)
+        assert self.evaluator.evaluate_hand(list(cards)) is first
+
+        reordered = self.evaluator.evaluate_hand(cards[::-1])
+        assert reordered.cards == cards[::-1]
+        assert reordered.strength_value == first.strength_value
+        assert len(self.evaluator._evaluation_cache) == 1
+
+    def test_evaluate_hand_batch_matches_evaluate_hand(self):
+        """Test batch 5-card evaluation against single evaluations."""
+        hands = [
+            Card.parse_cards(text)
+            for text in [
+                "As Ks Qs Js Ts",
+                "5d 4d 3d 2d Ad",
+                "9h 9c 9d 9s 2h",
+                "Kh Kd Kc 4s 4h",
+                "Ah 2c 3d 4s 5h",
+                "Qh Qd 7c 7s 2h",
+                "Jh Jd 8c 5s 2h",
+                "Ah Jd 8c 5s 2h",
+            ]
+        ]
+
+        for result, hand in zip(self.evaluator.evaluate_hand_batch(hands), hands):
+            expected = self.evaluator.evaluate_hand(hand)
+            assert result.hand_type == expected.hand_type
+            assert result.strength_value == expected.strength_value
+            assert result.kickers == expected.kickers
+            assert result.royalty_bonus == expected.royalty_bonus
+
+        with pytest.raises(ValueError, match="5-card hands"):
+            self.evaluator.evaluate_hand_batch([Card.parse_cards("As Ks Qs")])
+
+    def test_evaluate_top3_matches_evaluate_hand(self):
+        """Test the 3-card fast path against the general evaluator."""
+        for text in ["Ah Kd Qc", "7s 7h 2c", "Ks 3d 3h", "Qh Qd Qs", "6c 6d Ah"]:
+            cards = Card.parse_cards(text)
+            expected = self.evaluator.evaluate_hand(cards)
+            result = self.evaluator.evaluate_top3(cards)
+
+            assert result.hand_type == expected.hand_type
+            assert result.strength_value == expected.strength_value
+            assert result.kickers == expected.kickers
+            assert result.royalty_bonus == expected.royalty_bonus
+
 
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
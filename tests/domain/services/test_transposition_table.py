@@ -0,0 +1,74 @@
+"""
+Tests for transposition keys and lookups.
+"""
+
+from src.domain.services.transposition_table import PositionKey, TranspositionTable
+from src.domain.value_objects import Card, Hand
+
+
+def make_hand(top: str, middle: str, bottom: str) -> Hand:
+    """Create a hand from row strings."""
+    return Hand.from_layout(
+        top=Card.parse_cards(top) if top else [],
+        middle=Card.parse_cards(middle) if middle else [],
+        bottom=Card.parse_cards(bottom) if bottom else [],
+    )
+
+
+class TestPositionKey:
+    """Test which positions share a transposition key."""
+
+    def test_placement_order_ignored(self):
+        """Test that the same rows in a different order give the same key."""
+        deck = Card.parse_cards("2c 3c 4c")
+        key = PositionKey.from_hand(make_hand("Ah", "Kh Qh", "Js Ts"), 5, deck)
+        other = PositionKey.from_hand(
+            make_hand("Ah", "Qh Kh", "Ts Js"), 5, list(reversed(deck))
+        )
+
+        assert key == other
+        assert hash(key) == hash(other)
+
+    def test_rows_distinguished(self):
+        """Test that the same cards in different rows give different keys."""
+        key = PositionKey.from_hand(make_hand("Ah", "Kh", ""), 2)
+        swapped = PositionKey.from_hand(make_hand("Kh", "Ah", ""), 2)
+
+        assert key != swapped
+
+    def test_remaining_deck_distinguished(self):
+        """Test that identical rows with different cards to come differ."""
+        hand = make_hand("Ah", "Kh Qh", "Js Ts")
+
+        key = PositionKey.from_hand(hand, 5, Card.parse_cards("2c 3c 4c"))
+        other = PositionKey.from_hand(hand, 5, Card.parse_cards("2c 3c 5c"))
+
+        assert key != other
+        assert key.deck_mask == Card.to_mask(Card.parse_cards("2c 3c 4c"))
+
+    def test_masks_match_rows(self):
+        """Test that each row is keyed on its 52-bit card mask."""
+        hand = make_hand("Ah", "Kh Qh", "Js Ts")
+
+        key = PositionKey.from_hand(hand, 5)
+
+        assert key.top_mask == Card.to_mask(hand.top_row)
+        assert key.middle_mask == Card.to_mask(hand.middle_row)
+        assert key.bottom_mask == Card.to_mask(hand.bottom_row)
+        assert key.deck_mask == 0
+
+
+class TestTranspositionTable:
+    """Test lookups through reordered positions."""
+
+    def test_lookup_reordered_position(self):
+        """Test that a transposed position finds the stored node."""
+        table = TranspositionTable()
+        table.store(PositionKey.from_hand(make_hand("Ah", "Kh Qh", "Js"), 4), "n1")
+
+        found = table.lookup(PositionKey.from_hand(make_hand("Ah", "Qh Kh", "Js"), 4))
+        missing = table.lookup(PositionKey.from_hand(make_hand("Ah", "Qh Kh", "Ts"), 4))
+
+        assert found == "n1"
+        assert missing is None
+        assert (table.hit_count, table.miss_count) == (1, 1)
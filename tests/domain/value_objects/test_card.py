@@ -2,6 +2,8 @@
 Unit tests for Card value object.
 """
 
+import pickle
+
 import pytest
 
 from src.domain.value_objects.card import Card, Rank, Suit
@@ -273,6 +275,71 @@ class TestCard:
         # Check no duplicates
         assert len(set(deck)) == 52
 
+    def test_shared_instances(self):
+        """Test that card lookups return the shared flyweight instances."""
+        ace = Card.of(Suit.SPADES, Rank.ACE)
+        assert ace == Card(suit=Suit.SPADES, rank=Rank.ACE)
+        assert Card.of(Suit.SPADES, Rank.ACE) is ace
+        assert Card.from_string("As") is ace
+        assert ace in Card.create_deck()
+        assert any(card is ace for card in Card.create_deck())
+
+        # Each call returns a fresh list over the same cards
+        assert Card.create_deck() is not Card.create_deck()
+
+    def test_constructor_interns(self):
+        """Test that constructing, parsing and unpickling reuse instances."""
+        ace = Card(suit=Suit.SPADES, rank=Rank.ACE)
+        assert Card(Suit.SPADES, Rank.ACE) is ace
+        assert Card.from_string("aS") is ace
+        assert Card.from_string("tD") is Card.of(Suit.DIAMONDS, Rank.TEN)
+        assert pickle.loads(pickle.dumps(ace)) is ace
+        assert ace != Card(suit=Suit.HEARTS, rank=Rank.ACE)
+
+    def test_cactus_kev_encoding(self):
+        """Test 32-bit Cactus-Kev card encoding."""
+        # Kd and 5s from the reference layout
+        king_diamonds = Card.from_string("Kd")
+        assert king_diamonds.code == 0x08004B25
+        assert Card.from_string("5s").code == 0x00081307
+
+        assert Card.from_code(king_diamonds.code) is king_diamonds
+        assert len({card.code for card in Card.create_deck()}) == 52
+        assert hash(king_diamonds) == king_diamonds.code
+
+    def test_deck_masks(self):
+        """Test converting between cards and 52-bit deck masks."""
+        deck = Card.create_deck()
+        assert Card.to_mask(deck) == (1 << 52) - 1
+        assert Card.from_mask(Card.to_mask(deck)) == deck
+
+        used = Card.parse_cards("As Kh 2c")
+        remaining = Card.from_mask(Card.to_mask(deck) & ~Card.to_mask(used))
+        assert len(remaining) == 49
+        assert not set(used) & set(remaining)
+        assert set(Card.get_missing_cards(remaining)) == set(used)
+
+        assert Card.validate_no_duplicates(used)
+        assert not Card.validate_no_duplicates(used + [Card.from_string("As")])
+
+    def test_card_bytes(self):
+        """Test packing cards into one byte per card."""
+        cards = Card.parse_cards("Kh 2s Ac")
+        packed = Card.to_bytes(cards)
+
+        assert len(packed) == 3
+        assert packed[1] == 0
+        assert Card.from_bytes(packed) == cards
+        assert Card.from_bytes(Card.to_bytes(Card.create_deck())) == Card.create_deck()
+
+    def test_card_index(self):
+        """Test the 0-51 deck index and the bit derived from it."""
+        deck = Card.create_deck()
+
+        assert [card.index for card in deck] == list(range(52))
+        assert all(card.bit == 1 << card.index for card in deck)
+        assert Card.from_string("Kh").index == 13 + 11
+
     def test_parse_cards(self):
         """Test parsing multiple cards from string."""
         cards = Card.parse_cards("As Kh 2c Td")
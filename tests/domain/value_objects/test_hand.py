@@ -336,6 +336,74 @@ class TestHandCardPlacement:
         assert card3 in new_hand.bottom_row
         assert len(new_hand.hand_cards) == 0
 
+    def test_masks_round_trip(self):
+        """Test that row masks rebuild the same layout."""
+        top = Card.parse_cards("2s 3h")
+        middle = Card.parse_cards("As Kh Qc")
+        hand = Hand.from_layout(top, middle, [], Card.parse_cards("Jd"))
+
+        assert hand.placed_mask == Card.to_mask(top + middle)
+
+        rebuilt = Hand.from_masks(
+            Card.to_mask(top), Card.to_mask(middle), 0, Card.from_string("Jd").bit
+        )
+        assert rebuilt.normalize_for_comparison() == hand.normalize_for_comparison()
+
+    def test_row_masks(self):
+        """Test that each row's mask follows placements."""
+        cards = Card.parse_cards("As Kh Qc")
+        hand = Hand.from_layout([cards[0]], [], [], cards[1:])
+
+        placed = hand.place_card(cards[1], CardPosition.BOTTOM)
+
+        assert placed.top_mask == cards[0].bit
+        assert placed.middle_mask == 0
+        assert placed.bottom_mask == cards[1].bit
+        assert placed.hand_mask == cards[2].bit
+        assert placed.all_mask == Card.to_mask(cards)
+        assert placed == Hand.from_layout([cards[0]], [], [cards[1]], [cards[2]])
+
+    def test_with_added_matches_place_card(self):
+        """Test that adding cards in one step gives the same hand."""
+        cards = Card.parse_cards("As Kh Qc Jd")
+        hand = Hand.from_layout([cards[0]], [], [], cards[1:])
+
+        added = hand.with_added(top=[cards[1]], bottom=[cards[2]])
+        expected = hand.place_card(cards[1], CardPosition.TOP).place_card(
+            cards[2], CardPosition.BOTTOM
+        )
+
+        assert added == expected
+        assert added.hand_mask == cards[3].bit
+        assert hand.with_added(middle=[cards[3]], hand_cards=[]).hand_cards == []
+
+        with pytest.raises(HandValidationError):
+            hand.with_added(top=cards[1:])
+
+    def test_builder_matches_place_card(self):
+        """Test that chained builder placements give the same hand."""
+        cards = Card.parse_cards("As Kh Qc Jd")
+
+        built = (
+            Hand.builder(cards)
+            .place(cards[0], CardPosition.TOP)
+            .place(cards[1], CardPosition.TOP)
+            .place(cards[2], CardPosition.BOTTOM)
+            .build()
+        )
+        expected = (
+            Hand.from_cards(cards)
+            .place_card(cards[0], CardPosition.TOP)
+            .place_card(cards[1], CardPosition.TOP)
+            .place_card(cards[2], CardPosition.BOTTOM)
+        )
+
+        assert built == expected
+
+        builder = Hand.builder(cards[:1])
+        with pytest.raises(InvalidCardPlacementError, match="not available"):
+            builder.place(cards[1], CardPosition.TOP)
+
     def test_remove_card_success(self):
         """Test successful card removal."""
         card_to_remove = Card.from_string("As")
@@ -0,0 +1,100 @@
+"""
+Unit tests for Joker card support.
+"""
+
+from src.domain.services.pineapple_evaluator import PineappleHandEvaluator
+from src.domain.value_objects.card import Card
+from src.domain.value_objects.hand_ranking import HandType
+from src.domain.value_objects.joker_card import (
+    JokerCard,
+    JokerHandEvaluator,
+    identify_jokers_in_hand,
+)
+
+
+class TestJokerHandEvaluator:
+    """Test best-substitution search for jokers."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.evaluator = JokerHandEvaluator(PineappleHandEvaluator())
+
+    def test_five_card_substitution(self):
+        """Test that a joker completes the strongest 5-card hand."""
+        result = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("As Ks Qs Js"), [JokerCard()]
+        )
+
+        assert result["substitutions"] == {"JOKER_0": "Ts"}
+        assert result["ranking"].hand_type == HandType.ROYAL_FLUSH
+
+    def test_top_row_substitution(self):
+        """Test that two jokers on the top row make trips without duplicates."""
+        cards = Card.parse_cards("Qh")
+        result = self.evaluator.evaluate_with_jokers(cards, [JokerCard(), JokerCard()])
+
+        assert result["ranking"].hand_type == HandType.THREE_OF_A_KIND
+        assert len(set(result["best_hand"])) == 3
+        assert all(card.rank == cards[0].rank for card in result["best_hand"])
+
+    def test_rank_only_substitution(self):
+        """Test that without a reachable flush the lowest free suits are used."""
+        result = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("Kh 7c 2d"), [JokerCard(), JokerCard()]
+        )
+
+        assert result["substitutions"] == {"JOKER_0": "Ks", "JOKER_1": "Kd"}
+        assert result["ranking"].hand_type == HandType.THREE_OF_A_KIND
+
+    def test_suited_substitution(self):
+        """Test that suited cards with three jokers find the straight flush."""
+        result = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("9h 8h"), [JokerCard(), JokerCard(), JokerCard()]
+        )
+
+        assert result["ranking"].hand_type == HandType.STRAIGHT_FLUSH
+        assert result["substitutions"] == {
+            "JOKER_0": "Th",
+            "JOKER_1": "Jh",
+            "JOKER_2": "Qh",
+        }
+
+    def test_four_card_substitution(self):
+        """Test that other hand sizes fall back to the base evaluator."""
+        result = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("Kh 7c 5d"), [JokerCard()]
+        )
+
+        assert result["ranking"].hand_type == HandType.PAIR
+        assert result["best_hand"][-1].rank == Card.from_string("Kh").rank
+
+    def test_substitution_cache(self):
+        """Test that the same held cards in any order reuse the search."""
+        first = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("9c 8c 7c 6d"), [JokerCard()]
+        )
+        second = self.evaluator.evaluate_with_jokers(
+            Card.parse_cards("6d 7c 8c 9c"), [JokerCard()]
+        )
+
+        assert len(self.evaluator._substitution_cache) == 1
+        assert first["substitutions"] == second["substitutions"]
+        assert second["best_hand"][:4] == Card.parse_cards("6d 7c 8c 9c")
+
+        self.evaluator.clear_cache()
+        assert not self.evaluator._substitution_cache
+
+
+class TestIdentifyJokers:
+    """Test separating jokers from regular cards."""
+
+    def test_identify_jokers_in_hand(self):
+        """Test that a mixed hand splits into cards and jokers."""
+        cards = Card.parse_cards("Ah Kd Qc")
+        mixed = [cards[0], JokerCard(), cards[1], JokerCard(), cards[2], "??"]
+
+        regular, jokers = identify_jokers_in_hand(mixed)
+
+        assert regular == cards
+        assert len(jokers) == 2
+        assert all(joker.is_joker for joker in jokers)
@@ -0,0 +1 @@
+"""Infrastructure algorithm tests."""
@@ -0,0 +1,147 @@
+"""
+Tests for the token bucket limiter and burst checks in rate limiting.
+"""
+
+import pytest
+
+from src.infrastructure.algorithms import rate_limiting
+from src.infrastructure.algorithms.rate_limiting import (
+    RateLimitAlgorithm,
+    RateLimitConfig,
+    RateLimitManager,
+    TokenBucketLimiter,
+)
+
+SECOND_NS = 1_000_000_000
+
+
+class FakeClock:
+    """Monotonic nanosecond clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now_ns = 10 * SECOND_NS
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * SECOND_NS)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the limiters' monotonic clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiting.time, "monotonic_ns", fake)
+    return fake
+
+
+@pytest.fixture
+def bucket(clock):
+    """A bucket of 5 tokens refilling one token per second."""
+    return TokenBucketLimiter(requests_per_minute=60, burst_size=5)
+
+
+class TestTokenBucketLimiter:
+    """Test token accounting of the token bucket limiter."""
+
+    def test_refills_over_elapsed_time(self, bucket, clock):
+        """Test that tokens come back at requests_per_minute / 60 per second."""
+        assert bucket.check_burst(5)[0] == 5
+        assert bucket.tokens == 0
+
+        clock.advance(2.5)
+        result = bucket.check_limit()
+
+        assert result.allowed
+        assert bucket.tokens == 1.5
+        assert result.remaining_tokens == 1
+
+    def test_refill_clamps_at_capacity(self, bucket, clock):
+        """Test that an idle bucket never holds more than burst_size tokens."""
+        bucket.check_limit()
+        clock.advance(3600)
+
+        allowed, result = bucket.check_burst(10)
+
+        assert allowed == 5
+        assert not result.allowed
+
+    def test_retry_after(self, bucket, clock):
+        """Test that a blocked request is told when enough tokens will exist."""
+        bucket.check_burst(5)
+
+        result = bucket.check_limit()
+        assert not result.allowed
+        assert result.retry_after == pytest.approx(1.0)
+
+        clock.advance(0.25)
+        assert bucket.check_limit().retry_after == pytest.approx(0.75)
+        assert bucket.check_limit(3).retry_after == pytest.approx(2.75)
+
+    def test_rejection_leaves_tokens(self, bucket, clock):
+        """Test that rejected requests and bursts consume nothing."""
+        bucket.check_burst(3)
+
+        assert not bucket.check_limit(3).allowed
+        assert bucket.tokens == 2
+
+        assert bucket.check_burst(2)[0] == 2
+        allowed, result = bucket.check_burst(4)
+        assert allowed == 0
+        assert not result.allowed
+        assert bucket.tokens == 0
+
+    def test_burst_allows_available_tokens(self, bucket):
+        """Test that a burst allows its first requests up to the tokens held."""
+        allowed, result = bucket.check_burst(7)
+
+        assert allowed == 5
+        assert not result.allowed
+        assert result.retry_after == pytest.approx(1.0)
+        assert bucket.tokens == 0
+
+
+class TestRateLimitManagerCheckMany:
+    """Test that check_many matches checking requests one at a time."""
+
+    def make_manager(self) -> RateLimitManager:
+        manager = RateLimitManager()
+        manager.setup_user_limits("user", "anonymous")
+        manager.setup_endpoint_limits(
+            "/analyze",
+            RateLimitConfig(
+                requests_per_minute=30,
+                burst_size=3,
+                algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+            ),
+        )
+        return manager
+
+    @staticmethod
+    def tokens(manager: RateLimitManager) -> dict:
+        return {
+            tier: {key: info["limiter"].tokens for key, info in limiters.items()}
+            for tier, limiters in manager.hierarchical_limiter.limiters.items()
+        }
+
+    @pytest.mark.parametrize("n", [1, 3, 4, 8])
+    def test_matches_sequential_checks(self, clock, n):
+        """Test check_many(n) against n calls of check_rate_limit."""
+        sequential, batched = self.make_manager(), self.make_manager()
+
+        results = [sequential.check_rate_limit("user", "/analyze") for _ in range(n)]
+        allowed, result = batched.check_many("user", "/analyze", n)
+
+        blocked = [r for r in results if not r.allowed]
+        expected = blocked[0] if blocked else results[-1]
+        assert allowed == sum(r.allowed for r in results)
+        assert all(r.allowed for r in results[:allowed])
+        assert result.allowed == expected.allowed
+        assert result.algorithm_used == expected.algorithm_used
+        assert result.remaining_tokens == expected.remaining_tokens
+        assert result.retry_after == expected.retry_after
+        assert self.tokens(batched) == self.tokens(sequential)
+
+        for name in ("total_requests", "blocked_requests", "algorithm_usage"):
+            assert batched.metrics[name] == sequential.metrics[name]
@@ -0,0 +1 @@
+"""Infrastructure database tests."""
@@ -0,0 +1,139 @@
+"""
+Tests for how bulk COPY loads serialize rows.
+"""
+
+import hashlib
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from src.infrastructure.database.bulk import copy_positions, copy_rows
+from src.infrastructure.database.models import PerformanceMetric, SystemMetric
+
+
+def make_session():
+    """Session mock exposing the asyncpg connection's copy_records_to_table."""
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock()
+    raw_connection = MagicMock(driver_connection=driver_connection)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.connection = AsyncMock(return_value=connection)
+    return session, driver_connection.copy_records_to_table
+
+
+def copied(copy_records_to_table):
+    """The table, records and columns passed to the COPY."""
+    (table_name,), kwargs = copy_records_to_table.call_args
+    return table_name, kwargs["records"], kwargs["columns"]
+
+
+class TestCopyRows:
+    """Test the records and columns handed to binary COPY."""
+
+    @pytest.mark.asyncio
+    async def test_columns_follow_first_row(self):
+        """Test that records are tuples in the first row's key order."""
+        session, copy = make_session()
+        session_id = uuid.uuid4()
+        rows = [
+            {
+                "session_id": session_id,
+                "scenario_id": f"s{i}",
+                "optimal_answer": "fold",
+                "is_correct": i % 2 == 0,
+                "decision_time_seconds": i,
+            }
+            for i in range(3)
+        ]
+
+        count = await copy_rows(session, PerformanceMetric, rows)
+
+        table_name, records, columns = copied(copy)
+        assert count == 3
+        assert table_name == "performance_metrics"
+        assert columns == list(rows[0])
+        assert records[1] == (session_id, "s1", "fold", False, 1)
+
+    @pytest.mark.asyncio
+    async def test_nulls_stay_null(self):
+        """Test that None is copied as SQL NULL, including in JSONB columns."""
+        session, copy = make_session()
+        rows = [
+            {"metric_name": "latency", "metric_value": 1.5, "tags": None},
+            {"metric_name": "errors", "metric_value": 0.0, "tags": {"host": None}},
+        ]
+
+        await copy_rows(session, SystemMetric, rows)
+
+        _, records, _ = copied(copy)
+        assert records[0] == ("latency", 1.5, None)
+        assert records[1] == ("errors", 0.0, '{"host":null}')
+
+    @pytest.mark.asyncio
+    async def test_special_characters(self):
+        """Test that text is passed through and JSON is serialized losslessly."""
+        session, copy = make_session()
+        name = "tab\tnewline\nback\\slash 'quote' \"dq\" ♠ 牌"
+        tags = {"note": name, "nested": [1, "\\N", {"k": "\r\n"}]}
+        rows = [{"metric_name": name, "metric_value": 2.0, "tags": tags}]
+
+        await copy_rows(session, SystemMetric, rows)
+
+        _, records, _ = copied(copy)
+        copied_name, _, copied_tags = records[0]
+        assert copied_name == name
+        assert isinstance(copied_tags, str)
+        assert orjson.loads(copied_tags) == tags
+
+    @pytest.mark.asyncio
+    async def test_synchronous_commit(self):
+        """Test that synchronous_commit is only relaxed when asked to."""
+        session, _ = make_session()
+        rows = [{"metric_name": "m", "metric_value": 1.0}]
+
+        await copy_rows(session, SystemMetric, rows, synchronous_commit=True)
+        session.execute.assert_not_awaited()
+
+        await copy_rows(session, SystemMetric, rows)
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_rows(self):
+        """Test that no rows means no COPY."""
+        session, copy = make_session()
+
+        assert await copy_rows(session, SystemMetric, []) == 0
+        copy.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_copy_positions(self):
+        """Test that position hashes stay raw bytes and hands become JSON."""
+        session, copy = make_session()
+        digest = hashlib.blake2b(b"position", digest_size=16).digest()
+        hands = [{"top": ["As", "Kd"], "middle": [], "bottom": []}]
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "game_id": uuid.uuid4(),
+                "round_number": 1,
+                "current_player": 0,
+                "players_hands": hands,
+                "remaining_cards": [0, 51],
+                "position_hash": digest,
+            }
+        ]
+
+        await copy_positions(session, rows)
+
+        table_name, records, columns = copied(copy)
+        record = dict(zip(columns, records[0]))
+        assert table_name == "positions"
+        assert record["position_hash"] == digest
+        assert orjson.loads(record["players_hands"]) == hands
+        assert record["remaining_cards"] == "[0,51]"
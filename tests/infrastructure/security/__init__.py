@@ -0,0 +1 @@
+"""Infrastructure security tests."""
@@ -0,0 +1,123 @@
+"""
+Tests for the JWT verification cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("jwt")
+pytest.importorskip("cryptography")
+
+from src.infrastructure.security import auth_algorithms  # noqa: E402
+from src.infrastructure.security.auth_algorithms import (  # noqa: E402
+    AuthMethod,
+    AuthResult,
+    JWTVerificationCache,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the cache's monotonic clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(auth_algorithms.time, "monotonic", fake)
+    return fake
+
+
+def verified(user_id: str, expires_in: float = 3600.0) -> AuthResult:
+    """A successful JWT validation expiring the given seconds from now."""
+    return AuthResult(
+        success=True,
+        user_id=user_id,
+        features=["analysis"],
+        auth_method=AuthMethod.JWT,
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+    )
+
+
+class TestJWTVerificationCache:
+    """Test expiry, eviction and what the cache accepts."""
+
+    def test_hit_returns_copy(self, clock):
+        """Test that a cached result is returned without sharing its lists."""
+        cache = JWTVerificationCache()
+        cache.put("token", verified("alice"))
+
+        result = cache.get("token")
+        result.features.append("admin")
+
+        assert result.user_id == "alice"
+        assert cache.get("token").features == ["analysis"]
+        assert cache.get("other") is None
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test that entries are dropped once ttl_seconds have passed."""
+        cache = JWTVerificationCache(ttl_seconds=10.0)
+        cache.put("token", verified("alice"))
+
+        clock.advance(9.5)
+        assert cache.get("token") is not None
+        clock.advance(1.0)
+        assert cache.get("token") is None
+
+    def test_ttl_clamped_to_token_expiry(self, clock):
+        """Test that an entry never outlives the token's exp claim."""
+        cache = JWTVerificationCache(ttl_seconds=10.0)
+        cache.put("token", verified("alice", expires_in=3.0))
+
+        clock.advance(2.5)
+        assert cache.get("token") is not None
+        clock.advance(1.0)
+        assert cache.get("token") is None
+
+    def test_expired_token_not_cached(self, clock):
+        """Test that a token already past its exp claim is not cached."""
+        cache = JWTVerificationCache()
+        cache.put("token", verified("alice", expires_in=-1.0))
+
+        assert cache.get("token") is None
+
+    def test_failed_verification_not_cached(self, clock):
+        """Test that failed validations are never cached."""
+        cache = JWTVerificationCache()
+        cache.put("token", AuthResult(success=False, error_code="TOKEN_EXPIRED"))
+
+        assert cache.get("token") is None
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test that a full cache evicts the entry read least recently."""
+        cache = JWTVerificationCache(maxsize=2)
+        cache.put("a", verified("alice"))
+        cache.put("b", verified("bob"))
+        cache.get("a")
+
+        cache.put("c", verified("carol"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").user_id == "alice"
+        assert cache.get("c").user_id == "carol"
+
+    def test_recaching_token_keeps_others(self, clock):
+        """Test that putting a cached token again in a full cache evicts nothing."""
+        cache = JWTVerificationCache(maxsize=2)
+        cache.put("a", verified("alice"))
+        cache.put("b", verified("bob"))
+
+        cache.put("b", verified("bob-renewed"))
+
+        assert cache.get("a").user_id == "alice"
+        assert cache.get("b").user_id == "bob-renewed"